@@ -1,3 +1,8 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete
+)
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.app_manager.apps import MayanAppConfig
@@ -11,6 +16,14 @@ from mayan.apps.navigation.source_columns import SourceColumn
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_acl_effective_permissions_update,
+    handler_acl_permissions_effective_permissions_update,
+    handler_group_effective_permissions_post_delete,
+    handler_group_effective_permissions_pre_delete,
+    handler_role_groups_effective_permissions_update,
+    handler_user_groups_effective_permissions_update
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -32,6 +45,9 @@ class ACLsApp(MayanAppConfig):
         GlobalAccessControlListProxy = self.get_model(
             model_name='GlobalAccessControlListProxy'
         )
+        Group = apps.get_model(app_label='auth', model_name='Group')
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        User = get_user_model()
 
         EventModelRegistry.register(model=AccessControlList)
 
@@ -88,3 +104,41 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        # Effective permissions
+
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_acl_permissions_effective_permissions_update',
+            receiver=handler_acl_permissions_effective_permissions_update,
+            sender=AccessControlList.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_role_groups_effective_permissions_update',
+            receiver=handler_role_groups_effective_permissions_update,
+            sender=Role.groups.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_user_groups_effective_permissions_update',
+            receiver=handler_user_groups_effective_permissions_update,
+            sender=User.groups.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_acl_effective_permissions_update_delete',
+            receiver=handler_acl_effective_permissions_update,
+            sender=AccessControlList
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_group_effective_permissions_post_delete',
+            receiver=handler_group_effective_permissions_post_delete,
+            sender=Group
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_acl_effective_permissions_update_save',
+            receiver=handler_acl_effective_permissions_update,
+            sender=AccessControlList
+        )
+        pre_delete.connect(
+            dispatch_uid='acls_handler_group_effective_permissions_pre_delete',
+            receiver=handler_group_effective_permissions_pre_delete,
+            sender=Group
+        )
@@ -2,11 +2,12 @@ import itertools
 import logging
 
 from django.apps import apps
-from django.core.exceptions import ImproperlyConfigured
-from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.utils.translation import gettext, gettext_lazy as _
 
 from mayan.apps.common.menus import menu_list_facet
 from mayan.apps.common.utils import get_related_field
+from mayan.apps.permissions.classes import Permission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
 from .links import link_acl_list
@@ -14,6 +15,109 @@ from .links import link_acl_list
 logger = logging.getLogger(name=__name__)
 
 
+class AccessCheckCache:
+    """
+    Memoize the access checks of the user of a request. Objects can be
+    added in advance to resolve the access of all the objects of the
+    same model for a permission with a single query.
+    """
+    @classmethod
+    def get_for_request(cls, request):
+        try:
+            return request._access_check_cache
+        except AttributeError:
+            instance = cls(user=request.user)
+            request._access_check_cache = instance
+            return instance
+
+    def __init__(self, user):
+        self.object_pending_dict = {}
+        self.object_resolved_dict = {}
+        self.user = user
+        self.user_permission_dict = {}
+
+    def add(self, obj, permission):
+        """
+        Queue an object to be included the next time the access of an
+        object of the same model is checked for the permission.
+        """
+        meta = getattr(obj, '_meta', None)
+
+        if meta and obj.pk is not None:
+            key = (permission.pk, meta.model)
+
+            if obj.pk not in self.object_resolved_dict.get(key, {}):
+                self.object_pending_dict.setdefault(key, set()).add(obj.pk)
+
+    def check_access(self, obj, permission):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        meta = getattr(obj, '_meta', None)
+
+        if not meta:
+            return AccessControlList.objects.check_access(
+                obj=obj, permission=permission, user=self.user
+            )
+
+        key = (permission.pk, meta.model)
+        object_resolved_dict = self.object_resolved_dict.setdefault(key, {})
+
+        if obj.pk not in object_resolved_dict:
+            pk_set = self.object_pending_dict.pop(key, set())
+            pk_set.add(obj.pk)
+
+            manager = ModelPermission.get_manager(model=meta.model)
+            queryset = manager.filter(pk__in=pk_set)
+
+            try:
+                self.check_user_permission(permission=permission)
+            except PermissionDenied:
+                queryset = AccessControlList.objects.restrict_queryset(
+                    permission=permission, queryset=queryset, user=self.user
+                )
+
+            pk_allowed_set = set(
+                queryset.values_list('pk', flat=True)
+            )
+
+            for pk in pk_set:
+                object_resolved_dict[pk] = pk in pk_allowed_set
+
+        if object_resolved_dict[obj.pk]:
+            return True
+        else:
+            raise PermissionDenied(
+                gettext(message='Insufficient access for: %s') % str(obj)
+            )
+
+    def check_user_permission(self, permission):
+        try:
+            result = self.user_permission_dict[permission.pk]
+        except KeyError:
+            if not self.user.is_authenticated:
+                result = False
+            else:
+                try:
+                    Permission.check_user_permission(
+                        permission=permission, user=self.user
+                    )
+                except PermissionDenied:
+                    result = False
+                else:
+                    result = True
+
+            self.user_permission_dict[permission.pk] = result
+
+        if result:
+            return True
+        else:
+            raise PermissionDenied(
+                gettext(message='Insufficient permission.')
+            )
+
+
 class ModelPermission:
     _field_query_functions = {}
     _inheritances = {}
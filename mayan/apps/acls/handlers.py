@@ -0,0 +1,108 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+
+from .settings import setting_effective_permissions_enable
+
+
+def _do_effective_permissions_update(**kwargs):
+    EffectivePermission = apps.get_model(
+        app_label='acls', model_name='EffectivePermission'
+    )
+
+    EffectivePermission.objects.do_update(**kwargs)
+
+
+def _get_group_user_id_list(group_id_list):
+    User = get_user_model()
+
+    return list(
+        User.objects.filter(groups__in=group_id_list).values_list(
+            'pk', flat=True
+        ).distinct()
+    )
+
+
+def handler_acl_effective_permissions_update(sender, instance, **kwargs):
+    if setting_effective_permissions_enable.value:
+        _do_effective_permissions_update(
+            content_type=instance.content_type, object_id=instance.object_id
+        )
+
+
+def handler_acl_permissions_effective_permissions_update(
+    sender, instance, action, reverse, **kwargs
+):
+    if setting_effective_permissions_enable.value:
+        if action in ('post_add', 'post_clear', 'post_remove'):
+            if reverse:
+                # The instance is a stored permission.
+                _do_effective_permissions_update(stored_permission=instance)
+            else:
+                _do_effective_permissions_update(
+                    content_type=instance.content_type,
+                    object_id=instance.object_id
+                )
+
+
+def handler_group_effective_permissions_post_delete(sender, instance, **kwargs):
+    if setting_effective_permissions_enable.value:
+        user_id_list = getattr(
+            instance, '_effective_permissions_user_id_list', None
+        )
+        if user_id_list:
+            _do_effective_permissions_update(user_id_list=user_id_list)
+
+
+def handler_group_effective_permissions_pre_delete(sender, instance, **kwargs):
+    if setting_effective_permissions_enable.value:
+        instance._effective_permissions_user_id_list = _get_group_user_id_list(
+            group_id_list=(instance.pk,)
+        )
+
+
+def handler_role_groups_effective_permissions_update(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if setting_effective_permissions_enable.value:
+        if reverse:
+            # The instance is a group.
+            group_id_list = (instance.pk,)
+        elif action in ('pre_clear', 'post_clear'):
+            group_id_list = instance.groups.values_list('pk', flat=True)
+        else:
+            group_id_list = pk_set
+
+        if action in ('post_add', 'post_remove', 'pre_clear'):
+            user_id_list = _get_group_user_id_list(
+                group_id_list=group_id_list
+            )
+
+            if action == 'pre_clear':
+                instance._effective_permissions_user_id_list = user_id_list
+            else:
+                _do_effective_permissions_update(user_id_list=user_id_list)
+        elif action == 'post_clear':
+            _do_effective_permissions_update(
+                user_id_list=instance._effective_permissions_user_id_list
+            )
+
+
+def handler_user_groups_effective_permissions_update(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if setting_effective_permissions_enable.value:
+        if action == 'pre_clear' and reverse:
+            # The instance is a group, store the users before they are
+            # removed.
+            instance._effective_permissions_user_id_list = _get_group_user_id_list(
+                group_id_list=(instance.pk,)
+            )
+        elif action in ('post_add', 'post_clear', 'post_remove'):
+            if not reverse:
+                user_id_list = (instance.pk,)
+            elif action == 'post_clear':
+                user_id_list = instance._effective_permissions_user_id_list
+            else:
+                user_id_list = pk_set
+
+            _do_effective_permissions_update(user_id_list=user_id_list)
@@ -0,0 +1,6 @@
+COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_CHECK = 'acls_effective_permissions_check'
+COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_REBUILD = 'acls_effective_permissions_rebuild'
+
+DEFAULT_ACLS_EFFECTIVE_PERMISSIONS_ENABLE = False
+
+EFFECTIVE_PERMISSION_BULK_CREATE_BATCH_SIZE = 1000
@@ -0,0 +1,31 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Compare the effective permissions with the access control lists.'
+
+    def handle(self, *args, **options):
+        EffectivePermission = apps.get_model(
+            app_label='acls', model_name='EffectivePermission'
+        )
+
+        entries_missing, entries_extra = EffectivePermission.objects.get_inconsistencies()
+
+        self.stdout.write(
+            msg='Missing effective permissions: {}'.format(
+                len(entries_missing)
+            )
+        )
+        self.stdout.write(
+            msg='Extra effective permissions: {}'.format(
+                len(entries_extra)
+            )
+        )
+
+        if entries_missing or entries_extra:
+            self.stderr.write(
+                msg='The effective permissions are not consistent. Run the '
+                '`acls_effective_permissions_rebuild` command.'
+            )
+            exit(1)
@@ -0,0 +1,19 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the effective permissions from the access control lists.'
+
+    def handle(self, *args, **options):
+        EffectivePermission = apps.get_model(
+            app_label='acls', model_name='EffectivePermission'
+        )
+
+        EffectivePermission.objects.rebuild()
+
+        self.stdout.write(
+            msg='Effective permissions: {}'.format(
+                EffectivePermission.objects.count()
+            )
+        )
@@ -2,10 +2,11 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.db import models, transaction
 from django.db.models import CharField, Q, Value
 from django.db.models.functions import Cast, Concat
 from django.utils.translation import gettext
@@ -18,6 +19,8 @@ from mayan.apps.permissions.models import StoredPermission
 
 from .classes import ModelPermission
 from .exceptions import PermissionNotValidForClass
+from .literals import EFFECTIVE_PERMISSION_BULK_CREATE_BATCH_SIZE
+from .settings import setting_effective_permissions_enable
 
 logger = logging.getLogger(name=__name__)
 
@@ -87,13 +90,14 @@ class AccessControlListManager(models.Manager):
                     )
                 ).only('ct_fk_combination').values('ct_fk_combination')
 
-                queryset_acl_filter = self.annotate(
+                queryset_acl_filter = self._get_acl_queryset(
+                    stored_permission=stored_permission, user=user
+                ).annotate(
                     ct_fk_combination=Concat(
                         'content_type', Value('-'), 'object_id',
                         output_field=CharField()
                     )
                 ).filter(
-                    permissions=stored_permission, role__groups__user=user,
                     ct_fk_combination__in=queryset_content_type_object_id
                 )
 
@@ -121,10 +125,9 @@ class AccessControlListManager(models.Manager):
                     model=related_field.related_model
                 )
                 field_lookup = '{}_id__in'.format(related_field_name)
-                queryset_acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
-                ).values('object_id')
+                queryset_acl_filter = self._get_acl_queryset(
+                    stored_permission=stored_permission, user=user
+                ).filter(content_type=content_type).values('object_id')
                 # Don't add empty filters otherwise the default AND operator
                 # of the Q object will return an empty queryset when reduced
                 # and filter out objects that should be in the final queryset.
@@ -176,10 +179,9 @@ class AccessControlListManager(models.Manager):
                 model=queryset.model
             )
             field_lookup = 'id__in'
-            queryset_acl_filter = self.filter(
-                content_type=content_type, permissions=stored_permission,
-                role__groups__user=user
-            ).values('object_id')
+            queryset_acl_filter = self._get_acl_queryset(
+                stored_permission=stored_permission, user=user
+            ).filter(content_type=content_type).values('object_id')
             result.append(
                 Q(
                     **{field_lookup: queryset_acl_filter}
@@ -234,10 +236,9 @@ class AccessControlListManager(models.Manager):
                 content_type = ContentType.objects.get_for_model(
                     model=queryset.model
                 )
-                queryset_acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
-                ).values('object_id')
+                queryset_acl_filter = self._get_acl_queryset(
+                    stored_permission=stored_permission, user=user
+                ).filter(content_type=content_type).values('object_id')
 
                 # Obtain a queryset of filtered, authorized model instances.
                 queryset_acl = queryset.model._meta.default_manager.filter(
@@ -263,6 +264,25 @@ class AccessControlListManager(models.Manager):
 
         return result
 
+    def _get_acl_queryset(self, stored_permission, user):
+        """
+        Return the entries that grant the permission to the user. The
+        entries are read from the effective permission table when enabled
+        avoiding the joins with the roles and groups.
+        """
+        if setting_effective_permissions_enable.value:
+            EffectivePermission = apps.get_model(
+                app_label='acls', model_name='EffectivePermission'
+            )
+
+            return EffectivePermission.objects.filter(
+                stored_permission=stored_permission, user=user
+            )
+        else:
+            return self.filter(
+                permissions=stored_permission, role__groups__user=user
+            )
+
     def check_access(self, obj, permission, user):
         # Allow specific managers for models that have more than one
         # for example the Document model when checking for access for a
@@ -415,3 +435,99 @@ class AccessControlListManager(models.Manager):
 
         if not acl.permissions.exists():
             acl.delete()
+
+
+class EffectivePermissionManager(models.Manager):
+    def _get_source_queryset(
+        self, content_type=None, object_id=None, stored_permission=None,
+        user_id_list=None
+    ):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        queryset = AccessControlList.objects.filter(
+            permissions__isnull=False, role__groups__user__isnull=False
+        )
+
+        if content_type is not None:
+            queryset = queryset.filter(
+                content_type=content_type, object_id=object_id
+            )
+
+        if stored_permission is not None:
+            queryset = queryset.filter(permissions=stored_permission)
+
+        if user_id_list is not None:
+            queryset = queryset.filter(role__groups__user__in=user_id_list)
+
+        return queryset.order_by().values_list(
+            'role__groups__user', 'permissions', 'content_type', 'object_id'
+        ).distinct()
+
+    def do_update(
+        self, content_type=None, object_id=None, stored_permission=None,
+        user_id_list=None
+    ):
+        """
+        Recalculate the effective permissions of an object, a permission
+        or a list of users from the access control lists. Without
+        arguments, all the effective permissions are recalculated.
+        """
+        queryset = self.all()
+
+        if content_type is not None:
+            queryset = queryset.filter(
+                content_type=content_type, object_id=object_id
+            )
+
+        if stored_permission is not None:
+            queryset = queryset.filter(stored_permission=stored_permission)
+
+        if user_id_list is not None:
+            queryset = queryset.filter(user__in=user_id_list)
+
+        queryset_source = self._get_source_queryset(
+            content_type=content_type, object_id=object_id,
+            stored_permission=stored_permission, user_id_list=user_id_list
+        )
+
+        with transaction.atomic():
+            queryset.delete()
+
+            # Concurrent updates of the same entries delete before any of
+            # them inserts. Entries already inserted by another update are
+            # ignored instead of violating the unique constraint.
+            self.bulk_create(
+                batch_size=EFFECTIVE_PERMISSION_BULK_CREATE_BATCH_SIZE,
+                ignore_conflicts=True, objs=(
+                    self.model(
+                        content_type_id=content_type_id, object_id=object_id,
+                        stored_permission_id=stored_permission_id,
+                        user_id=user_id
+                    ) for user_id, stored_permission_id, content_type_id, object_id in queryset_source.iterator()
+                )
+            )
+
+    def get_inconsistencies(self):
+        """
+        Compare the effective permissions with the access control lists.
+        Returns the entries missing from the table and the entries of the
+        table that are no longer granted.
+        """
+        entries_expected = set(
+            self._get_source_queryset()
+        )
+        entries_stored = set(
+            self.values_list(
+                'user', 'stored_permission', 'content_type', 'object_id'
+            )
+        )
+
+        return (
+            entries_expected - entries_stored,
+            entries_stored - entries_expected
+        )
+
+    def rebuild(self):
+        self.do_update()
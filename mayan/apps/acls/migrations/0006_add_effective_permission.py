@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('acls', '0005_auto_20230116_0640'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('permissions', '0004_auto_20191213_0044'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL)
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectivePermission',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_permissions',
+                        to='contenttypes.contenttype',
+                        verbose_name='Content type'
+                    )
+                ),
+                (
+                    'stored_permission', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_permissions',
+                        to='permissions.storedpermission',
+                        verbose_name='Permission'
+                    )
+                ),
+                (
+                    'user', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_permissions',
+                        to=settings.AUTH_USER_MODEL, verbose_name='User'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Effective permission',
+                'verbose_name_plural': 'Effective permissions',
+                'indexes': [
+                    models.Index(
+                        fields=['content_type', 'object_id'],
+                        name='acls_eff_perm_object_idx'
+                    )
+                ]
+            }
+        ),
+        migrations.AddConstraint(
+            model_name='effectivepermission',
+            constraint=models.UniqueConstraint(
+                fields=(
+                    'user', 'stored_permission', 'content_type', 'object_id'
+                ), name='acls_effective_permission_unique'
+            )
+        )
+    ]
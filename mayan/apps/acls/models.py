@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
@@ -14,7 +15,7 @@ from mayan.apps.events.event_managers import (
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted
-from .managers import AccessControlListManager
+from .managers import AccessControlListManager, EffectivePermissionManager
 from .model_mixins import AccessControlListBusinessLogicMixin
 
 logger = logging.getLogger(name=__name__)
@@ -102,3 +103,47 @@ class AccessControlList(
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
+
+
+class EffectivePermission(models.Model):
+    """
+    Denormalized copy of the access control lists. Each entry records a
+    permission granted to a user for an object by way of the user's groups
+    and their roles. The entries are kept up to date when the access
+    control lists, roles or groups change and are used to filter querysets
+    without joining the roles and groups of the access control lists.
+    """
+    user = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_permissions',
+        to=settings.AUTH_USER_MODEL, verbose_name=_(message='User')
+    )
+    stored_permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_permissions',
+        to=StoredPermission, verbose_name=_(message='Permission')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_permissions',
+        to=ContentType, verbose_name=_(message='Content type')
+    )
+    object_id = models.PositiveIntegerField(
+        verbose_name=_(message='Object ID')
+    )
+
+    objects = EffectivePermissionManager()
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=(
+                    'user', 'stored_permission', 'content_type', 'object_id'
+                ), name='acls_effective_permission_unique'
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=('content_type', 'object_id'),
+                name='acls_eff_perm_object_idx'
+            ),
+        )
+        verbose_name = _(message='Effective permission')
+        verbose_name_plural = _(message='Effective permissions')
@@ -0,0 +1,19 @@
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.smart_settings.settings import setting_cluster
+
+from .literals import DEFAULT_ACLS_EFFECTIVE_PERMISSIONS_ENABLE
+
+setting_namespace = setting_cluster.do_namespace_add(
+    label=_(message='ACLs'), name='acls'
+)
+
+setting_effective_permissions_enable = setting_namespace.do_setting_add(
+    default=DEFAULT_ACLS_EFFECTIVE_PERMISSIONS_ENABLE,
+    global_name='ACLS_EFFECTIVE_PERMISSIONS_ENABLE', help_text=_(
+        message='Keep a table of the objects each user has been granted '
+        'each permission to and use it to filter the objects by access. '
+        'Execute the `acls_effective_permissions_rebuild` management '
+        'command after enabling this setting.'
+    )
+)
@@ -1,6 +1,93 @@
+from django.core.exceptions import PermissionDenied
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import ModelPermission
+from ..classes import AccessCheckCache, ModelPermission
+
+from .mixins import ACLTestMixin
+
+
+class AccessCheckCacheTestCase(ACLTestMixin, BaseTestCase):
+    auto_create_acl_test_object = True
+
+    def setUp(self):
+        super().setUp()
+
+        for index in range(2):
+            self._create_test_object()
+
+        self._access_check_cache = AccessCheckCache(
+            user=self._test_case_user
+        )
+
+    def test_check_access_no_permission(self):
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._access_check_cache.check_access(
+                obj=self._test_object, permission=self._test_permission
+            )
+
+    def test_check_access_with_access(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertTrue(
+            self._access_check_cache.check_access(
+                obj=self._test_object, permission=self._test_permission
+            )
+        )
+
+    def test_check_access_prefetch(self):
+        self.grant_access(
+            obj=self._test_object_list[0], permission=self._test_permission
+        )
+
+        for test_object in self._test_object_list:
+            self._access_check_cache.add(
+                obj=test_object, permission=self._test_permission
+            )
+
+        self._access_check_cache.check_access(
+            obj=self._test_object_list[0], permission=self._test_permission
+        )
+
+        with self.assertNumQueries(num=0):
+            for test_object in self._test_object_list[1:]:
+                with self.assertRaises(expected_exception=PermissionDenied):
+                    self._access_check_cache.check_access(
+                        obj=test_object, permission=self._test_permission
+                    )
+
+            self._access_check_cache.check_access(
+                obj=self._test_object_list[0],
+                permission=self._test_permission
+            )
+
+    def test_check_user_permission_no_permission(self):
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._access_check_cache.check_user_permission(
+                permission=self._test_permission
+            )
+
+        with self.assertNumQueries(num=0):
+            with self.assertRaises(expected_exception=PermissionDenied):
+                self._access_check_cache.check_user_permission(
+                    permission=self._test_permission
+                )
+
+    def test_check_user_permission_with_permission(self):
+        self.grant_permission(permission=self._test_permission)
+
+        self.assertTrue(
+            self._access_check_cache.check_user_permission(
+                permission=self._test_permission
+            )
+        )
+
+        with self.assertNumQueries(num=0):
+            self._access_check_cache.check_user_permission(
+                permission=self._test_permission
+            )
 
 
 class ModelPermissionTestCase(BaseTestCase):
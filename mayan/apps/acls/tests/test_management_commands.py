@@ -0,0 +1,61 @@
+from django.test import override_settings
+
+from mayan.apps.common.tests.mixins import ManagementCommandTestMixin
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..literals import (
+    COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_CHECK,
+    COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_REBUILD
+)
+from ..models import EffectivePermission
+
+from .mixins import ACLTestMixin
+
+
+@override_settings(ACLS_EFFECTIVE_PERMISSIONS_ENABLE=True)
+class EffectivePermissionsCheckManagementCommandTestCase(
+    SettingOverrideTestMixin, ACLTestMixin, ManagementCommandTestMixin,
+    BaseTestCase
+):
+    _test_management_command_name = COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_CHECK
+    auto_create_acl_test_object = True
+
+    def test_command_consistent(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        stdout, stderr = self._call_test_management_command()
+
+        self.assertTrue('Missing effective permissions: 0' in stdout)
+        self.assertTrue('Extra effective permissions: 0' in stdout)
+
+    def test_command_inconsistent(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        EffectivePermission.objects.all().delete()
+
+        with self.assertRaises(expected_exception=SystemExit):
+            self._call_test_management_command()
+
+
+class EffectivePermissionsRebuildManagementCommandTestCase(
+    SettingOverrideTestMixin, ACLTestMixin, ManagementCommandTestMixin,
+    BaseTestCase
+):
+    _test_management_command_name = COMMAND_NAME_ACLS_EFFECTIVE_PERMISSIONS_REBUILD
+    auto_create_acl_test_object = True
+
+    def test_command(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertEqual(EffectivePermission.objects.count(), 0)
+
+        self._call_test_management_command()
+
+        self.assertEqual(EffectivePermission.objects.count(), 1)
@@ -1,13 +1,18 @@
+from unittest import mock
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
 from django.db import models
+from django.db.models.query import QuerySet
+from django.test import override_settings
 
 from mayan.apps.events.classes import EventModelRegistry
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, EffectivePermission
 
 from .mixins import ACLTestMixin
 
@@ -620,3 +625,170 @@ class ProxyModelPermissionTestCase(ACLTestMixin, BaseTestCase):
                 user=self._test_case_user
             )
         )
+
+
+@override_settings(ACLS_EFFECTIVE_PERMISSIONS_ENABLE=True)
+class EffectivePermissionTestCase(
+    SettingOverrideTestMixin, ACLTestMixin, BaseTestCase
+):
+    auto_create_acl_test_object = True
+
+    def _get_test_effective_permission_queryset(self):
+        return EffectivePermission.objects.filter(
+            content_type=ContentType.objects.get_for_model(
+                model=self._test_object
+            ), object_id=self._test_object.pk,
+            stored_permission=self._test_permission.stored_permission,
+            user=self._test_case_user
+        )
+
+    def test_acl_grant(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertTrue(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_acl_revoke(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self.revoke_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_acl_delete(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_acl.delete()
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_group_delete(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.delete()
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_role_groups_add(self):
+        self._test_case_role.groups.clear()
+
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+        self._test_case_role.groups.add(self._test_case_group)
+        self.assertTrue(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_role_groups_clear(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_role.groups.clear()
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_user_groups_remove(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_user.groups.remove(self._test_case_group)
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_group_users_clear(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.user_set.clear()
+
+        self.assertFalse(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+    def test_concurrent_update(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        # Keep the entries to simulate another update inserting them after
+        # this update deleted them.
+        with mock.patch.object(target=QuerySet, attribute='delete'):
+            EffectivePermission.objects.do_update(
+                content_type=ContentType.objects.get_for_model(
+                    model=self._test_object
+                ), object_id=self._test_object.pk
+            )
+
+        self.assertEqual(
+            self._get_test_effective_permission_queryset().count(), 1
+        )
+
+    def test_inconsistencies_and_rebuild(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self._get_test_effective_permission_queryset().delete()
+
+        entries_missing, entries_extra = EffectivePermission.objects.get_inconsistencies()
+        self.assertEqual(len(entries_missing), 1)
+        self.assertEqual(len(entries_extra), 0)
+
+        EffectivePermission.objects.rebuild()
+
+        entries_missing, entries_extra = EffectivePermission.objects.get_inconsistencies()
+        self.assertEqual(len(entries_missing), 0)
+        self.assertEqual(len(entries_extra), 0)
+        self.assertTrue(
+            self._get_test_effective_permission_queryset().exists()
+        )
+
+
+@override_settings(ACLS_EFFECTIVE_PERMISSIONS_ENABLE=True)
+class EffectivePermissionGenericForeignKeyFieldModelTestCase(
+    SettingOverrideTestMixin, GenericForeignKeyFieldModelTestCase
+):
+    """
+    Repeat the filtering tests using the effective permissions.
+    """
+
+
+@override_settings(ACLS_EFFECTIVE_PERMISSIONS_ENABLE=True)
+class EffectivePermissionInheritedPermissionTestCase(
+    SettingOverrideTestMixin, InheritedPermissionTestCase
+):
+    """
+    Repeat the filtering tests using the effective permissions.
+    """
+
+
+@override_settings(ACLS_EFFECTIVE_PERMISSIONS_ENABLE=True)
+class EffectivePermissionPermissionTestCase(
+    SettingOverrideTestMixin, PermissionTestCase
+):
+    """
+    Repeat the filtering tests using the effective permissions.
+    """
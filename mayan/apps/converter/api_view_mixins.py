@@ -1,3 +1,6 @@
+import io
+import logging
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.http import StreamingHttpResponse
@@ -5,6 +8,7 @@ from django.views.decorators.cache import patch_cache_control
 
 from rest_framework.exceptions import APIException
 
+from mayan.apps.file_caching.classes import CachePartitionFileMemoryTier
 from mayan.apps.mime_types.classes import MIMETypeBackend
 
 from .classes import AppImageErrorImage, ConverterBase
@@ -15,6 +19,8 @@ from .settings import (
 from .tasks import task_content_object_image_generate
 from .utils import IndexedDictionary, factory_file_generator
 
+logger = logging.getLogger(name=__name__)
+
 
 class APIImageViewMixin:
     """
@@ -24,7 +30,27 @@ class APIImageViewMixin:
         return ContentType.objects.get_for_model(model=self.obj)
 
     def get_file_generator(self):
-        return factory_file_generator(image_object=self.cache_file)
+        if self.cache_file_data is not None:
+            def generator():
+                yield self.cache_file_data
+
+            return generator
+
+        # Cache files are complete once the image generation returns.
+        return factory_file_generator(
+            image_object=self.cache_file, _acquire_lock=False
+        )
+
+    def get_image_cache_filename(
+        self, maximum_layer_order, transformation_instance_list, user
+    ):
+        """
+        Return the cache filename of the image without generating it.
+        Objects able to calculate this filename in advance are served
+        directly from the file caching memory tier, skipping the image
+        generation task.
+        """
+        return None
 
     def get_serializer(self, *args, **kwargs):
         return None
@@ -34,8 +60,20 @@ class APIImageViewMixin:
 
     def get_stream_mime_type(self):
         mime_type_backend = MIMETypeBackend.get_backend_instance()
-        with self.cache_file.open() as file_object:
+
+        if self.cache_file_data is not None:
+            mime_type, mime_encoding = mime_type_backend.get_mime_type(
+                cache_key=CachePartitionFileMemoryTier.get_key(
+                    filename=self.cache_filename,
+                    partition_name=self.obj.cache_partition.name
+                ), file_object=io.BytesIO(initial_bytes=self.cache_file_data),
+                mime_type_only=True
+            )
+            return mime_type
+
+        with self.cache_file.open(_acquire_lock=False) as file_object:
             mime_type, mime_encoding = mime_type_backend.get_mime_type(
+                cache_key=self.cache_file.get_mime_type_cache_key(),
                 file_object=file_object, mime_type_only=True
             )
             return mime_type
@@ -94,6 +132,42 @@ class APIImageViewMixin:
         if maximum_layer_order:
             maximum_layer_order = int(maximum_layer_order)
 
+        self.cache_file = None
+        self.cache_file_data = None
+
+        memory_tier_cache_filename = None
+
+        if CachePartitionFileMemoryTier.is_enabled():
+            transformation_instance_list = IndexedDictionary(
+                dictionary=query_dict
+            ).as_instance_list()
+
+            try:
+                memory_tier_cache_filename = self.get_image_cache_filename(
+                    maximum_layer_order=maximum_layer_order,
+                    transformation_instance_list=transformation_instance_list,
+                    user=request.user
+                )
+            except Exception as exception:
+                # Let the image generation task handle and report the
+                # error.
+                logger.debug(
+                    'Unable to calculate the image cache filename; %s',
+                    exception
+                )
+
+            if memory_tier_cache_filename:
+                self.cache_file_data = CachePartitionFileMemoryTier.get(
+                    filename=memory_tier_cache_filename,
+                    partition_name=self.obj.cache_partition.name
+                )
+                if self.cache_file_data is not None:
+                    self.cache_filename = memory_tier_cache_filename
+                    self.obj.cache_partition.file_hit_add(
+                        filename=memory_tier_cache_filename
+                    )
+                    return
+
         task = task_content_object_image_generate.apply_async(
             kwargs={
                 'content_type_id': self.get_content_type().pk,
@@ -111,11 +185,23 @@ class APIImageViewMixin:
             # tasks when using debug mode.
             kwargs['disable_sync_subtasks'] = False
 
-        cache_filename = task.get(**kwargs)
+        self.cache_filename = task.get(**kwargs)
 
         self.cache_file = self.obj.cache_partition.get_file(
-            filename=cache_filename
+            filename=self.cache_filename
         )
 
+        if memory_tier_cache_filename:
+            with self.cache_file.open(_acquire_lock=False) as file_object:
+                self.cache_file_data = file_object.read()
+
+            # Store the content using the filename calculated by the view
+            # so that the next request finds it.
+            CachePartitionFileMemoryTier.set(
+                data=self.cache_file_data,
+                filename=memory_tier_cache_filename,
+                partition_name=self.obj.cache_partition.name
+            )
+
     def set_object(self):
         self.obj = self.get_object()
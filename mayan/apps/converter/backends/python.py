@@ -1,5 +1,6 @@
 import io
 import logging
+import os
 import shutil
 import struct
 
@@ -9,7 +10,7 @@ import sh
 
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, TemporaryDirectory
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -82,6 +83,54 @@ class Python(ConverterBase):
                 image_buffer.seek(0)
                 return Image.open(fp=image_buffer)
 
+    def convert_many(self, page_number_first=0, page_number_last=None):
+        """
+        Rasterize the entire page range with a single copy of the source
+        file and a single execution of `pdftoppm`.
+        """
+        if self.mime_type == 'application/pdf' and command_pdftoppm:
+            with NamedTemporaryFile() as new_file_object, TemporaryDirectory() as output_directory:
+                self.file_object.seek(0)
+                shutil.copyfileobj(
+                    fsrc=self.file_object, fdst=new_file_object
+                )
+                self.file_object.seek(0)
+                new_file_object.flush()
+
+                kwargs = {'f': page_number_first + 1}
+                if page_number_last is not None:
+                    kwargs['l'] = page_number_last + 1
+
+                command_pdftoppm(
+                    new_file_object.name,
+                    os.path.join(output_directory, 'page'), **kwargs
+                )
+
+                # pdftoppm pads the page number of the output filenames to
+                # the same width, sorting them alphabetically yields the
+                # page order.
+                filenames = sorted(
+                    os.listdir(output_directory)
+                )
+
+                for index, filename in enumerate(filenames):
+                    path = os.path.join(output_directory, filename)
+                    with open(file=path, mode='rb') as file_object:
+                        image_buffer = io.BytesIO(
+                            file_object.read()
+                        )
+
+                    os.unlink(path)
+
+                    yield page_number_first + index, Image.open(
+                        fp=image_buffer
+                    )
+        else:
+            yield from super().convert_many(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+
     def get_page_count(self):
         super().get_page_count()
 
@@ -1,8 +1,11 @@
+from collections import Counter
+from contextlib import contextmanager
 import copy
 from io import BytesIO
 import logging
 import os
 import shutil
+import threading
 
 import PIL
 from PIL import Image, ImageFile
@@ -17,6 +20,7 @@ from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.navigation.links import Link
 from mayan.apps.storage.compressed_files import MsgArchive
@@ -36,7 +40,7 @@ from .literals import (
 from .literals import IMAGE_ERROR_BROKEN_FILE
 from .settings import (
     setting_graphics_backend, setting_graphics_backend_arguments,
-    setting_load_truncated_images
+    setting_image_generation_timeout, setting_load_truncated_images
 )
 
 logger = logging.getLogger(name=__name__)
@@ -93,14 +97,20 @@ class ConverterBase:
 
         return MAP_PILLOW_FORMAT_TO_MIME_TYPE.get(output_format)
 
-    def __init__(self, file_object, mime_type=None):
+    def __init__(self, file_object, mime_type=None, mime_type_cache_key=None):
+        """
+        The MIME type of the file object is detected using the MIME type
+        backend unless provided by the caller. Pass `mime_type_cache_key`
+        to reuse the result of a previous detection of the same content.
+        """
         ImageFile.LOAD_TRUNCATED_IMAGES = setting_load_truncated_images.value
 
         self.file_object = file_object
         self.image = None
 
         self.mime_type = mime_type or MIMETypeBackend.get_backend_instance().get_mime_type(
-            file_object=file_object, mime_type_only=False
+            cache_key=mime_type_cache_key, file_object=file_object,
+            mime_type_only=False
         )[0]
         self.soffice_file = None
         Image.init()
@@ -116,6 +126,19 @@ class ConverterBase:
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
+    def convert_many(self, page_number_first=0, page_number_last=None):
+        """
+        Convert a range of pages and yield a tuple of page number and
+        image for each. Backends able to rasterize several pages in a
+        single pass should override this method. The default
+        implementation converts one page at a time.
+        """
+        if page_number_last is None:
+            page_number_last = self.get_page_count() - 1
+
+        for page_number in range(page_number_first, page_number_last + 1):
+            yield page_number, self.convert(page_number=page_number)
+
     def get_page(self, output_format=None):
         output_format = output_format or setting_graphics_backend_arguments.value.get(
             'pillow_format', DEFAULT_PILLOW_FORMAT
@@ -140,6 +163,65 @@ class ConverterBase:
 
         return image_buffer
 
+    def get_page_many(
+        self, output_format=None, page_number_first=0, page_number_last=None
+    ):
+        """
+        Generator that yields a tuple of page number and image buffer
+        for every page in the range. Paged image formats are opened only
+        once and other formats are rasterized by the backend's
+        `convert_many` in a single pass. Page numbers start at #0 and
+        the range is inclusive. A `page_number_last` of None means up to
+        the last page.
+        """
+        self.file_object.seek(0)
+
+        try:
+            image = Image.open(fp=self.file_object)
+        except IOError:
+            # Cannot identify image file.
+            iterator_images = self.convert_many(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+
+            for page_number, image in iterator_images:
+                self.image = image
+                yield page_number, self.get_page(output_format=output_format)
+        except PIL.Image.DecompressionBombError as exception:
+            error_message = 'Unable to seek document page. Increase the '
+            'value of the argument "pillow_maximum_image_pixels" in the '
+            'CONVERTER_GRAPHICS_BACKEND_ARGUMENTS setting; {}'.format(
+                exception
+            )
+            logger.error(error_message)
+            raise AppImageError(
+                details=error_message, error_name=IMAGE_ERROR_BROKEN_FILE
+            )
+        else:
+            page_number = page_number_first
+
+            while page_number_last is None or page_number <= page_number_last:
+                try:
+                    image.seek(frame=page_number)
+                except EOFError:
+                    break
+
+                try:
+                    image.load()
+                except Exception as exception:
+                    error_message = 'Unable to load document page; {}'.format(
+                        exception
+                    )
+                    raise AppImageError(
+                        details=error_message,
+                        error_name=IMAGE_ERROR_BROKEN_FILE
+                    )
+
+                self.image = image
+                yield page_number, self.get_page(output_format=output_format)
+                page_number += 1
+
     def get_page_count(self):
         try:
             self.soffice_file = self.to_pdf()
@@ -321,6 +403,83 @@ class ConverterBase:
             self.image = transformation.execute_on(image=self.image)
 
 
+class ImageGenerationFlight:
+    """
+    Ensures only one thread of a process generates a given cached image.
+    The other threads requesting the same image wait for it and reuse the
+    result instead of queuing on the lock manager.
+    Also keeps process wide counters of the cached image read path:
+    - hit: the image was found without locking.
+    - miss: the image was not found and was generated.
+    - collision: the image was not found, but was generated by another
+    thread or process while waiting for the locks.
+    """
+    _counter = Counter()
+    _key_locks = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def acquire(cls, key):
+        with cls._lock:
+            entry = cls._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            acquired = entry[0].acquire(
+                timeout=setting_image_generation_timeout.value
+            )
+            if not acquired:
+                raise LockError(
+                    'Timeout waiting for the generation of image: {}'.format(
+                        key
+                    )
+                )
+
+            try:
+                yield
+            finally:
+                entry[0].release()
+        finally:
+            with cls._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del cls._key_locks[key]
+
+    @classmethod
+    def count(cls, name):
+        with cls._lock:
+            cls._counter[name] += 1
+
+    @classmethod
+    def is_cached(cls, cache_partition, filename):
+        """
+        Optimistic read path. Return True and count a hit if the image is
+        already cached. Does not lock, the locks are only needed to
+        generate missing images.
+        """
+        if cache_partition.get_file_is_complete(filename=filename):
+            logger.debug('transformations cache file "%s" found', filename)
+            cls.count(name='hit')
+            return True
+        else:
+            return False
+
+    @classmethod
+    def get_statistics(cls):
+        with cls._lock:
+            return {
+                'collision': cls._counter['collision'],
+                'hit': cls._counter['hit'],
+                'miss': cls._counter['miss']
+            }
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._counter.clear()
+
+
 class Layer:
     _registry = {}
 
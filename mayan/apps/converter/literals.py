@@ -96,7 +96,12 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
 IMAGE_ERROR_BROKEN_FILE = 'converter_image_error_broken_file'
 
 MAP_PILLOW_FORMAT_TO_MIME_TYPE = {
-    'JPEG': 'image/jpeg'
+    'BMP': 'image/bmp',
+    'GIF': 'image/gif',
+    'JPEG': 'image/jpeg',
+    'PNG': 'image/png',
+    'TIFF': 'image/tiff',
+    'WEBP': 'image/webp'
 }
 
 STORAGE_NAME_ASSETS = 'converter__assets'
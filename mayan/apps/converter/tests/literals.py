@@ -10,6 +10,9 @@ TEST_ASSET_PATH = os.path.join(
     'test_files', 'test_asset.png'
 )
 
+TEST_IMAGE_GENERATION_FLIGHT_KEY = 'test_image_generation_flight_key'
+TEST_IMAGE_GENERATION_FLIGHT_WAIT = 0.1  # Seconds
+
 TEST_LAYER_LABEL = 'Test layer'
 TEST_LAYER_ORDER = 1000
 TEST_LAYER_NAME = 'test_layer'
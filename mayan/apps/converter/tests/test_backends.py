@@ -0,0 +1,46 @@
+import unittest
+
+from mayan.apps.documents.tests.literals import TEST_FILE_HYBRID_PDF_PATH
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..backends.python import Python, command_pdftoppm
+
+
+@unittest.skipIf(
+    condition=not command_pdftoppm, reason='pdftoppm is not installed.'
+)
+class PythonBackendTestCase(BaseTestCase):
+    def test_method_convert_many_pdf(self):
+        with open(file=TEST_FILE_HYBRID_PDF_PATH, mode='rb') as file_object:
+            converter = Python(
+                file_object=file_object, mime_type='application/pdf'
+            )
+
+            result = list(
+                converter.convert_many()
+            )
+
+            self.assertEqual(
+                [page_number for page_number, image in result], [0, 1]
+            )
+
+            for page_number, image in result:
+                converter.seek_page(page_number=page_number)
+
+                self.assertEqual(image.size, converter.image.size)
+
+    def test_method_convert_many_pdf_page_range(self):
+        with open(file=TEST_FILE_HYBRID_PDF_PATH, mode='rb') as file_object:
+            converter = Python(
+                file_object=file_object, mime_type='application/pdf'
+            )
+
+            result = list(
+                converter.convert_many(
+                    page_number_first=1, page_number_last=1
+                )
+            )
+
+            self.assertEqual(
+                [page_number for page_number, image in result], [1]
+            )
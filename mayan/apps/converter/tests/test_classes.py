@@ -0,0 +1,45 @@
+import threading
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import ImageGenerationFlight
+
+from .literals import (
+    TEST_IMAGE_GENERATION_FLIGHT_KEY, TEST_IMAGE_GENERATION_FLIGHT_WAIT
+)
+
+
+class ImageGenerationFlightTestCase(BaseTestCase):
+    def test_acquire_single_flight(self):
+        result_list = []
+
+        def worker():
+            with ImageGenerationFlight.acquire(key=TEST_IMAGE_GENERATION_FLIGHT_KEY):
+                result_list.append('worker')
+
+        with ImageGenerationFlight.acquire(key=TEST_IMAGE_GENERATION_FLIGHT_KEY):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join(timeout=TEST_IMAGE_GENERATION_FLIGHT_WAIT)
+
+            self.assertTrue(
+                thread.is_alive()
+            )
+            result_list.append('main')
+
+        thread.join()
+
+        self.assertEqual(result_list, ['main', 'worker'])
+        self.assertEqual(ImageGenerationFlight._key_locks, {})
+
+    def test_statistics(self):
+        ImageGenerationFlight.reset()
+
+        ImageGenerationFlight.count(name='collision')
+        ImageGenerationFlight.count(name='hit')
+        ImageGenerationFlight.count(name='hit')
+
+        self.assertEqual(
+            ImageGenerationFlight.get_statistics(),
+            {'collision': 1, 'hit': 2, 'miss': 0}
+        )
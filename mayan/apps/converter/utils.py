@@ -112,9 +112,9 @@ class IndexedDictionary:
         return result_list
 
 
-def factory_file_generator(image_object):
+def factory_file_generator(image_object, **kwargs):
     def file_generator():
-        with image_object.open() as file_object:
+        with image_object.open(**kwargs) as file_object:
             while True:
                 chunk = file_object.read(File.DEFAULT_CHUNK_SIZE)
                 if not chunk:
@@ -1,4 +1,7 @@
-from django.db import models
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.utils.timezone import now
 
 from .literals import DEFAULT_CREATE_BULK_BATCH_SIZE
 
@@ -28,3 +31,70 @@ class ManagerMinixCreateBulk(models.Manager):
             self.bulk_create(
                 batch_size=self.create_bulk_batch_size, objs=batch
             )
+
+
+class ManagerMixinQueue(models.Manager):
+    """
+    Manager of the entries of a queue that coalesces the repeated additions
+    of the same object. The model has a unique constraint per queued object
+    and a `datetime` field with the time of the last addition. Entries not
+    added again during the queue delay are removed for their dispatch.
+    """
+    def queue_add(
+        self, datetime_current, entry_list, queryset_queued,
+        batch_size=None, **kwargs
+    ):
+        """
+        Update the `datetime` field and the fields in `kwargs` of the
+        entries already queued, selected by `queryset_queued`. Then create
+        the entries of `entry_list` that are not yet queued.
+        """
+        queryset_queued.update(datetime=datetime_current, **kwargs)
+
+        # Entries queued before or concurrently were updated above or have
+        # a recent timestamp and are ignored. Conflict targets are not used
+        # since not all database backends support them.
+        self.bulk_create(
+            batch_size=batch_size, ignore_conflicts=True, objs=entry_list
+        )
+
+    def queue_pop(self, chunk_size, delay, field_names, func, queryset=None):
+        """
+        Remove the entries not added again during the last `delay` seconds,
+        oldest first, in chunks of up to `chunk_size` entries. Each chunk
+        is passed to `func` as a list of the values of the `field_names`
+        fields of its entries. `func` is called before the removal is
+        committed so that an error dispatching the chunk keeps its entries
+        queued. Returns the number of entries removed.
+        """
+        if queryset is None:
+            queryset = self.all()
+
+        queryset = queryset.filter(
+            datetime__lte=now() - timedelta(seconds=delay)
+        ).order_by('pk')
+
+        result = 0
+
+        while True:
+            with transaction.atomic():
+                # The entries are locked until deleted. Additions made
+                # meanwhile queue a new entry once the lock is released.
+                entry_list = tuple(
+                    queryset.select_for_update().values_list(
+                        'pk', *field_names
+                    )[:chunk_size]
+                )
+
+                if not entry_list:
+                    return result
+
+                self.filter(
+                    pk__in=[entry[0] for entry in entry_list]
+                ).delete()
+
+                func(
+                    [entry[1:] for entry in entry_list]
+                )
+
+            result += len(entry_list)
@@ -250,6 +250,11 @@ class DocumentIndexingApp(MayanAppConfig):
             source=IndexTemplate, widget=column_widgets.TwoStateWidget
         )
         column_index_enabled.add_exclude(source=IndexInstance)
+        column_index_rebuild_progress = SourceColumn(
+            attribute='get_rebuild_progress', include_label=True,
+            source=IndexTemplate
+        )
+        column_index_rebuild_progress.add_exclude(source=IndexInstance)
 
         # Index template node
 
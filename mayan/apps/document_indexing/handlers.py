@@ -1,6 +1,7 @@
 from django.apps import apps
 from django.utils.translation import gettext_lazy as _
 
+from .settings import setting_event_trigger_queue_enable
 from .tasks import (
     task_index_instance_document_add, task_index_instance_document_remove
 )
@@ -40,6 +41,9 @@ def handler_event_trigger(sender, **kwargs):
     IndexInstance = apps.get_model(
         app_label='document_indexing', model_name='IndexInstance'
     )
+    IndexInstanceQueueEntry = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceQueueEntry'
+    )
 
     if isinstance(action.target, Document):
         document = action.target
@@ -54,13 +58,19 @@ def handler_event_trigger(sender, **kwargs):
             event_triggers__stored_event_type__name=kwargs['instance'].verb
         )
 
-        for index_instance in index_instance_queryset:
-            task_index_instance_document_add.apply_async(
-                kwargs={
-                    'document_id': document.pk,
-                    'index_instance_id': index_instance.pk
-                }
+        if setting_event_trigger_queue_enable.value:
+            IndexInstanceQueueEntry.objects.enqueue(
+                document=document,
+                index_instance_queryset=index_instance_queryset
             )
+        else:
+            for index_instance in index_instance_queryset:
+                task_index_instance_document_add.apply_async(
+                    kwargs={
+                        'document_id': document.pk,
+                        'index_instance_id': index_instance.pk
+                    }
+                )
 
 
 def handler_index_document(sender, **kwargs):
@@ -6,3 +6,16 @@ RELATIONSHIP_CHOICES = (
     (RELATIONSHIP_NO, _(message='No')),
     (RELATIONSHIP_YES, _(message='Yes')),
 )
+
+DEFAULT_DOCUMENT_INDEXING_DIFFERENTIAL_UPDATE = True
+DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_DELAY = 5
+DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE = True
+DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE = 500
+
+EVENT_TRIGGER_QUEUE_FLUSH_CHUNK_SIZE = 500
+
+INDEX_INSTANCE_REBUILD_CHUNK_LOCK_RETRY_DELAY = 10  # 10 seconds.
+
+INDEX_TEMPLATE_NODE_TEMPLATE_CACHE_MAXIMUM_SIZE = 1024
+
+TASK_EVENT_TRIGGER_QUEUE_FLUSH_INTERVAL = 5  # 5 seconds.
@@ -1,9 +1,31 @@
+from datetime import timedelta
+
+from django.apps import apps
 from django.db import models
+from django.db.models import F
+from django.utils.timezone import now
+
+from mayan.apps.databases.manager_mixins import ManagerMixinQueue
+
+from .literals import EVENT_TRIGGER_QUEUE_FLUSH_CHUNK_SIZE
+from .settings import (
+    setting_event_trigger_queue_delay, setting_rebuild_chunk_size
+)
+from .tasks import task_index_instance_document_add
 
 
 class DocumentIndexInstanceNodeManager(models.Manager):
     def get_for(self, document):
-        return self.filter(documents=document)
+        IndexInstanceRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceRebuild'
+        )
+
+        # Exclude the nodes of the rebuilds in progress.
+        return self.filter(documents=document).exclude(
+            tree_id__in=IndexInstanceRebuild.objects.values(
+                'index_instance_root_node__tree_id'
+            )
+        )
 
 
 class IndexInstanceManager(models.Manager):
@@ -20,6 +42,129 @@ class IndexInstanceManager(models.Manager):
             index_instance.document_remove(document=document)
 
 
+class IndexInstanceQueueEntryManager(ManagerMixinQueue, models.Manager):
+    def enqueue(self, document, index_instance_queryset):
+        """
+        Add the document to the queue of each index instance. Documents
+        already queued keep a single entry per index instance and have
+        their timestamp and event count updated. Returns the number of
+        entries queued.
+        """
+        datetime_current = now()
+
+        index_instance_id_list = list(
+            index_instance_queryset.values_list('pk', flat=True)
+        )
+
+        # Entries created concurrently are ignored, losing only the
+        # count of one event.
+        self.queue_add(
+            datetime_current=datetime_current, entry_list=[
+                self.model(
+                    datetime=datetime_current,
+                    datetime_created=datetime_current, document=document,
+                    index_template_id=index_instance_id
+                ) for index_instance_id in index_instance_id_list
+            ], event_count=F('event_count') + 1,
+            queryset_queued=self.filter(
+                document=document,
+                index_template_id__in=index_instance_id_list
+            )
+        )
+
+        return len(index_instance_id_list)
+
+    def flush(self):
+        """
+        Dispatch the entries that had no new events during the queue delay
+        as indexing tasks. Returns the number of entries dispatched, the
+        number of events they represent and the longest time an entry
+        waited since its first event.
+        """
+        datetime_current = now()
+
+        event_count = 0
+        lag_maximum = timedelta(0)
+
+        def dispatch(entry_list):
+            nonlocal event_count, lag_maximum
+
+            for datetime_created, document_id, entry_event_count, index_instance_id in entry_list:
+                task_index_instance_document_add.apply_async(
+                    kwargs={
+                        'datetime_queued': datetime_created.timestamp(),
+                        'document_id': document_id,
+                        'index_instance_id': index_instance_id
+                    }
+                )
+
+                event_count += entry_event_count
+                lag_maximum = max(
+                    lag_maximum, datetime_current - datetime_created
+                )
+
+        entry_count = self.queue_pop(
+            chunk_size=EVENT_TRIGGER_QUEUE_FLUSH_CHUNK_SIZE,
+            delay=setting_event_trigger_queue_delay.value, field_names=(
+                'datetime_created', 'document_id', 'event_count',
+                'index_template_id'
+            ), func=dispatch
+        )
+
+        return entry_count, event_count, lag_maximum
+
+
+class IndexInstanceRebuildManager(models.Manager):
+    def do_rebuild_start(self, index_template):
+        """
+        Create the root node of the rebuild, divide the documents of the
+        index template into chunks and queue a task for each chunk. A
+        rebuild already in progress for the index template is cancelled.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        for index_instance_rebuild in self.filter(index_template=index_template):
+            index_instance_rebuild.do_cancel()
+
+        index_template_root_node = index_template.index_template_root_node
+        index_template_root_node.initialize_index_instance_root_node()
+
+        document_id_list = list(
+            Document.valid.filter(
+                document_type__in=index_template.document_types.all()
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        chunk_size = setting_rebuild_chunk_size.value
+        document_id_chunk_list = [
+            document_id_list[index:index + chunk_size] for index in range(
+                0, len(document_id_list), chunk_size
+            )
+        ]
+
+        index_instance_rebuild = self.create(
+            chunk_count=len(document_id_chunk_list),
+            document_count=len(document_id_list),
+            index_instance_root_node=IndexInstanceNode.objects.create(
+                index_template_node=index_template_root_node, parent=None
+            ), index_template=index_template
+        )
+
+        if document_id_chunk_list:
+            for document_id_chunk in document_id_chunk_list:
+                index_instance_rebuild.do_chunk_queue(
+                    document_id_list=document_id_chunk
+                )
+        else:
+            index_instance_rebuild.do_finish_queue()
+
+        return index_instance_rebuild
+
+
 class IndexTemplateManager(models.Manager):
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
@@ -0,0 +1,74 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+import mayan.apps.document_indexing.models.index_instance_model_mixins
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_indexing', '0029_alter_indexinstancenode_value')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexInstanceRebuild',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'datetime_started', models.DateTimeField(
+                        auto_now_add=True,
+                        verbose_name='Date and time started'
+                    )
+                ),
+                (
+                    'document_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Document count'
+                    )
+                ),
+                (
+                    'document_processed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Processed document count'
+                    )
+                ),
+                (
+                    'chunk_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Chunk count'
+                    )
+                ),
+                (
+                    'chunk_processed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Processed chunk count'
+                    )
+                ),
+                (
+                    'index_instance_root_node', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_instance_rebuild',
+                        to='document_indexing.indexinstancenode',
+                        verbose_name='Root node'
+                    )
+                ),
+                (
+                    'index_template', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_instance_rebuild',
+                        to='document_indexing.indextemplate',
+                        verbose_name='Index template'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index instance rebuild',
+                'verbose_name_plural': 'Index instance rebuilds'
+            },
+            bases=(
+                mayan.apps.document_indexing.models.index_instance_model_mixins.IndexInstanceRebuildBusinessLogicMixin,
+                models.Model
+            )
+        )
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_indexing', '0030_add_index_instance_rebuild'),
+        ('documents', '0091_fix_documenttype_verbose_name')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexInstanceQueueEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'datetime_created', models.DateTimeField(
+                        help_text='The server date and time when the '
+                        'document was first queued.',
+                        verbose_name='Date time created'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        db_index=True, help_text='The server date and time '
+                        'when the document was last queued.',
+                        verbose_name='Date time'
+                    )
+                ),
+                (
+                    'event_count', models.PositiveIntegerField(
+                        default=1, help_text='Number of events that queued '
+                        'the document.', verbose_name='Event count'
+                    )
+                ),
+                (
+                    'document', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_instance_queue_entries',
+                        to='documents.document', verbose_name='Document'
+                    )
+                ),
+                (
+                    'index_template', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='queue_entries',
+                        to='document_indexing.indextemplate',
+                        verbose_name='Index template'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index instance queue entry',
+                'verbose_name_plural': 'Index instance queue entries',
+                'ordering': ('datetime',)
+            }
+        ),
+        migrations.AddConstraint(
+            model_name='indexinstancequeueentry',
+            constraint=models.UniqueConstraint(
+                fields=('index_template', 'document'),
+                name='document_indexing_queue_entry_unique'
+            )
+        )
+    ]
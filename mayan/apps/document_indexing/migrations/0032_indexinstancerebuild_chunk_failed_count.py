@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_indexing', '0031_add_index_instance_queue_entry')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='indexinstancerebuild',
+            name='chunk_failed_count',
+            field=models.PositiveIntegerField(
+                default=0, verbose_name='Failed chunk count'
+            )
+        )
+    ]
@@ -1,6 +1,8 @@
 import logging
 
 from django.apps import apps
+from django.db import transaction
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.models import AccessControlList
@@ -8,53 +10,257 @@ from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
-from mayan.apps.templating.template_backends import Template
+
+from ..literals import INDEX_INSTANCE_REBUILD_CHUNK_LOCK_RETRY_DELAY
+from ..settings import setting_differential_update
+from ..tasks import (
+    task_index_instance_rebuild_chunk, task_index_instance_rebuild_finish
+)
 
 logger = logging.getLogger(name=__name__)
 
 
 class IndexInstanceBusinessLogicMixin:
-    def _delete_empty_nodes(self):
-        self.index_instance_root_node.get_children().filter(
+    def _delete_empty_nodes(self, index_instance_root_node=None):
+        index_instance_root_node = index_instance_root_node or self.index_instance_root_node
+
+        # Filter by parent instead of using the MPTT fields which are not
+        # updated for the nodes of a rebuild in progress.
+        index_instance_root_node.children.filter(
             children=None, documents=None
         ).delete()
 
     def _document_add(self, document, index_instance_node_parent):
         for index_template_node in index_instance_node_parent.index_template_node.get_children().filter(enabled=True):
-            try:
-                template = Template(
-                    template_string=index_template_node.expression
+            result = self._evaluate_index_template_node(
+                document=document, index_template_node=index_template_node
+            )
+
+            if result:
+                index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
+                    parent=index_instance_node_parent,
+                    value=result
                 )
-                result = template.render(
-                    context={'document': document}
+
+                if index_template_node.link_documents:
+                    index_instance_node.documents.add(document)
+
+                self._document_add(
+                    document=document,
+                    index_instance_node_parent=index_instance_node
                 )
-            except Exception as exception:
-                logger.debug('Evaluating error: %s', exception)
-                error_message = _(
-                    message='Error indexing document: %(document)s; expression: '
-                    '%(expression)s; %(exception)s'
-                ) % {
-                    'document': document,
-                    'exception': exception,
-                    'expression': index_template_node.expression
-                }
-                logger.debug(msg=error_message)
-            else:
-                logger.debug('Evaluation result: %s', result)
 
-                if result:
-                    index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
-                        parent=index_instance_node_parent,
-                        value=result
+    def _document_rebuild_update(self, document):
+        """
+        Apply the update of the document to the rebuild in progress, if any,
+        so that the update is not lost when the rebuild replaces the current
+        nodes. The index instance lock is held to exclude the finish of the
+        rebuild during the update.
+        """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+        IndexInstanceRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceRebuild'
+        )
+
+        if IndexInstanceRebuild.objects.filter(index_template=self).exists():
+            lock_index_instance = LockingBackend.get_backend().acquire_lock(
+                name=self.get_lock_string()
+            )
+            try:
+                try:
+                    index_instance_rebuild = IndexInstanceRebuild.objects.get(
+                        index_template=self
                     )
+                except IndexInstanceRebuild.DoesNotExist:
+                    """The rebuild finished before the lock was acquired."""
+                else:
+                    with IndexInstanceNode.objects.disable_mptt_updates():
+                        self._document_update(
+                            document=document,
+                            index_instance_root_node=index_instance_rebuild.index_instance_root_node,
+                            use_lock=False
+                        )
+            finally:
+                lock_index_instance.release()
+
+    def _document_update(
+        self, document, index_instance_root_node=None, use_lock=True
+    ):
+        """
+        Link the document to the nodes resulting from the evaluation of the
+        index template nodes. Only the links that differ from the current
+        links of the document are added or removed and only the missing
+        nodes are created. Nodes not leading to a linked document are not
+        created.
+
+        Creating and deleting nodes updates the MPTT fields of the whole
+        tree and is done holding the index instance lock. Linking the
+        document to existing nodes only requires the document lock held by
+        the caller, which allows indexing documents concurrently. The
+        `use_lock` argument disables the index instance lock for trees
+        whose MPTT fields are not updated.
+        """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        index_instance_root_node = index_instance_root_node or self.index_instance_root_node
+
+        index_instance_node_dict = {
+            (): index_instance_root_node
+        }
+        index_instance_node_id_set = set()
+        node_path_missing_list = []
+
+        for node_path in self._get_document_node_path_list(
+            document=document,
+            index_template_node_parent=self.index_template_root_node
+        ):
+            index_instance_node = self._get_index_instance_node(
+                create=False,
+                index_instance_node_dict=index_instance_node_dict,
+                node_path=node_path
+            )
+
+            if index_instance_node:
+                index_instance_node_id_set.add(index_instance_node.pk)
+            else:
+                node_path_missing_list.append(node_path)
+
+        queryset_links = IndexInstanceNode.documents.through.objects.filter(
+            document=document,
+            indexinstancenode__index_template_node__enabled=True,
+            indexinstancenode__tree_id=index_instance_root_node.tree_id
+        )
+
+        index_instance_node_id_set_current = set(
+            queryset_links.values_list('indexinstancenode_id', flat=True)
+        )
+
+        index_instance_node_id_set_remove = index_instance_node_id_set_current - index_instance_node_id_set
+
+        if use_lock and (node_path_missing_list or index_instance_node_id_set_remove):
+            lock_index_instance = LockingBackend.get_backend().acquire_lock(
+                name=self.get_lock_string()
+            )
+        else:
+            lock_index_instance = None
+
+        try:
+            for node_path in node_path_missing_list:
+                index_instance_node = self._get_index_instance_node(
+                    index_instance_node_dict=index_instance_node_dict,
+                    node_path=node_path
+                )
+                index_instance_node_id_set.add(index_instance_node.pk)
 
-                    if index_template_node.link_documents:
-                        index_instance_node.documents.add(document)
+            index_instance_node_id_set_add = index_instance_node_id_set - index_instance_node_id_set_current
 
-                    self._document_add(
+            if index_instance_node_id_set_add:
+                document.index_instance_nodes.add(
+                    *index_instance_node_id_set_add
+                )
+
+            if index_instance_node_id_set_remove:
+                queryset_links.filter(
+                    indexinstancenode_id__in=index_instance_node_id_set_remove
+                ).delete()
+
+                self._delete_empty_nodes(
+                    index_instance_root_node=index_instance_root_node
+                )
+        finally:
+            if lock_index_instance:
+                lock_index_instance.release()
+
+    def _evaluate_index_template_node(self, document, index_template_node):
+        try:
+            result = index_template_node.get_template().render(
+                context={'document': document}
+            )
+        except Exception as exception:
+            logger.debug('Evaluating error: %s', exception)
+            error_message = _(
+                message='Error indexing document: %(document)s; expression: '
+                '%(expression)s; %(exception)s'
+            ) % {
+                'document': document,
+                'exception': exception,
+                'expression': index_template_node.expression
+            }
+            logger.debug(msg=error_message)
+        else:
+            logger.debug('Evaluation result: %s', result)
+            return result
+
+    def _get_document_node_path_list(
+        self, document, index_template_node_parent, node_path=()
+    ):
+        """
+        Evaluate the index template nodes for the document and return the
+        paths of the nodes to which the document is to be linked. Each path
+        is a tuple of index template node and value pairs.
+        """
+        result = []
+
+        for index_template_node in index_template_node_parent.get_children().filter(enabled=True):
+            value = self._evaluate_index_template_node(
+                document=document, index_template_node=index_template_node
+            )
+
+            if value:
+                node_path_child = node_path + (
+                    (index_template_node, value),
+                )
+
+                if index_template_node.link_documents:
+                    result.append(node_path_child)
+
+                result.extend(
+                    self._get_document_node_path_list(
                         document=document,
-                        index_instance_node_parent=index_instance_node
+                        index_template_node_parent=index_template_node,
+                        node_path=node_path_child
                     )
+                )
+
+        return result
+
+    def _get_index_instance_node(
+        self, index_instance_node_dict, node_path, create=True
+    ):
+        """
+        Return the node of the path, creating the missing nodes of the path
+        when `create` is True. Otherwise return None if the node does not
+        exist.
+        """
+        try:
+            return index_instance_node_dict[node_path]
+        except KeyError:
+            index_instance_node_parent = self._get_index_instance_node(
+                create=create,
+                index_instance_node_dict=index_instance_node_dict,
+                node_path=node_path[:-1]
+            )
+            index_template_node, value = node_path[-1]
+
+            if create:
+                index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
+                    parent=index_instance_node_parent, value=value
+                )
+            elif index_instance_node_parent:
+                index_instance_node = index_template_node.index_instance_nodes.filter(
+                    parent=index_instance_node_parent, value=value
+                ).first()
+            else:
+                index_instance_node = None
+
+            if index_instance_node:
+                index_instance_node_dict[node_path] = index_instance_node
+
+            return index_instance_node
 
     def document_nodes_delete(self, document):
         IndexInstanceNode = apps.get_model(
@@ -71,73 +277,94 @@ class IndexInstanceBusinessLogicMixin:
 
     def document_add(self, document):
         """
-        Method to start the indexing process for a document. The entire
-        process happens inside one transaction. The document is first
-        removed from all the index nodes to which it already belongs.
-        The different index templates that match this document's type
-        are evaluated and for each result a node is fetched or created and
-        the document is added to that node.
+        Method to start the indexing process for a document. The different
+        index templates that match this document's type are evaluated and
+        for each result a node is fetched or created and the document is
+        added to that node. With differential updates, only the links that
+        changed are updated and the index instance lock is only held to
+        create or delete nodes. Otherwise, the document is first removed
+        from all the index nodes to which it already belongs while holding
+        the index instance lock. The update is also applied to the rebuild
+        of the index in progress.
         """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
         logger.debug('Index; Indexing document: %s', document)
 
         if Document.valid.filter(pk=document.pk).exists() and self.enabled and self.document_types.filter(pk=document.document_type.pk).exists():
-            try:
-                locking_backend = LockingBackend.get_backend()
+            locking_backend = LockingBackend.get_backend()
 
-                lock_index_instance = locking_backend.acquire_lock(
-                    name=self.get_lock_string()
+            try:
+                lock_document = locking_backend.acquire_lock(
+                    name=self.get_document_lock_string(document=document)
                 )
             except LockError:
                 raise
             else:
                 try:
-                    lock_document = locking_backend.acquire_lock(
-                        name=self.get_document_lock_string(document=document)
-                    )
-                except LockError:
-                    raise
-                else:
-                    try:
-                        self.initialize_index_instance_root_node_node()
-
-                        self.document_nodes_delete(document=document)
-
-                        self._document_add(
-                            document=document,
-                            index_instance_node_parent=self.index_instance_root_node
+                    self._document_rebuild_update(document=document)
+
+                    if setting_differential_update.value:
+                        try:
+                            self.index_instance_root_node
+                        except IndexInstanceNode.DoesNotExist:
+                            # The root node has no parent and is not
+                            # covered by the unique constraint of the
+                            # nodes. Create it holding the index instance
+                            # lock to avoid duplicate root nodes.
+                            lock_index_instance = locking_backend.acquire_lock(
+                                name=self.get_lock_string()
+                            )
+                            try:
+                                self.initialize_index_instance_root_node_node()
+                            finally:
+                                lock_index_instance.release()
+
+                        self._document_update(document=document)
+                    else:
+                        lock_index_instance = locking_backend.acquire_lock(
+                            name=self.get_lock_string()
                         )
-
-                        self._delete_empty_nodes()
-                    finally:
-                        lock_document.release()
+                        try:
+                            self.initialize_index_instance_root_node_node()
+                            self.document_nodes_delete(document=document)
+
+                            self._document_add(
+                                document=document,
+                                index_instance_node_parent=self.index_instance_root_node
+                            )
+
+                            self._delete_empty_nodes()
+                        finally:
+                            lock_index_instance.release()
                 finally:
-                    lock_index_instance.release()
+                    lock_document.release()
 
     def document_remove(self, document):
         if self.enabled and self.document_types.filter(pk=document.document_type.pk).exists():
+            locking_backend = LockingBackend.get_backend()
+
             try:
-                lock_index_instance = LockingBackend.get_backend().acquire_lock(
-                    name=self.get_lock_string()
+                lock_document = locking_backend.acquire_lock(
+                    name=self.get_document_lock_string(document=document)
                 )
             except LockError:
                 raise
             else:
                 try:
-                    lock_document = LockingBackend.get_backend().acquire_lock(
-                        name=self.get_document_lock_string(
-                            document=document
-                        )
+                    self.document_nodes_delete(document=document)
+
+                    lock_index_instance = locking_backend.acquire_lock(
+                        name=self.get_lock_string()
                     )
-                except LockError:
-                    raise
-                else:
                     try:
-                        self.document_nodes_delete(document=document)
                         self._delete_empty_nodes()
                     finally:
-                        lock_document.release()
+                        lock_index_instance.release()
                 finally:
-                    lock_index_instance.release()
+                    lock_document.release()
 
     def get_children(self):
         return self.index_instance_root_node.get_children()
@@ -260,3 +487,197 @@ class IndexInstanceNodeBusinessLogicMixin:
         return IndexInstance.objects.get(
             pk=self.index_template_node.index.pk
         )
+
+
+class IndexInstanceRebuildBusinessLogicMixin:
+    def do_cancel(self):
+        """
+        Delete the nodes created by the rebuild. The rebuild is deleted
+        along with its root node.
+        """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        IndexInstanceNode.objects.filter(
+            tree_id=self.index_instance_root_node.tree_id
+        ).delete()
+
+    def _do_chunk_complete(self, field_increment_dict):
+        """
+        Update the counters of the rebuild. The last chunk to complete
+        queues the finish task if all the chunks were processed or cancels
+        the rebuild if any chunk failed, leaving the current nodes in use.
+        """
+        with transaction.atomic():
+            index_instance_rebuild = self.__class__.objects.select_for_update().get(
+                pk=self.pk
+            )
+            for field_name, value in field_increment_dict.items():
+                setattr(
+                    index_instance_rebuild, field_name,
+                    getattr(index_instance_rebuild, field_name) + value
+                )
+
+            index_instance_rebuild.save(
+                update_fields=tuple(field_increment_dict)
+            )
+
+        if index_instance_rebuild.chunk_processed_count + index_instance_rebuild.chunk_failed_count >= index_instance_rebuild.chunk_count:
+            if index_instance_rebuild.chunk_failed_count:
+                logger.error(
+                    'Cancelling index instance rebuild: %s; %d of %d chunks '
+                    'failed', index_instance_rebuild,
+                    index_instance_rebuild.chunk_failed_count,
+                    index_instance_rebuild.chunk_count
+                )
+                index_instance_rebuild.do_cancel()
+            else:
+                index_instance_rebuild.do_finish_queue()
+
+    def do_chunk_fail(self):
+        """
+        Record a chunk that failed with an error that is not retried.
+        """
+        self._do_chunk_complete(
+            field_increment_dict={'chunk_failed_count': 1}
+        )
+
+    def do_chunk_process(self, document_id_list):
+        """
+        Index a chunk of documents under the root node of the rebuild.
+        Several chunks are processed in parallel. The MPTT fields of the
+        nodes are not updated, they are rebuilt once when the rebuild
+        finishes. The last chunk to finish queues the finish task.
+
+        Each document is indexed holding its document lock. Documents
+        locked by another update are queued again as the remainder of the
+        chunk.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        IndexInstance = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstance'
+        )
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        index_instance = IndexInstance.objects.get(pk=self.index_template_id)
+        locking_backend = LockingBackend.get_backend()
+
+        queryset = Document.valid.filter(
+            document_type__in=index_instance.document_types.all(),
+            pk__in=document_id_list
+        )
+
+        document_id_list_locked = []
+
+        with IndexInstanceNode.objects.disable_mptt_updates():
+            for document in queryset:
+                try:
+                    lock_document = locking_backend.acquire_lock(
+                        name=index_instance.get_document_lock_string(
+                            document=document
+                        )
+                    )
+                except LockError:
+                    document_id_list_locked.append(document.pk)
+                else:
+                    try:
+                        index_instance._document_update(
+                            document=document,
+                            index_instance_root_node=self.index_instance_root_node,
+                            use_lock=False
+                        )
+                    finally:
+                        lock_document.release()
+
+        if document_id_list_locked:
+            self._do_chunk_complete(
+                field_increment_dict={
+                    'document_processed_count': len(document_id_list) - len(
+                        document_id_list_locked
+                    )
+                }
+            )
+            self.do_chunk_queue(
+                countdown=INDEX_INSTANCE_REBUILD_CHUNK_LOCK_RETRY_DELAY,
+                document_id_list=document_id_list_locked
+            )
+        else:
+            self._do_chunk_complete(
+                field_increment_dict={
+                    'chunk_processed_count': 1,
+                    'document_processed_count': len(document_id_list)
+                }
+            )
+
+    def do_chunk_queue(self, document_id_list, countdown=None):
+        task_index_instance_rebuild_chunk.apply_async(
+            countdown=countdown, kwargs={
+                'document_id_list': document_id_list,
+                'index_instance_rebuild_id': self.pk
+            }
+        )
+
+    def do_finish(self):
+        """
+        Replace the current nodes of the index instance with the nodes of
+        the rebuild. The index instance lock is held to exclude document
+        updates while the nodes are swapped.
+        """
+        IndexInstance = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstance'
+        )
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+
+        index_instance = IndexInstance.objects.get(pk=self.index_template_id)
+
+        lock_index_instance = LockingBackend.get_backend().acquire_lock(
+            name=index_instance.get_lock_string()
+        )
+
+        try:
+            with transaction.atomic():
+                # Documents removed during the rebuild may leave empty
+                # nodes.
+                index_instance._delete_empty_nodes(
+                    index_instance_root_node=self.index_instance_root_node
+                )
+
+                tree_id = self.index_instance_root_node.tree_id
+
+                IndexInstanceNode.objects.partial_rebuild(tree_id=tree_id)
+
+                IndexInstanceNode.objects.filter(
+                    index_template_node__index_id=self.index_template_id
+                ).exclude(tree_id=tree_id).delete()
+
+                self.delete()
+        finally:
+            lock_index_instance.release()
+
+    def do_finish_queue(self):
+        task_index_instance_rebuild_finish.apply_async(
+            kwargs={'index_instance_rebuild_id': self.pk}
+        )
+
+    def get_datetime_estimated_completion(self):
+        """
+        Estimate the completion time using the average document processing
+        rate since the start of the rebuild.
+        """
+        if self.document_processed_count:
+            return self.datetime_started + (
+                now() - self.datetime_started
+            ) * self.document_count / self.document_processed_count
+
+    def get_progress_percent(self):
+        if self.document_count:
+            return self.document_processed_count * 100 // self.document_count
+        else:
+            return 100
@@ -7,10 +7,14 @@ from mptt.models import MPTTModel
 
 from mayan.apps.documents.models.document_models import Document
 
-from ..managers import DocumentIndexInstanceNodeManager, IndexInstanceManager
+from ..managers import (
+    DocumentIndexInstanceNodeManager, IndexInstanceManager,
+    IndexInstanceQueueEntryManager, IndexInstanceRebuildManager
+)
 
 from .index_instance_model_mixins import (
-    IndexInstanceBusinessLogicMixin, IndexInstanceNodeBusinessLogicMixin
+    IndexInstanceBusinessLogicMixin, IndexInstanceNodeBusinessLogicMixin,
+    IndexInstanceRebuildBusinessLogicMixin
 )
 from .index_template_models import IndexTemplate, IndexTemplateNode
 
@@ -83,6 +87,97 @@ class IndexInstanceNode(IndexInstanceNodeBusinessLogicMixin, MPTTModel):
         )
 
 
+class IndexInstanceQueueEntry(models.Model):
+    """
+    Document waiting to be indexed in an index instance after an event
+    trigger. Each document is queued once per index instance regardless of
+    the number of events triggered while queued.
+    """
+    index_template = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='queue_entries',
+        to=IndexTemplate, verbose_name=_(message='Index template')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='index_instance_queue_entries',
+        to=Document, verbose_name=_(message='Document')
+    )
+    datetime_created = models.DateTimeField(
+        help_text=_(
+            message='The server date and time when the document was first '
+            'queued.'
+        ), verbose_name=_(message='Date time created')
+    )
+    datetime = models.DateTimeField(
+        db_index=True, help_text=_(
+            message='The server date and time when the document was last '
+            'queued.'
+        ), verbose_name=_(message='Date time')
+    )
+    event_count = models.PositiveIntegerField(
+        default=1, help_text=_(
+            message='Number of events that queued the document.'
+        ), verbose_name=_(message='Event count')
+    )
+
+    objects = IndexInstanceQueueEntryManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('index_template', 'document'),
+                name='document_indexing_queue_entry_unique'
+            )
+        ]
+        ordering = ('datetime',)
+        verbose_name = _(message='Index instance queue entry')
+        verbose_name_plural = _(message='Index instance queue entries')
+
+
+class IndexInstanceRebuild(
+    IndexInstanceRebuildBusinessLogicMixin, models.Model
+):
+    """
+    Keep track of the rebuild of an index instance. The nodes of the rebuild
+    are created under a separate root node that replaces the current root
+    node of the index instance once all the documents have been indexed.
+    """
+    index_template = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='index_instance_rebuild',
+        to=IndexTemplate, verbose_name=_(message='Index template')
+    )
+    index_instance_root_node = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='index_instance_rebuild',
+        to=IndexInstanceNode, verbose_name=_(message='Root node')
+    )
+    datetime_started = models.DateTimeField(
+        auto_now_add=True, verbose_name=_(message='Date and time started')
+    )
+    document_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Document count')
+    )
+    document_processed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Processed document count')
+    )
+    chunk_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Chunk count')
+    )
+    chunk_processed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Processed chunk count')
+    )
+    chunk_failed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_(message='Failed chunk count')
+    )
+
+    objects = IndexInstanceRebuildManager()
+
+    class Meta:
+        verbose_name = _(message='Index instance rebuild')
+        verbose_name_plural = _(message='Index instance rebuilds')
+
+    def __str__(self):
+        return str(self.index_template)
+
+
 class DocumentIndexInstanceNode(IndexInstanceNode):
     """
     Proxy model of node instance. It is used to represent the node instance
@@ -1,9 +1,17 @@
+import functools
+
 from django.apps import apps
+from django.utils.formats import localize
+from django.utils.timezone import localtime
+from django.utils.translation import gettext, gettext_lazy as _
 
 from mayan.apps.documents.models.document_models import Document
 from mayan.apps.events.classes import ModelEventType
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.templating.template_backends import Template
 
 from ..events import event_index_template_edited
+from ..literals import INDEX_TEMPLATE_NODE_TEMPLATE_CACHE_MAXIMUM_SIZE
 
 
 class IndexTemplateBusinessLogicMixin:
@@ -62,6 +70,44 @@ class IndexTemplateBusinessLogicMixin:
             ] or ['None']
         )
 
+    def get_rebuild_progress(self):
+        IndexInstanceRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceRebuild'
+        )
+
+        try:
+            index_instance_rebuild = IndexInstanceRebuild.objects.get(
+                index_template=self
+            )
+        except IndexInstanceRebuild.DoesNotExist:
+            return gettext(message='None')
+        else:
+            datetime_estimated_completion = index_instance_rebuild.get_datetime_estimated_completion()
+
+            if datetime_estimated_completion:
+                datetime_estimated_completion = localize(
+                    value=localtime(value=datetime_estimated_completion)
+                )
+            else:
+                datetime_estimated_completion = gettext(message='Unknown')
+
+            return gettext(
+                message='%(percent)d%%; %(document_processed_count)d of '
+                '%(document_count)d documents; estimated completion: '
+                '%(datetime)s'
+            ) % {
+                'datetime': datetime_estimated_completion,
+                'document_count': index_instance_rebuild.document_count,
+                'document_processed_count': index_instance_rebuild.document_processed_count,
+                'percent': index_instance_rebuild.get_progress_percent()
+            }
+
+    get_rebuild_progress.help_text = _(
+        message='Progress and estimated completion time of the rebuild in '
+        'progress.'
+    )
+    get_rebuild_progress.short_description = _(message='Rebuild')
+
     @property
     def index_template_root_node(self):
         """
@@ -71,30 +117,26 @@ class IndexTemplateBusinessLogicMixin:
 
     def rebuild(self):
         """
-        Delete and reconstruct the index by deleting of all its instance nodes
-        and recreating them for the documents whose types are associated with
-        this index
+        Reconstruct the index by indexing the documents whose types are
+        associated with this index under a new root node. The documents are
+        indexed in chunks by parallel tasks while the current nodes remain
+        in use. The current nodes are replaced once all the chunks are
+        processed.
         """
-        IndexInstance = apps.get_model(
-            app_label='document_indexing', model_name='IndexInstance'
+        IndexInstanceRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceRebuild'
         )
 
         if self.enabled:
-            self.delete_index_instance_nodes()
-
-            # Create the new root index instance node.
-            self.index_template_root_node.index_instance_nodes.create()
-
-            index_instance = IndexInstance.objects.get(pk=self.pk)
-            index_instance.index_instance_root_node
-            # Re-index each document with a type associated with this index.
-            queryset = Document.objects.filter(
-                document_type__in=self.document_types.all()
+            lock = LockingBackend.get_backend().acquire_lock(
+                name='indexing:index_template_rebuild_{}'.format(self.pk)
             )
-            for document in queryset:
-                # Evaluate each index template node for each document
-                # associated with this index.
-                index_instance.document_add(document=document)
+            try:
+                IndexInstanceRebuild.objects.do_rebuild_start(
+                    index_template=self
+                )
+            finally:
+                lock.release()
 
     def reset(self):
         self.delete_index_instance_nodes()
@@ -104,8 +146,29 @@ class IndexTemplateBusinessLogicMixin:
 
 
 class IndexTemplateNodeBusinessLogicMixin:
+    @staticmethod
+    @functools.lru_cache(maxsize=INDEX_TEMPLATE_NODE_TEMPLATE_CACHE_MAXIMUM_SIZE)
+    def _get_template(expression):
+        return Template(template_string=expression)
+
     def get_index_instance_root_node(self):
-        return self.index_instance_nodes.get(parent=None)
+        return self.index_instance_nodes.get(
+            index_instance_rebuild=None, parent=None
+        )
+
+    def get_template(self):
+        """
+        Return the compiled template of the expression. Templates are
+        compiled once per expression and shared by all the documents
+        indexed by the process. Editing the expression of a node causes
+        the new expression to be compiled on its next use.
+        """
+        return self._get_template(expression=self.expression)
 
     def initialize_index_instance_root_node(self):
-        self.index_instance_nodes.get_or_create(parent=None)
+        queryset = self.index_instance_nodes.filter(
+            index_instance_rebuild=None, parent=None
+        )
+
+        if not queryset.exists():
+            self.index_instance_nodes.create(parent=None)
@@ -1,8 +1,12 @@
+from datetime import timedelta
+
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b, worker_c
 
+from .literals import TASK_EVENT_TRIGGER_QUEUE_FLUSH_INTERVAL
+
 queue_indexing = CeleryQueue(
     label=_(message='Indexing'), name='indexing', worker=worker_b
 )
@@ -18,8 +22,22 @@ queue_indexing.add_task_type(
     label=_(message='Index document'),
     dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_document_add'
 )
+queue_indexing.add_task_type(
+    label=_(message='Index the documents queued by event triggers'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_queue_flush',
+    name='task_index_instance_queue_flush',
+    schedule=timedelta(seconds=TASK_EVENT_TRIGGER_QUEUE_FLUSH_INTERVAL)
+)
 
 queue_indexing_slow.add_task_type(
     label=_(message='Rebuild index'),
     dotted_path='mayan.apps.document_indexing.tasks.task_index_template_rebuild'
 )
+queue_indexing_slow.add_task_type(
+    label=_(message='Rebuild index chunk'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_rebuild_chunk'
+)
+queue_indexing_slow.add_task_type(
+    label=_(message='Finish index rebuild'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_instance_rebuild_finish'
+)
@@ -0,0 +1,54 @@
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.smart_settings.settings import setting_cluster
+
+from .literals import (
+    DEFAULT_DOCUMENT_INDEXING_DIFFERENTIAL_UPDATE,
+    DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_DELAY,
+    DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE,
+    DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE
+)
+
+setting_namespace = setting_cluster.do_namespace_add(
+    label=_(message='Document indexing'), name='document_indexing'
+)
+
+setting_differential_update = setting_namespace.do_setting_add(
+    choices=('false', 'true'),
+    default=DEFAULT_DOCUMENT_INDEXING_DIFFERENTIAL_UPDATE,
+    global_name='DOCUMENT_INDEXING_DIFFERENTIAL_UPDATE', help_text=_(
+        message='Update the index nodes of a document by comparing the '
+        'nodes resulting from the index templates with the nodes to which '
+        'the document is currently linked, changing only the links that '
+        'differ. When disabled, all the links of the document are deleted '
+        'and created again on each update.'
+    )
+)
+
+setting_event_trigger_queue_delay = setting_namespace.do_setting_add(
+    default=DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_DELAY,
+    global_name='DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_DELAY', help_text=_(
+        message='Time in seconds that a document must remain in the event '
+        'trigger queue without new events before it is indexed. All the '
+        'events triggered during this time result in a single indexing.'
+    )
+)
+
+setting_event_trigger_queue_enable = setting_namespace.do_setting_add(
+    choices=('false', 'true'),
+    default=DEFAULT_DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE,
+    global_name='DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE', help_text=_(
+        message='Collect the documents and indexes of the event triggers in '
+        'a deduplicated queue that is processed periodically instead of '
+        'indexing the document once per event.'
+    )
+)
+
+setting_rebuild_chunk_size = setting_namespace.do_setting_add(
+    default=DEFAULT_DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE,
+    global_name='DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE', help_text=_(
+        message='Number of documents indexed by each of the tasks into '
+        'which an index rebuild is divided. The tasks are processed in '
+        'parallel by the available workers.'
+    )
+)
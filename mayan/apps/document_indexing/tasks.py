@@ -1,7 +1,8 @@
 import logging
+import time
 
 from django.apps import apps
-from django.db import OperationalError
+from django.db import IntegrityError, OperationalError
 
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
@@ -16,7 +17,7 @@ logger = logging.getLogger(name=__name__)
     retry_backoff_max=60
 )
 def task_index_instance_document_add(
-    self, document_id, index_instance_id=None
+    self, document_id, datetime_queued=None, index_instance_id=None
 ):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
@@ -46,12 +47,26 @@ def task_index_instance_document_add(
                 '%s; %s', document, exception
             )
             raise self.retry(exc=exception)
+        except IntegrityError as exception:
+            # A node was deleted by a concurrent update after being
+            # selected. The update is idempotent and is retried.
+            logger.warning(
+                'Integrity error while trying to index document: '
+                '%s; %s', document, exception
+            )
+            raise self.retry(exc=exception)
         except LockError as exception:
             logger.warning(
                 'Unable to acquire lock for document %s; %s ',
                 document, exception
             )
             raise self.retry(exc=exception)
+        else:
+            if datetime_queued:
+                logger.info(
+                    'Indexed document %s, %.3f seconds after its first '
+                    'queued event', document, time.time() - datetime_queued
+                )
 
 
 @app.task(
@@ -82,6 +97,99 @@ def task_index_instance_document_remove(self, document_id):
             raise self.retry(exc=exception)
 
 
+@app.task(ignore_result=True)
+def task_index_instance_queue_flush():
+    IndexInstanceQueueEntry = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceQueueEntry'
+    )
+
+    entry_count, event_count, lag_maximum = IndexInstanceQueueEntry.objects.flush()
+
+    if entry_count:
+        logger.info(
+            'Dispatched %d queued documents for %d events, coalesced '
+            'events: %d, maximum queue time: %.3f seconds', entry_count,
+            event_count, event_count - entry_count,
+            lag_maximum.total_seconds()
+        )
+
+
+# Index instance rebuild
+
+@app.task(
+    bind=True, ignore_result=True, max_retries=None, retry_backoff=True,
+    retry_backoff_max=60
+)
+def task_index_instance_rebuild_chunk(
+    self, document_id_list, index_instance_rebuild_id
+):
+    IndexInstanceRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceRebuild'
+    )
+
+    try:
+        index_instance_rebuild = IndexInstanceRebuild.objects.get(
+            pk=index_instance_rebuild_id
+        )
+    except IndexInstanceRebuild.DoesNotExist:
+        """
+        The rebuild was cancelled by a newer rebuild or by an index reset.
+        """
+    else:
+        try:
+            index_instance_rebuild.do_chunk_process(
+                document_id_list=document_id_list
+            )
+        except OperationalError as exception:
+            logger.warning(
+                'Operational error while trying to process rebuild chunk '
+                'of index instance rebuild: %s; %s',
+                index_instance_rebuild, exception
+            )
+            raise self.retry(exc=exception)
+        except IntegrityError as exception:
+            # A node was created by a concurrent update of the rebuild.
+            # The chunk is idempotent and is retried.
+            logger.warning(
+                'Integrity error while trying to process rebuild chunk '
+                'of index instance rebuild: %s; %s',
+                index_instance_rebuild, exception
+            )
+            raise self.retry(exc=exception)
+        except Exception:
+            logger.error(
+                'Unexpected error while trying to process rebuild chunk of '
+                'index instance rebuild: %s', index_instance_rebuild
+            )
+            index_instance_rebuild.do_chunk_fail()
+            raise
+
+
+@app.task(
+    bind=True, ignore_result=True, max_retries=None, retry_backoff=True,
+    retry_backoff_max=60
+)
+def task_index_instance_rebuild_finish(self, index_instance_rebuild_id):
+    IndexInstanceRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceRebuild'
+    )
+
+    try:
+        index_instance_rebuild = IndexInstanceRebuild.objects.get(
+            pk=index_instance_rebuild_id
+        )
+    except IndexInstanceRebuild.DoesNotExist:
+        """
+        The rebuild was cancelled by a newer rebuild or by an index reset.
+        """
+    else:
+        try:
+            index_instance_rebuild.do_finish()
+        except LockError as exception:
+            # The index instance is being updated, retry later.
+            raise self.retry(exc=exception)
+
+
 # Index template
 
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
@@ -1,4 +1,7 @@
+from unittest import mock
+
 from django.db.utils import IntegrityError
+from django.test import override_settings
 
 from mayan.apps.documents.models.trashed_document_models import (
     TrashedDocument
@@ -10,13 +13,18 @@ from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_DOCUMENT_DESCRIPTION_EDITED,
     TEST_DOCUMENT_LABEL_EDITED
 )
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.metadata.models.document_type_metadata_type_models import (
     DocumentTypeMetadataType
 )
 from mayan.apps.metadata.models.metadata_type_models import MetadataType
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
 
+from ..literals import INDEX_INSTANCE_REBUILD_CHUNK_LOCK_RETRY_DELAY
 from ..models import (
-    IndexInstance, IndexInstanceNode, IndexTemplate, IndexTemplateNode
+    DocumentIndexInstanceNode, IndexInstance, IndexInstanceNode,
+    IndexInstanceRebuild, IndexTemplate, IndexTemplateNode
 )
 
 from .literals import (
@@ -375,6 +383,436 @@ class IndexInstanceTestCase(IndexTemplateTestMixin, GenericDocumentTestCase):
         )
 
 
+class IndexInstanceDifferentialUpdateTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    _test_index_template_node_expression = TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+
+    def _get_test_document_link_id_list(self):
+        return list(
+            IndexInstanceNode.documents.through.objects.filter(
+                document=self._test_document
+            ).values_list('pk', flat=True)
+        )
+
+    def test_document_update_changed_link(self):
+        test_index_instance_node = IndexInstanceNode.objects.get(
+            value=self._test_document.label
+        )
+
+        self._test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self._test_document.save()
+
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                pk=test_index_instance_node.pk
+            ).exists()
+        )
+        self.assertQuerySetEqual(
+            qs=self._test_document.index_instance_nodes.all(),
+            values=(
+                IndexInstanceNode.objects.get(
+                    value=TEST_DOCUMENT_LABEL_EDITED
+                ),
+            )
+        )
+
+    def test_document_update_unchanged_link(self):
+        test_index_instance_node = IndexInstanceNode.objects.get(
+            value=self._test_document.label
+        )
+        test_document_link_id_list = self._get_test_document_link_id_list()
+
+        self._test_index_instance.document_add(document=self._test_document)
+
+        self.assertEqual(
+            IndexInstanceNode.objects.get(value=self._test_document.label).pk,
+            test_index_instance_node.pk
+        )
+        self.assertEqual(
+            self._get_test_document_link_id_list(),
+            test_document_link_id_list
+        )
+
+    def test_document_update_unlinked_parent_node(self):
+        self._test_index_template_node.link_documents = False
+        self._test_index_template_node.save()
+
+        self._test_index_template.index_template_nodes.create(
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
+            link_documents=True, parent=self._test_index_template_node
+        )
+
+        self._test_index_instance.document_add(document=self._test_document)
+
+        self.assertEqual(
+            self._test_document.index_instance_nodes.count(), 0
+        )
+        self.assertEqual(IndexInstanceNode.objects.count(), 1)
+
+        self._test_document.description = TEST_DOCUMENT_DESCRIPTION
+        self._test_document.save()
+
+        test_index_instance_node = IndexInstanceNode.objects.get(
+            value=TEST_DOCUMENT_DESCRIPTION
+        )
+        self.assertEqual(
+            test_index_instance_node.parent.value, self._test_document.label
+        )
+        self.assertQuerySetEqual(
+            qs=self._test_document.index_instance_nodes.all(),
+            values=(test_index_instance_node,)
+        )
+
+
+class IndexInstanceConcurrencyTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    """
+    Hold the index instance lock as a concurrent update would and index
+    documents meanwhile.
+    """
+    _test_document_count = 25
+    _test_index_template_node_expression = TEST_INDEX_TEMPLATE_DOCUMENT_TYPE_EXPRESSION
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        for index in range(self._test_document_count):
+            self._create_test_document_stub()
+
+        self._test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+        self._test_index_instance_node = IndexInstanceNode.objects.get(
+            value=self._test_document_type.label
+        )
+        self._test_lock_list = []
+
+    def tearDown(self):
+        # Release the locks before the test documents are deleted.
+        for lock in self._test_lock_list:
+            lock.release()
+
+        super().tearDown()
+
+    def _acquire_test_lock(self, name):
+        self._test_lock_list.append(
+            LockingBackend.get_backend().acquire_lock(name=name)
+        )
+
+    def _acquire_test_index_instance_lock(self):
+        self._acquire_test_lock(
+            name=self._test_index_instance.get_lock_string()
+        )
+
+    def test_document_add_existing_node(self):
+        # Unlink all documents but the first one to keep the node.
+        IndexInstanceNode.documents.through.objects.exclude(
+            document=self._test_document_list[0]
+        ).delete()
+
+        self._acquire_test_index_instance_lock()
+
+        for test_document in self._test_document_list:
+            self._test_index_instance.document_add(document=test_document)
+
+        self.assertEqual(
+            self._test_index_instance_node.documents.count(),
+            self._test_document_count
+        )
+        self.assertEqual(IndexInstanceNode.objects.count(), 2)
+
+    def test_document_add_new_node(self):
+        self._test_index_template_node.expression = TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        self._test_index_template_node.save()
+
+        self._acquire_test_index_instance_lock()
+
+        with self.assertRaises(expected_exception=LockError):
+            self._test_index_instance.document_add(
+                document=self._test_document_list[0]
+            )
+
+    def test_document_add_root_node_missing(self):
+        self._test_index_instance.index_instance_root_node.delete()
+
+        self._acquire_test_index_instance_lock()
+
+        with self.assertRaises(expected_exception=LockError):
+            self._test_index_instance.document_add(
+                document=self._test_document_list[0]
+            )
+
+        self.assertEqual(IndexInstanceNode.objects.count(), 0)
+
+    def test_document_add_other_document_locked(self):
+        IndexInstanceNode.documents.through.objects.filter(
+            document=self._test_document_list[1]
+        ).delete()
+
+        self._acquire_test_lock(
+            name=self._test_index_instance.get_document_lock_string(
+                document=self._test_document_list[0]
+            )
+        )
+
+        self._test_index_instance.document_add(
+            document=self._test_document_list[1]
+        )
+
+        self.assertTrue(
+            self._test_document_list[1] in self._test_index_instance_node.documents.all()
+        )
+
+    def test_document_remove_unlink(self):
+        self._acquire_test_index_instance_lock()
+
+        with self.assertRaises(expected_exception=LockError):
+            self._test_index_instance.document_remove(
+                document=self._test_document_list[0]
+            )
+
+        # The link is removed before the empty nodes are deleted.
+        self.assertFalse(
+            self._test_document_list[0] in self._test_index_instance_node.documents.all()
+        )
+
+
+@override_settings(DOCUMENT_INDEXING_DIFFERENTIAL_UPDATE=False)
+class IndexInstanceNonDifferentialUpdateTestCase(
+    SettingOverrideTestMixin, IndexInstanceTestCase
+):
+    def test_document_update_unchanged_link(self):
+        self._create_test_index_template_node(
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        )
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+
+        self._test_index_template.rebuild()
+
+        test_document_link_queryset = IndexInstanceNode.documents.through.objects.filter(
+            document=self._test_document
+        )
+        test_document_link = test_document_link_queryset.get()
+
+        test_index_instance.document_add(document=self._test_document)
+
+        self.assertNotEqual(
+            test_document_link_queryset.get().pk, test_document_link.pk
+        )
+
+
+@override_settings(DOCUMENT_INDEXING_REBUILD_CHUNK_SIZE=1)
+class IndexInstanceRebuildTestCase(
+    SettingOverrideTestMixin, IndexTemplateTestMixin,
+    GenericDocumentTestCase
+):
+    _test_index_template_node_expression = TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+
+    def _create_test_index_instance_rebuild(self):
+        self._test_index_instance_rebuild = IndexInstanceRebuild.objects.create(
+            chunk_count=1, document_count=len(self._test_document_list),
+            index_instance_root_node=IndexInstanceNode.objects.create(
+                index_template_node=self._test_index_template_root_node,
+                parent=None
+            ), index_template=self._test_index_template
+        )
+
+    def _get_test_index_instance_root_node_value_set(self):
+        return set(
+            self._test_index_instance.index_instance_root_node.get_children().values_list(
+                'value', flat=True
+            )
+        )
+
+    def test_method_get_rebuild_progress(self):
+        self.assertEqual(
+            self._test_index_template.get_rebuild_progress(), 'None'
+        )
+
+        self._create_test_index_instance_rebuild()
+        self._test_index_instance_rebuild.document_processed_count = 1
+        self._test_index_instance_rebuild.save()
+
+        self.assertTrue(
+            self._test_index_template.get_rebuild_progress().startswith(
+                '50%; 1 of 2 documents'
+            )
+        )
+
+    def test_rebuild(self):
+        test_index_instance_root_node = self._test_index_instance.index_instance_root_node
+
+        self._test_index_template.rebuild()
+
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                pk=test_index_instance_root_node.pk
+            ).exists()
+        )
+        self.assertEqual(IndexInstanceRebuild.objects.count(), 0)
+        self.assertEqual(
+            self._get_test_index_instance_root_node_value_set(), {
+                self._test_document_list[0].label,
+                self._test_document_list[1].label
+            }
+        )
+        self.assertEqual(
+            self._test_index_instance.get_descendants_count(), 2
+        )
+
+    def test_rebuild_cancel(self):
+        self._create_test_index_instance_rebuild()
+
+        self._test_index_template.rebuild()
+
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                pk=self._test_index_instance_rebuild.index_instance_root_node.pk
+            ).exists()
+        )
+        self.assertEqual(IndexInstanceRebuild.objects.count(), 0)
+        self.assertEqual(
+            self._get_test_index_instance_root_node_value_set(), {
+                self._test_document_list[0].label,
+                self._test_document_list[1].label
+            }
+        )
+
+    def test_rebuild_chunk_document_locked(self):
+        self._create_test_index_instance_rebuild()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self._test_index_instance.get_document_lock_string(
+                document=self._test_document_list[0]
+            )
+        )
+
+        try:
+            with mock.patch.object(
+                IndexInstanceRebuild, 'do_chunk_queue'
+            ) as mock_do_chunk_queue:
+                self._test_index_instance_rebuild.do_chunk_process(
+                    document_id_list=[
+                        test_document.pk for test_document in self._test_document_list
+                    ]
+                )
+        finally:
+            lock.release()
+
+        mock_do_chunk_queue.assert_called_once_with(
+            countdown=INDEX_INSTANCE_REBUILD_CHUNK_LOCK_RETRY_DELAY,
+            document_id_list=[self._test_document_list[0].pk]
+        )
+
+        self._test_index_instance_rebuild.refresh_from_db()
+        self.assertEqual(
+            self._test_index_instance_rebuild.chunk_processed_count, 0
+        )
+        self.assertEqual(
+            self._test_index_instance_rebuild.document_processed_count, 1
+        )
+        self.assertEqual(
+            set(
+                self._test_index_instance_rebuild.index_instance_root_node.children.values_list(
+                    'value', flat=True
+                )
+            ), {self._test_document_list[1].label}
+        )
+
+    def test_rebuild_chunk_fail(self):
+        self._create_test_index_instance_rebuild()
+        self._test_index_instance_rebuild.chunk_count = 2
+        self._test_index_instance_rebuild.save()
+
+        test_index_instance_root_node = self._test_index_instance.index_instance_root_node
+        test_index_instance_rebuild_root_node = self._test_index_instance_rebuild.index_instance_root_node
+
+        self._test_index_instance_rebuild.do_chunk_fail()
+
+        self._test_index_instance_rebuild.refresh_from_db()
+        self.assertEqual(
+            self._test_index_instance_rebuild.chunk_failed_count, 1
+        )
+
+        self._test_index_instance_rebuild.do_chunk_process(
+            document_id_list=[
+                test_document.pk for test_document in self._test_document_list
+            ]
+        )
+
+        self.assertEqual(IndexInstanceRebuild.objects.count(), 0)
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                pk=test_index_instance_rebuild_root_node.pk
+            ).exists()
+        )
+        self.assertEqual(
+            self._test_index_instance.index_instance_root_node.pk,
+            test_index_instance_root_node.pk
+        )
+
+    def test_rebuild_in_progress_document_update(self):
+        self._create_test_index_instance_rebuild()
+        test_index_instance_rebuild_root_node = self._test_index_instance_rebuild.index_instance_root_node
+
+        self._test_document_list[0].label = TEST_DOCUMENT_LABEL_EDITED
+        self._test_document_list[0].save()
+
+        self.assertTrue(
+            test_index_instance_rebuild_root_node.children.filter(
+                documents=self._test_document_list[0],
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).exists()
+        )
+        self.assertQuerySetEqual(
+            qs=DocumentIndexInstanceNode.objects.get_for(
+                document=self._test_document_list[0]
+            ), values=(
+                self._test_index_instance.index_instance_root_node.children.get(
+                    value=TEST_DOCUMENT_LABEL_EDITED
+                ),
+            )
+        )
+
+        self._test_index_instance_rebuild.do_chunk_process(
+            document_id_list=[
+                test_document.pk for test_document in self._test_document_list
+            ]
+        )
+
+        self.assertEqual(IndexInstanceRebuild.objects.count(), 0)
+        self.assertEqual(
+            self._test_index_instance.index_instance_root_node.pk,
+            test_index_instance_rebuild_root_node.pk
+        )
+        self.assertEqual(
+            self._get_test_index_instance_root_node_value_set(), {
+                TEST_DOCUMENT_LABEL_EDITED, self._test_document_list[1].label
+            }
+        )
+
+
 class IndexIntegrityTestCase(
     IndexTemplateTestMixin, GenericTransactionDocumentTestCase
 ):
@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest import mock
+
+from kombu.exceptions import OperationalError
+
+from django.test import override_settings
+from django.utils.timezone import now
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import TEST_DOCUMENT_LABEL_EDITED
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
+
+from ..models import IndexInstanceNode, IndexInstanceQueueEntry
+
+from .literals import TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+from .mixins.index_template_mixins import IndexTemplateTestMixin
+
+
+@override_settings(
+    DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_DELAY=0,
+    DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE=True
+)
+class IndexInstanceQueueEntryModelTestCase(
+    SettingOverrideTestMixin, IndexTemplateTestMixin,
+    GenericDocumentTestCase
+):
+    _test_index_template_node_expression = TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+
+    def _get_test_document_queue_entry_queryset(self):
+        return IndexInstanceQueueEntry.objects.filter(
+            document=self._test_document,
+            index_template=self._test_index_template
+        )
+
+    def _edit_test_document(self):
+        self._test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self._test_document.save()
+
+    def test_enqueue(self):
+        self._edit_test_document()
+
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().count(), 1
+        )
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).exists()
+        )
+
+    def test_enqueue_deduplication(self):
+        self._edit_test_document()
+        test_event_count = self._get_test_document_queue_entry_queryset().get().event_count
+
+        self._test_document.save()
+        self._test_document.save()
+
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().count(), 1
+        )
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().get().event_count,
+            test_event_count * 3
+        )
+
+    def test_flush(self):
+        self._edit_test_document()
+        test_event_count = self._get_test_document_queue_entry_queryset().get().event_count
+
+        entry_count, event_count, lag_maximum = IndexInstanceQueueEntry.objects.flush()
+
+        self.assertEqual(entry_count, 1)
+        self.assertEqual(event_count, test_event_count)
+        self.assertTrue(lag_maximum >= timedelta(0))
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().count(), 0
+        )
+        self.assertQuerySetEqual(
+            qs=IndexInstanceNode.objects.get(
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).documents.all(), values=(self._test_document,)
+        )
+
+    def test_flush_dispatch_error(self):
+        self._edit_test_document()
+
+        with mock.patch(
+            side_effect=OperationalError,
+            target='mayan.apps.document_indexing.tasks.task_index_instance_document_add.apply_async'
+        ):
+            with self.assertRaises(expected_exception=OperationalError):
+                IndexInstanceQueueEntry.objects.flush()
+
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().count(), 1
+        )
+        self.assertFalse(
+            IndexInstanceNode.objects.filter(
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).exists()
+        )
+
+    def test_flush_delay(self):
+        self._edit_test_document()
+        self._get_test_document_queue_entry_queryset().update(
+            datetime=now() + timedelta(hours=1)
+        )
+
+        entry_count, event_count, lag_maximum = IndexInstanceQueueEntry.objects.flush()
+
+        self.assertEqual(entry_count, 0)
+        self.assertEqual(
+            self._get_test_document_queue_entry_queryset().count(), 1
+        )
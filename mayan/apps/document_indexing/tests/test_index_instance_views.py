@@ -1,6 +1,10 @@
+from django.test import override_settings
+
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.tests.base import GenericDocumentViewTestCase
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
 
+from ..models import IndexInstanceNode
 from ..permissions import permission_index_instance_view
 
 from .literals import TEST_INDEX_TEMPLATE_LABEL
@@ -254,3 +258,50 @@ class IndexInstanceViewTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+@override_settings(VIEWS_PAGINATION_CURSOR_ENABLE=True)
+class IndexInstanceCursorPaginationViewTestCase(
+    IndexInstanceViewTestMixin, SettingOverrideTestMixin,
+    GenericDocumentViewTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._populate_test_index_instance_node()
+
+        index_template_node = self._test_index_instance_node.index_template_node
+
+        for value in ('c', 'a', 'b'):
+            IndexInstanceNode.objects.create(
+                index_template_node=index_template_node,
+                parent=self._test_index_instance_root_node, value=value
+            )
+
+    def test_index_instance_root_node_view_cursor_pagination_enabled(self):
+        self.grant_access(
+            obj=self._test_index_template,
+            permission=permission_index_instance_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_index_instance_node_view(
+            index_instance_node=self._test_index_instance_root_node
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertFalse('pagination_cursor_enabled' in response.context)
+        self.assertEqual(
+            list(response.context['object_list']),
+            list(
+                self._test_index_instance_root_node.get_children().order_by(
+                    'value'
+                )
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
@@ -1,5 +1,6 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
+from .literals import TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
 from .mixins.index_template_mixins import IndexTemplateTestMixin
 
 
@@ -17,3 +18,23 @@ class IndexTemplateTestCase(IndexTemplateTestMixin, GenericDocumentTestCase):
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class IndexTemplateNodeTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def test_method_get_template(self):
+        test_template = self._test_index_template_node.get_template()
+
+        self.assertIs(
+            self._test_index_template_node.get_template(), test_template
+        )
+
+        self._test_index_template_node.expression = TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION
+        self._test_index_template_node.save()
+
+        self.assertIsNot(
+            self._test_index_template_node.get_template(), test_template
+        )
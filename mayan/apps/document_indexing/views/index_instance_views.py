@@ -50,6 +50,8 @@ class IndexInstanceListView(SingleObjectListView):
 
 
 class IndexInstanceNodeView(DocumentListView):
+    # The child nodes are listed by value.
+    pagination_cursor_ordering = None
     template_name = 'document_indexing/node_details.html'
     view_icon = icon_index_instance_node_with_documents
 
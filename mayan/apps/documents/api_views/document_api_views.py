@@ -80,6 +80,7 @@ class APIDocumentListView(generics.ListCreateAPIView):
     post: Create a new document.
     """
     mayan_object_permission_map = {'GET': permission_document_view}
+    pagination_cursor_ordering = '-pk'
     serializer_class = DocumentSerializer
     source_queryset = Document.valid.all()
 
@@ -122,6 +122,15 @@ class APIDocumentFilePageImageView(
     lookup_url_kwarg = 'document_file_page_id'
     mayan_object_permission_map = {'GET': permission_document_file_view}
 
+    def get_image_cache_filename(
+        self, maximum_layer_order, transformation_instance_list, user
+    ):
+        return self.obj.get_combined_cache_filename(
+            maximum_layer_order=maximum_layer_order,
+            transformation_instance_list=transformation_instance_list,
+            user=user
+        )
+
     def get_source_queryset(self):
         document_file = self.get_document_file()
         return document_file.pages.all()
@@ -52,6 +52,7 @@ class APITrashedDocumentListView(generics.ListAPIView):
     get: Returns a list of all the trashed documents.
     """
     mayan_object_permission_map = {'GET': permission_document_view}
+    pagination_cursor_ordering = '-pk'
     serializer_class = TrashedDocumentSerializer
     source_queryset = TrashedDocument.objects.all()
 
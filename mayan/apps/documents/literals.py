@@ -76,7 +76,12 @@ DEFAULT_LANGUAGE_CODES = (
 )
 DEFAULT_DOCUMENT_STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 
+DOCUMENT_FILE_CACHE_FILENAME_INTERMEDIATE_FILE = 'intermediate_file'
+DOCUMENT_FILE_INTERMEDIATE_FILE_MIME_TYPE = 'application/pdf'
+DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE = 'base_image'
 DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE = 100
+DOCUMENT_FILE_PAGE_IMAGE_GENERATE_BATCH_SIZE = 50
+DOCUMENT_FILE_PAGE_IMAGE_GENERATE_WINDOW_SIZE = 10
 DOCUMENT_VERSION_PAGE_CREATE_BATCH_SIZE = 100
 
 ERROR_LOG_DOMAIN_NAME = 'documents'
@@ -20,11 +20,16 @@ from mayan.apps.events.event_managers import EventManagerMethodAfter
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.storage.model_mixins import ModelMixinFileFieldOpen
+from mayan.apps.storage.utils import TemporaryFile
 
 from ..classes import DocumentFileAction
 from ..events import event_document_file_created, event_document_file_edited
 from ..literals import (
-    DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE, ERROR_LOG_DOMAIN_NAME,
+    DOCUMENT_FILE_CACHE_FILENAME_INTERMEDIATE_FILE,
+    DOCUMENT_FILE_INTERMEDIATE_FILE_MIME_TYPE,
+    DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE,
+    DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE,
+    DOCUMENT_FILE_PAGE_IMAGE_GENERATE_BATCH_SIZE, ERROR_LOG_DOMAIN_NAME,
     IMAGE_ERROR_DOCUMENT_FILE_HAS_NO_PAGES,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE
 )
@@ -129,22 +134,10 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         actor = getattr(self, '_event_actor', None)
 
         try:
-            self.checksum_update(save=False)
+            self.introspect(save=False)
             super().save(
-                update_fields=('checksum',)
+                update_fields=('checksum', 'encoding', 'mimetype', 'size')
             )
-
-            self.mimetype_update(save=False)
-            super().save(
-                update_fields=('encoding', 'mimetype',)
-            )
-
-            self.size_update(save=False)
-            super().save(
-                update_fields=('size',)
-            )
-
-            self.page_count_update(save=False)
         except Exception as exception:
             logger.error(
                 'Error introspecting new document file for document '
@@ -158,29 +151,32 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
             self.upload_complete()
 
+    def _execute_pre_open_hooks(self, file_object):
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        result = DocumentFile._execute_hooks(
+            hook_list=DocumentFile._pre_open_hooks,
+            instance=self, file_object=file_object
+        )
+
+        if result:
+            return result['file_object']
+        else:
+            return file_object
+
     def _open(self, raw=False, **kwargs):
         """
         Return a file descriptor to a document file's file irrespective of
         the storage backend.
         """
-        DocumentFile = apps.get_model(
-            app_label='documents', model_name='DocumentFile'
-        )
-
         if raw:
             return self.file.storage.open(**kwargs)
         else:
             file_object = self.file.storage.open(**kwargs)
 
-            result = DocumentFile._execute_hooks(
-                hook_list=DocumentFile._pre_open_hooks,
-                instance=self, file_object=file_object
-            )
-
-            if result:
-                return result['file_object']
-            else:
-                return file_object
+            return self._execute_pre_open_hooks(file_object=file_object)
 
     @method_event(
         action_object='document',
@@ -322,7 +318,7 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         return self.document.files.exclude(pk=self.pk).order_by('timestamp').only('id').last()
 
     def get_intermediate_file(self):
-        cache_filename = 'intermediate_file'
+        cache_filename = DOCUMENT_FILE_CACHE_FILENAME_INTERMEDIATE_FILE
 
         try:
             cache_file = self.cache_partition.get_file(
@@ -334,7 +330,9 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
             try:
                 with self.open() as file_object:
                     converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
+                        file_object=file_object,
+                        mime_type=self.mimetype or None,
+                        mime_type_cache_key=self.checksum or None
                     )
                     with converter.to_pdf() as pdf_file_object:
                         with self.cache_partition.create_file(filename=cache_filename) as file_object:
@@ -363,6 +361,21 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
             logger.debug(msg='Intermediate file found.')
             return cache_file.open()
 
+    def get_intermediate_file_mime_type(self):
+        """
+        Return the MIME type of the intermediate file without inspecting
+        its content. Converted document files have a PDF intermediate file,
+        the rest use the document file itself.
+        """
+        queryset_files = self.cache_partition.files.filter(
+            filename=DOCUMENT_FILE_CACHE_FILENAME_INTERMEDIATE_FILE
+        )
+
+        if queryset_files.exists():
+            return DOCUMENT_FILE_INTERMEDIATE_FILE_MIME_TYPE
+        else:
+            return self.mimetype or None
+
     def get_label(self):
         return self.filename
     get_label.short_description = _(message='Label')
@@ -382,6 +395,74 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
     get_size_display.short_description = _(message='Size')
 
+    def introspect(self, save=True, user=None):
+        """
+        Update the checksum, size, MIME type and page count of the document
+        file reading the stored file only once. The stored file is copied
+        to a local temporary file while the checksum is calculated. The
+        MIME type and page count are then detected from the local copy. The
+        size is the size reported by the storage, as with `size_update`.
+        When saving, all the updated fields are committed with a single
+        save.
+        """
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        if not self.exists():
+            return
+
+        block_size = setting_hash_block_size.value
+        if block_size == 0:
+            block_size = -1
+
+        hash_object = DocumentFile.hash_function()
+
+        with TemporaryFile() as local_file_object:
+            with self.open(raw=True) as file_object:
+                while (True):
+                    data = file_object.read(block_size)
+                    if not data:
+                        break
+
+                    hash_object.update(data)
+                    local_file_object.write(data)
+
+            self.checksum = str(
+                hash_object.hexdigest()
+            )
+            self.size_update(save=False)
+
+            local_file_object.seek(0)
+
+            file_object = self._execute_pre_open_hooks(
+                file_object=local_file_object
+            )
+
+            try:
+                mimetype_backend = MIMETypeBackend.get_backend_instance()
+                self.mimetype, self.encoding = mimetype_backend.get_mime_type(
+                    file_object=file_object
+                )
+            except Exception:
+                self.encoding = ''
+                self.mimetype = ''
+
+            file_object.seek(0)
+
+            page_count = self.page_count_update(
+                file_object=file_object, save=False, user=user
+            )
+
+            if file_object is not local_file_object:
+                file_object.close()
+
+        if save:
+            self._event_actor = user
+            self.save()
+
+        return page_count
+
     @property
     def is_in_trash(self):
         return self.document.is_in_trash
@@ -407,14 +488,24 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
                         update_fields=('encoding', 'mimetype')
                     )
 
-    def page_count_update(self, save=True, user=None):
-        try:
+    def page_count_update(self, file_object=None, save=True, user=None):
+        """
+        Detect the number of pages of the document file and recreate its
+        pages. An already open file object can be passed to avoid opening
+        the stored file again.
+        """
+        if file_object is None:
             with self.open() as file_object:
-                converter_class = ConverterBase.get_converter_class()
-                converter = converter_class(
-                    file_object=file_object, mime_type=self.mimetype
+                return self.page_count_update(
+                    file_object=file_object, save=save, user=user
                 )
-                detected_pages = converter.get_page_count()
+
+        try:
+            converter_class = ConverterBase.get_converter_class()
+            converter = converter_class(
+                file_object=file_object, mime_type=self.mimetype
+            )
+            detected_pages = converter.get_page_count()
         except PageCountError as exception:
             """Converter backend doesn't understand the format."""
             self.error_log.create(
@@ -477,6 +568,98 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
     def pages_first(self):
         return self.pages.first()
 
+    def pages_image_cache_generate(
+        self, page_number_first=None, page_number_last=None
+    ):
+        """
+        Rasterize the pages of the document file in batches and store the
+        base image of each page in its cache partition. A batch is
+        converted with a single pass of the converter backend instead of
+        once per page. Pages with an existing base image are skipped.
+        Returns the number of page images generated.
+        """
+        queryset_pages = self.file_pages.all()
+
+        if page_number_first is not None:
+            queryset_pages = queryset_pages.filter(
+                page_number__gte=page_number_first
+            )
+
+        if page_number_last is not None:
+            queryset_pages = queryset_pages.filter(
+                page_number__lte=page_number_last
+            )
+
+        page_dictionary = {page.uuid: page for page in queryset_pages}
+
+        queryset_cached_partition_names = CachePartitionFile.objects.filter(
+            filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE,
+            partition__cache=self.cache,
+            partition__name__in=page_dictionary.keys()
+        ).values_list('partition__name', flat=True)
+
+        cached_partition_names = set(queryset_cached_partition_names)
+
+        pages_missing = {
+            page.page_number: page for uuid, page in page_dictionary.items()
+            if uuid not in cached_partition_names
+        }
+
+        if not pages_missing:
+            return 0
+
+        # Split the missing pages in runs of consecutive page numbers no
+        # longer than the batch size to avoid rasterizing cached pages.
+        page_number_run_list = []
+
+        for page_number in sorted(pages_missing):
+            if page_number_run_list:
+                page_number_run = page_number_run_list[-1]
+
+                is_consecutive = page_number == page_number_run[-1] + 1
+                is_full = len(page_number_run) >= DOCUMENT_FILE_PAGE_IMAGE_GENERATE_BATCH_SIZE
+
+                if is_consecutive and not is_full:
+                    page_number_run.append(page_number)
+                    continue
+
+            page_number_run_list.append(
+                [page_number]
+            )
+
+        generated_count = 0
+
+        with self.get_intermediate_file() as file_object:
+            converter_class = ConverterBase.get_converter_class()
+            converter = converter_class(
+                file_object=file_object,
+                mime_type=self.get_intermediate_file_mime_type(),
+                mime_type_cache_key=self.checksum or None
+            )
+
+            for page_number_run in page_number_run_list:
+                iterator_page_images = converter.get_page_many(
+                    page_number_first=page_number_run[0] - 1,
+                    page_number_last=page_number_run[-1] - 1
+                )
+
+                for page_number, page_image in iterator_page_images:
+                    page = pages_missing[page_number + 1]
+
+                    if not page.base_image_cache_store(page_image=page_image):
+                        # Stored or being stored by another process since
+                        # the batch started.
+                        continue
+
+                    generated_count += 1
+
+        logger.debug(
+            'Generated %d page images for document file: %s',
+            generated_count, self
+        )
+
+        return generated_count
+
     def save_to_file(self, file_object):
         """
         Save a copy of the document from the document storage backend
@@ -6,16 +6,19 @@ from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.converter.classes import ConverterBase, ImageGenerationFlight
 from mayan.apps.converter.exceptions import AppImageError
 from mayan.apps.converter.models import LayerTransformation
 from mayan.apps.converter.settings import setting_image_generation_timeout
 from mayan.apps.converter.transformations import BaseTransformation
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
 from ..literals import (
-    ERROR_LOG_DOMAIN_NAME, IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
+    DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE,
+    DOCUMENT_FILE_PAGE_IMAGE_GENERATE_WINDOW_SIZE, ERROR_LOG_DOMAIN_NAME,
+    IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
 )
 
 logger = logging.getLogger(name=__name__)
@@ -29,6 +32,68 @@ class DocumentFilePageBusinessLogicMixin:
         )
         return partition
 
+    def base_image_cache_store(self, page_image):
+        """
+        Store the base image of the page in the cache partition. The base
+        image lock serializes the image generation and the batch cache
+        warming. Returns False if the image is already stored or is being
+        stored by another process.
+        """
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name='document_file_page_base_image_{}'.format(self.pk),
+                timeout=setting_image_generation_timeout.value
+            )
+        except LockError:
+            return False
+        else:
+            try:
+                if self.cache_partition.files.filter(filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE).exists():
+                    return False
+
+                # Since open "wb+" doesn't create files, create it
+                # explicitly.
+                with self.cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE) as file_object:
+                    file_object.write(
+                        page_image.getvalue()
+                    )
+
+                return True
+            finally:
+                lock.release()
+
+    def base_image_window_cache_generate(self):
+        """
+        Rasterize the base images of the window of neighbouring pages that
+        includes this page with a single pass of the converter, so that the
+        next pages requested, like by the OCR of each page, are already
+        cached. Windows are aligned to their size for their pages to share
+        the window lock. Raises LockError if the window is being generated
+        by another process. Returns True if the base image of this page is
+        stored.
+        """
+        window_size = DOCUMENT_FILE_PAGE_IMAGE_GENERATE_WINDOW_SIZE
+        page_number_first = (
+            self.page_number - 1
+        ) // window_size * window_size + 1
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name='document_file_page_image_window_{}_{}'.format(
+                self.document_file_id, page_number_first
+            ), timeout=setting_image_generation_timeout.value
+        )
+        try:
+            self.document_file.pages_image_cache_generate(
+                page_number_first=page_number_first,
+                page_number_last=page_number_first + window_size - 1
+            )
+        finally:
+            lock.release()
+
+        return self.cache_partition.files.filter(
+            filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+        ).exists()
+
     def generate_image(
         self, user=None, _acquire_lock=True,
         transformation_instance_list=None, maximum_layer_order=None
@@ -46,46 +111,58 @@ class DocumentFilePageBusinessLogicMixin:
             'transformations cache filename: %s', combined_cache_filename
         )
 
-        try:
-            if _acquire_lock:
-                lock_name = self.get_lock_name(
-                    _combined_cache_filename=combined_cache_filename
-                )
-                lock = LockingBackend.get_backend().acquire_lock(
-                    name=lock_name,
-                    timeout=setting_image_generation_timeout.value
-                )
-        except Exception:
-            raise
-        else:
-            # Second try block to release the lock even on fatal errors inside
-            # the block.
+        is_cached = ImageGenerationFlight.is_cached(
+            cache_partition=self.cache_partition,
+            filename=combined_cache_filename
+        )
+        if is_cached:
+            return combined_cache_filename
+
+        lock_name = self.get_lock_name(
+            _combined_cache_filename=combined_cache_filename
+        )
+
+        with ImageGenerationFlight.acquire(key=lock_name):
             try:
-                try:
-                    self.cache_partition.get_file(
-                        filename=combined_cache_filename
-                    )
-                except CachePartitionFile.DoesNotExist:
-                    logger.debug(
-                        'transformations cache file "%s" not found',
-                        combined_cache_filename
-                    )
-                    image = self.get_image(
-                        transformation_instance_list=combined_transformation_list
+                if _acquire_lock:
+                    lock = LockingBackend.get_backend().acquire_lock(
+                        name=lock_name,
+                        timeout=setting_image_generation_timeout.value
                     )
-                    with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
-                        file_object.write(
-                            image.getvalue()
+            except Exception:
+                raise
+            else:
+                # Second try block to release the lock even on fatal errors
+                # inside the block.
+                try:
+                    try:
+                        self.cache_partition.get_file(
+                            filename=combined_cache_filename
                         )
-                else:
-                    logger.debug(
-                        'transformations cache file "%s" found', combined_cache_filename
-                    )
+                    except CachePartitionFile.DoesNotExist:
+                        logger.debug(
+                            'transformations cache file "%s" not found',
+                            combined_cache_filename
+                        )
+                        ImageGenerationFlight.count(name='miss')
+                        image = self.get_image(
+                            transformation_instance_list=combined_transformation_list
+                        )
+                        with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
+                            file_object.write(
+                                image.getvalue()
+                            )
+                    else:
+                        logger.debug(
+                            'transformations cache file "%s" generated while '
+                            'waiting for the lock', combined_cache_filename
+                        )
+                        ImageGenerationFlight.count(name='collision')
 
-                return combined_cache_filename
-            finally:
-                if _acquire_lock:
-                    lock.release()
+                    return combined_cache_filename
+                finally:
+                    if _acquire_lock:
+                        lock.release()
 
     def get_api_image_url(
         self, maximum_layer_order=None, transformation_instance_list=None,
@@ -173,7 +250,7 @@ class DocumentFilePageBusinessLogicMixin:
         return result
 
     def get_image(self, transformation_instance_list=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
@@ -181,11 +258,29 @@ class DocumentFilePageBusinessLogicMixin:
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache file "%s" not found', cache_filename)
 
+            try:
+                is_generated = self.base_image_window_cache_generate()
+            except LockError:
+                raise
+            except Exception as exception:
+                # Not fatal, the page image is generated individually.
+                logger.warning(
+                    'Unable to generate the page images window of page: %s; '
+                    '%s', self, exception, exc_info=True
+                )
+            else:
+                if is_generated:
+                    return self.get_image(
+                        transformation_instance_list=transformation_instance_list
+                    )
+
             try:
                 with self.document_file.get_intermediate_file() as file_object:
                     converter_class = ConverterBase.get_converter_class()
                     converter_instance = converter_class(
-                        file_object=file_object
+                        file_object=file_object,
+                        mime_type=self.document_file.get_intermediate_file_mime_type(),
+                        mime_type_cache_key=self.document_file.checksum or None
                     )
                     converter_instance.seek_page(
                         page_number=self.page_number - 1
@@ -193,12 +288,7 @@ class DocumentFilePageBusinessLogicMixin:
 
                     page_image = converter_instance.get_page()
 
-                    # Since open "wb+" doesn't create files, create it
-                    # explicitly.
-                    with self.cache_partition.create_file(filename=cache_filename) as file_object:
-                        file_object.write(
-                            page_image.getvalue()
-                        )
+                    self.base_image_cache_store(page_image=page_image)
 
                     # Apply runtime transformations.
                     for transformation in transformation_instance_list or ():
@@ -227,7 +317,9 @@ class DocumentFilePageBusinessLogicMixin:
             with cache_file.open() as file_object:
                 converter_class = ConverterBase.get_converter_class()
                 converter_instance = converter_class(
-                    file_object=file_object
+                    file_object=file_object,
+                    mime_type=ConverterBase.get_output_content_type(),
+                    mime_type_cache_key=cache_file.get_mime_type_cache_key()
                 )
 
                 converter_instance.seek_page(page_number=0)
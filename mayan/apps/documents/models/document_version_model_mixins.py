@@ -216,6 +216,73 @@ class DocumentVersionBusinessLogicMixin:
     def pages_first(self):
         return self.pages.first()
 
+    def pages_image_cache_generate(self, document_version_page_list=None):
+        """
+        Generate the base images of the document file pages mapped to this
+        version, or to the version pages of `document_version_page_list`,
+        in batches of consecutive pages of each document file. Returns the
+        number of page images generated.
+        """
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+
+        document_file_page_content_type = ContentType.objects.get_for_model(
+            model=DocumentFilePage
+        )
+
+        queryset_version_pages = self.version_pages.filter(
+            content_type=document_file_page_content_type
+        )
+
+        if document_version_page_list is not None:
+            queryset_version_pages = queryset_version_pages.filter(
+                pk__in=[
+                    document_version_page.pk for document_version_page in document_version_page_list
+                ]
+            )
+
+        queryset_document_file_pages = DocumentFilePage.objects.filter(
+            pk__in=queryset_version_pages.values('object_id')
+        ).order_by('document_file', 'page_number').values_list(
+            'document_file', 'page_number'
+        )
+
+        # List of document file ID, first and last page number of each run
+        # of consecutive document file pages.
+        page_run_list = []
+
+        for document_file_id, page_number in queryset_document_file_pages:
+            if page_run_list:
+                page_run = page_run_list[-1]
+
+                if page_run[0] == document_file_id and page_run[2] == page_number - 1:
+                    page_run[2] = page_number
+                    continue
+
+            page_run_list.append(
+                [document_file_id, page_number, page_number]
+            )
+
+        document_file_dictionary = DocumentFile.objects.in_bulk(
+            id_list={page_run[0] for page_run in page_run_list}
+        )
+
+        generated_count = 0
+
+        for document_file_id, page_number_first, page_number_last in page_run_list:
+            document_file = document_file_dictionary[document_file_id]
+
+            generated_count += document_file.pages_image_cache_generate(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+
+        return generated_count
+
     @method_event(
         action_object='document',
         event_manager_class=EventManagerMethodAfter,
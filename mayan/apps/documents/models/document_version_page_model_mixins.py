@@ -6,13 +6,14 @@ from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.converter.classes import ConverterBase, ImageGenerationFlight
 from mayan.apps.converter.exceptions import AppImageError
 from mayan.apps.converter.models import LayerTransformation
 from mayan.apps.converter.settings import setting_image_generation_timeout
 from mayan.apps.converter.transformations import BaseTransformation
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
 from ..literals import IMAGE_ERROR_DOCUMENT_VERSION_PAGE_TRANSFORMATION_ERROR
 
@@ -44,60 +45,72 @@ class DocumentVersionPageBusinessLogicMixin:
             'transformations cache filename: %s', combined_cache_filename
         )
 
-        content_object_lock_name = self.content_object.get_lock_name(
-            user=user
+        is_cached = ImageGenerationFlight.is_cached(
+            cache_partition=self.cache_partition,
+            filename=combined_cache_filename
         )
-        try:
-            content_object_lock = LockingBackend.get_backend().acquire_lock(
-                name=content_object_lock_name,
-                timeout=setting_image_generation_timeout.value * 2
-            )
-        except Exception:
-            raise
-        else:
-            lock_name = self.get_lock_name(
-                _combined_cache_filename=combined_cache_filename
+        if is_cached:
+            return combined_cache_filename
+
+        lock_name = self.get_lock_name(
+            _combined_cache_filename=combined_cache_filename
+        )
+
+        with ImageGenerationFlight.acquire(key=lock_name):
+            content_object_lock_name = self.content_object.get_lock_name(
+                user=user
             )
             try:
-                if _acquire_lock:
-                    lock = LockingBackend.get_backend().acquire_lock(
-                        name=lock_name,
-                        timeout=setting_image_generation_timeout.value
-                    )
+                content_object_lock = LockingBackend.get_backend().acquire_lock(
+                    name=content_object_lock_name,
+                    timeout=setting_image_generation_timeout.value * 2
+                )
             except Exception:
                 raise
             else:
-                # Second try block to release the lock even on fatal errors
-                # inside the block.
                 try:
-                    try:
-                        self.cache_partition.get_file(
-                            filename=combined_cache_filename
-                        )
-                    except CachePartitionFile.DoesNotExist:
-                        logger.debug(
-                            'transformations cache file "%s" not found, '
-                            'generating new image', combined_cache_filename
-                        )
-                        image = self.get_image(
-                            transformation_instance_list=combined_transformation_list
+                    if _acquire_lock:
+                        lock = LockingBackend.get_backend().acquire_lock(
+                            name=lock_name,
+                            timeout=setting_image_generation_timeout.value
                         )
-                        with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
-                            file_object.write(
-                                image.getvalue()
+                except Exception:
+                    raise
+                else:
+                    # Second try block to release the lock even on fatal
+                    # errors inside the block.
+                    try:
+                        try:
+                            self.cache_partition.get_file(
+                                filename=combined_cache_filename
                             )
-                    else:
-                        logger.debug(
-                            'transformations cache file "%s" found, '
-                            'returning it to caller', combined_cache_filename
-                        )
+                        except CachePartitionFile.DoesNotExist:
+                            logger.debug(
+                                'transformations cache file "%s" not found, '
+                                'generating new image', combined_cache_filename
+                            )
+                            ImageGenerationFlight.count(name='miss')
+                            image = self.get_image(
+                                transformation_instance_list=combined_transformation_list
+                            )
+                            with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
+                                file_object.write(
+                                    image.getvalue()
+                                )
+                        else:
+                            logger.debug(
+                                'transformations cache file "%s" generated '
+                                'while waiting for the locks, returning it '
+                                'to caller', combined_cache_filename
+                            )
+                            ImageGenerationFlight.count(name='collision')
 
-                    return combined_cache_filename
+                        return combined_cache_filename
+                    finally:
+                        if _acquire_lock:
+                            lock.release()
                 finally:
-                    if _acquire_lock:
-                        lock.release()
-            finally:
-                content_object_lock.release()
+                    content_object_lock.release()
 
     def get_api_image_url(
         self, maximum_layer_order=None, transformation_instance_list=None,
@@ -230,7 +243,9 @@ class DocumentVersionPageBusinessLogicMixin:
                 with content_object_cache_file.open() as file_object:
                     converter_class = ConverterBase.get_converter_class()
                     converter_instance = converter_class(
-                        file_object=file_object
+                        file_object=file_object,
+                        mime_type=ConverterBase.get_output_content_type(),
+                        mime_type_cache_key=content_object_cache_file.get_mime_type_cache_key()
                     )
                     converter_instance.seek_page(page_number=0)
 
@@ -250,6 +265,10 @@ class DocumentVersionPageBusinessLogicMixin:
                         )
 
                     return converter_instance.get_page()
+            except LockError:
+                # The image of the document file page is being generated by
+                # another process.
+                raise
             except Exception as exception:
                 # Cleanup in case of error.
                 logger.error(
@@ -264,7 +283,9 @@ class DocumentVersionPageBusinessLogicMixin:
             with cache_file.open() as file_object:
                 converter_class = ConverterBase.get_converter_class()
                 converter_instance = converter_class(
-                    file_object=file_object
+                    file_object=file_object,
+                    mime_type=ConverterBase.get_output_content_type(),
+                    mime_type_cache_key=cache_file.get_mime_type_cache_key()
                 )
 
                 converter_instance.seek_page(page_number=0)
@@ -58,6 +58,10 @@ queue_documents_file.add_task_type(
     dotted_path='mayan.apps.documents.tasks.document_file_tasks.task_document_file_checksum_update',
     label=_(message='Calculate and update document file checksum')
 )
+queue_documents_file.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.document_file_tasks.task_document_file_introspect',
+    label=_(message='Introspect document file')
+)
 queue_documents_file.add_task_type(
     dotted_path='mayan.apps.documents.tasks.document_file_tasks.task_document_file_mimetype_update',
     label=_(message='Calculate and update document file MIME type')
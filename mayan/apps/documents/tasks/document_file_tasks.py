@@ -135,7 +135,7 @@ def task_document_file_create(
                 name='post_document_file_create'
             )
 
-            task_document_file_size_update.apply_async(
+            task_document_file_introspect.apply_async(
                 kwargs={
                     'action_name': action_name,
                     'callback_dict': callback_dict,
@@ -173,6 +173,60 @@ def task_document_file_delete(self, document_file_id, user_id=None):
         raise self.retry(exc=exception)
 
 
+@app.task(bind=True, ignore_result=True, retry_backoff=True)
+def task_document_file_introspect(
+    self, document_file_id, action_name=None, callback_dict=None,
+    is_document_upload_sequence=False, user_id=None
+):
+    callback_dict = callback_dict or {}
+
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+    User = get_user_model()
+
+    try:
+        document_file = DocumentFile.objects.get(pk=document_file_id)
+
+        if user_id:
+            user = User.objects.get(pk=user_id)
+        else:
+            user = None
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+    try:
+        document_file.introspect(user=user)
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error during attempt to introspect document '
+            'file: %s; %s. Retrying.', document_file, exception
+        )
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        logger.critical(
+            'Unexpected exception when introspecting document file: '
+            '%s; %s.', document_file, exception
+        )
+        raise
+    else:
+        document_file.upload_complete()
+
+        if is_document_upload_sequence:
+            task_document_file_version_create.apply_async(
+                kwargs={
+                    'action_name': action_name,
+                    'document_file_id': document_file.pk,
+                    'user_id': user_id
+                }
+            )
+
+            execute_callback(
+                callback_dict=callback_dict, document_file=document_file,
+                name='post_document_file_upload'
+            )
+
+
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_document_file_mimetype_update(
     self, document_file_id, action_name=None, callback_dict=None,
@@ -196,8 +196,8 @@ class DocumentAPIViewTestMixin(DocumentTestMixin):
             }, data={'description': TEST_DOCUMENT_DESCRIPTION_EDITED}
         )
 
-    def _request_test_document_list_api_view(self):
-        return self.get(viewname='rest_api:document-list')
+    def _request_test_document_list_api_view(self, data=None):
+        return self.get(viewname='rest_api:document-list', data=data)
 
     def _request_test_document_move_to_trash_api_view(self):
         return self.delete(
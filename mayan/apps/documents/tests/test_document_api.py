@@ -1,10 +1,17 @@
 from rest_framework import status
 
+from django.test import override_settings
+
 from mayan.apps.file_metadata.events import (
     event_file_metadata_document_file_finished,
     event_file_metadata_document_file_submitted
 )
+from mayan.apps.rest_api.literals import (
+    PAGINATION_MODE_CURSOR, QUERY_PAGINATION_MODE_PARAMETER
+)
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
+from mayan.apps.smart_settings.settings import setting_cluster
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
 
 from ..events import (
     event_document_created, event_document_edited,
@@ -509,6 +516,95 @@ class DocumentAPIViewTestCase(DocumentAPIViewTestMixin, BaseAPITestCase):
         self.assertEqual(events[7].verb, event_document_version_edited.id)
 
 
+class DocumentCursorPaginationAPIViewTestCase(
+    DocumentAPIViewTestMixin, SettingOverrideTestMixin, BaseAPITestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stubs(count=3)
+
+        for document in self._test_document_list:
+            self.grant_access(
+                obj=document, permission=permission_document_view
+            )
+
+    def test_document_list_api_view_cursor_pagination(self):
+        test_document_id_list = sorted(
+            self._test_document_id_list, reverse=True
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_list_api_view(
+            data={
+                QUERY_PAGINATION_MODE_PARAMETER: PAGINATION_MODE_CURSOR,
+                'page_size': 2
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertFalse(response.data['count_is_approximate'])
+        self.assertEqual(
+            [result['id'] for result in response.data['results']],
+            test_document_id_list[:2]
+        )
+
+        response = self.client.get(path=response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(
+            [result['id'] for result in response.data['results']],
+            test_document_id_list[2:]
+        )
+        self.assertEqual(response.data['next'], None)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_list_api_view_cursor_pagination_sorted(self):
+        self._clear_events()
+
+        response = self._request_test_document_list_api_view(
+            data={
+                QUERY_PAGINATION_MODE_PARAMETER: PAGINATION_MODE_CURSOR,
+                '_ordering': 'id', 'page_size': 2
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertFalse('count_is_approximate' in response.data)
+        self.assertEqual(
+            [result['id'] for result in response.data['results']],
+            sorted(self._test_document_id_list)[:2]
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @override_settings(REST_API_PAGINATION_APPROXIMATE_COUNT_LIMIT=2)
+    def test_document_list_api_view_cursor_pagination_approximate_count(self):
+        setting_cluster.do_cache_invalidate()
+
+        self._clear_events()
+
+        response = self._request_test_document_list_api_view(
+            data={
+                QUERY_PAGINATION_MODE_PARAMETER: PAGINATION_MODE_CURSOR
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(response.data['count'], 2)
+        self.assertTrue(response.data['count_is_approximate'])
+        self.assertEqual(len(response.data['results']), 3)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+
 class DocumentChangeTypeAPIViewTestCase(
     DocumentAPIViewTestMixin, DocumentTestMixin, BaseAPITestCase
 ):
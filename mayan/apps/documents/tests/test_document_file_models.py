@@ -1,9 +1,15 @@
 from pathlib import Path
+import unittest
+from unittest import mock
+
+from mayan.apps.converter.backends.python import command_pdftoppm
 
 from mayan.apps.file_metadata.events import (
     event_file_metadata_document_file_finished,
     event_file_metadata_document_file_submitted
 )
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
 from ..events import (
     event_document_file_created, event_document_file_deleted,
@@ -11,9 +17,14 @@ from ..events import (
     event_document_version_edited, event_document_version_page_created,
     event_document_version_page_deleted
 )
+from ..literals import DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
 
 from .base import GenericDocumentTestCase
-from .literals import TEST_DOCUMENT_SMALL_CHECKSUM
+from .literals import (
+    TEST_DOCUMENT_SMALL_CHECKSUM, TEST_DOCUMENT_SMALL_MIMETYPE,
+    TEST_DOCUMENT_SMALL_SIZE, TEST_FILE_HYBRID_PDF_FILENAME,
+    TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+)
 from .mixins.document_file_mixins import DocumentFileTestMixin
 
 
@@ -135,3 +146,211 @@ class DocumentFileTestCase(DocumentFileTestMixin, GenericDocumentTestCase):
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+    def test_method_introspect(self):
+        self._clear_events()
+
+        with mock.patch.object(target=self._test_document_file.file.storage, attribute='open', wraps=self._test_document_file.file.storage.open) as mocked_open:
+            page_count = self._test_document_file.introspect(save=False)
+
+        self.assertEqual(mocked_open.call_count, 1)
+        self.assertEqual(page_count, 1)
+
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(
+            self._test_document_file.mimetype, TEST_DOCUMENT_SMALL_MIMETYPE
+        )
+        self.assertEqual(
+            self._test_document_file.size, TEST_DOCUMENT_SMALL_SIZE
+        )
+
+    def test_method_introspect_storage_size(self):
+        # Compressed or encrypted storages report a size different from
+        # the length of the decoded file.
+        with mock.patch.object(target=self._test_document_file.file.storage, attribute='size', return_value=TEST_DOCUMENT_SMALL_SIZE + 1):
+            self._test_document_file.introspect(save=False)
+
+        self.assertEqual(
+            self._test_document_file.size, TEST_DOCUMENT_SMALL_SIZE + 1
+        )
+
+    def test_method_introspect_save(self):
+        self._test_document_file.checksum = ''
+        self._test_document_file.encoding = ''
+        self._test_document_file.mimetype = ''
+        self._test_document_file.size = None
+        self._test_document_file.save(
+            update_fields=('checksum', 'encoding', 'mimetype', 'size')
+        )
+
+        self._clear_events()
+
+        self._test_document_file.introspect(user=self._test_case_user)
+
+        self._test_document_file.refresh_from_db()
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(
+            self._test_document_file.mimetype, TEST_DOCUMENT_SMALL_MIMETYPE
+        )
+        self.assertEqual(
+            self._test_document_file.size, TEST_DOCUMENT_SMALL_SIZE
+        )
+        self.assertEqual(self._test_document_file.pages.count(), 1)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+
+        self.assertEqual(events[0].action_object, None)
+        self.assertEqual(events[0].actor, self._test_case_user)
+        self.assertEqual(events[0].target, self._test_document_version)
+        self.assertEqual(
+            events[0].verb, event_document_version_page_deleted.id
+        )
+
+        self.assertEqual(events[1].action_object, self._test_document)
+        self.assertEqual(events[1].actor, self._test_case_user)
+        self.assertEqual(events[1].target, self._test_document_file)
+        self.assertEqual(events[1].verb, event_document_file_edited.id)
+
+
+class DocumentFilePageImageCacheTestCase(GenericDocumentTestCase):
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    def test_method_pages_image_cache_generate(self):
+        self._clear_events()
+
+        generated_count = self._test_document_file.pages_image_cache_generate()
+
+        self.assertEqual(generated_count, 2)
+
+        for document_file_page in self._test_document_file.file_pages.all():
+            self.assertTrue(
+                document_file_page.cache_partition.files.filter(
+                    filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+                ).exists()
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_pages_image_cache_generate_cached(self):
+        self._test_document_file.pages_image_cache_generate()
+
+        self._clear_events()
+
+        generated_count = self._test_document_file.pages_image_cache_generate()
+
+        self.assertEqual(generated_count, 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_pages_image_cache_generate_page_range(self):
+        self._clear_events()
+
+        generated_count = self._test_document_file.pages_image_cache_generate(
+            page_number_first=2, page_number_last=2
+        )
+
+        self.assertEqual(generated_count, 1)
+
+        self.assertFalse(
+            self._test_document_file.file_pages.first().cache_partition.files.filter(
+                filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+            ).exists()
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_get_image_window(self):
+        test_document_file_page = self._test_document_file.file_pages.first()
+
+        self._clear_events()
+
+        test_document_file_page.get_image()
+
+        for document_file_page in self._test_document_file.file_pages.all():
+            self.assertTrue(
+                document_file_page.cache_partition.files.filter(
+                    filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+                ).exists()
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_get_image_window_locked(self):
+        test_document_file_page = self._test_document_file.file_pages.first()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name='document_file_page_image_window_{}_1'.format(
+                self._test_document_file.pk
+            )
+        )
+
+        self._clear_events()
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                test_document_file_page.get_image()
+        finally:
+            lock.release()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_method_pages_image_cache_generate_locked(self):
+        test_document_file_page = self._test_document_file.file_pages.first()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name='document_file_page_base_image_{}'.format(
+                test_document_file_page.pk
+            )
+        )
+
+        self._clear_events()
+
+        try:
+            generated_count = self._test_document_file.pages_image_cache_generate()
+        finally:
+            lock.release()
+
+        self.assertEqual(generated_count, 1)
+
+        self.assertFalse(
+            test_document_file_page.cache_partition.files.filter(
+                filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+            ).exists()
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+
+@unittest.skipIf(
+    condition=not command_pdftoppm, reason='pdftoppm is not installed.'
+)
+class DocumentFilePDFPageImageCacheTestCase(GenericDocumentTestCase):
+    _test_document_filename = TEST_FILE_HYBRID_PDF_FILENAME
+
+    def test_method_pages_image_cache_generate(self):
+        self._clear_events()
+
+        generated_count = self._test_document_file.pages_image_cache_generate()
+
+        self.assertEqual(generated_count, 2)
+
+        for document_file_page in self._test_document_file.file_pages.all():
+            self.assertTrue(
+                document_file_page.cache_partition.files.filter(
+                    filename=DOCUMENT_FILE_PAGE_CACHE_FILENAME_BASE_IMAGE
+                ).exists()
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
@@ -1,5 +1,10 @@
+from unittest import mock
+
+from django.db.models import Sum
+
 from rest_framework import status
 
+from mayan.apps.file_caching.classes import CachePartitionFileHits
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
 
 from ..events import (
@@ -346,6 +351,42 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_page_image_api_view_memory_tier(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        image_content = b''.join(response.streaming_content)
+
+        CachePartitionFileHits.flush()
+
+        queryset_files = self._test_document_version_page.cache_partition.files
+        hits = queryset_files.aggregate(hits__sum=Sum('hits'))['hits__sum']
+
+        self._clear_events()
+
+        with mock.patch(target='mayan.apps.converter.api_view_mixins.task_content_object_image_generate') as mock_task:
+            response = self._request_test_document_version_page_image_api_view()
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                b''.join(response.streaming_content), image_content
+            )
+
+        self.assertFalse(mock_task.apply_async.called)
+
+        CachePartitionFileHits.flush()
+
+        self.assertEqual(
+            queryset_files.aggregate(hits__sum=Sum('hits'))['hits__sum'],
+            hits + 1
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_trashed_document_version_page_image_api_view_with_access(self):
         self.grant_access(
             obj=self._test_document_version,
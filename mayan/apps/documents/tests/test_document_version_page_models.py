@@ -1,8 +1,14 @@
+from unittest import mock
+
+from mayan.apps.converter.classes import ImageGenerationFlight
 from mayan.apps.converter.models import LayerTransformation
 from mayan.apps.converter.tests.mixins import LayerTestMixin
 from mayan.apps.converter.transformations import (
     BaseTransformation, TransformationRotate90
 )
+from mayan.apps.file_caching.models import CachePartition
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.mime_types.classes import MIMETypeBackend
 
 from ..document_file_actions import DocumentFileActionAppendNewPages
 
@@ -49,6 +55,41 @@ class DocumentVersionPageTestCase(
             self._test_document.version_active.pages.first().get_absolute_url()
         )
 
+    def test_method_generate_image_collision(self):
+        self._test_document_version_page.generate_image()
+
+        ImageGenerationFlight.reset()
+
+        # Simulate the image being generated by another process after the
+        # optimistic lookup.
+        with mock.patch.object(target=CachePartition, attribute='get_file_is_complete', return_value=False):
+            self._test_document_version_page.generate_image()
+
+        self.assertEqual(
+            ImageGenerationFlight.get_statistics(),
+            {'collision': 1, 'hit': 0, 'miss': 0}
+        )
+
+    def test_method_generate_image_lock_free_hit(self):
+        self._test_document_version_page.generate_image()
+
+        ImageGenerationFlight.reset()
+
+        with mock.patch.object(target=LockingBackend, attribute='get_backend') as mocked_get_backend:
+            self._test_document_version_page.generate_image()
+
+        self.assertEqual(mocked_get_backend.call_count, 0)
+        self.assertEqual(
+            ImageGenerationFlight.get_statistics(),
+            {'collision': 0, 'hit': 1, 'miss': 0}
+        )
+
+    def test_method_generate_image_mime_type_detection(self):
+        with mock.patch.object(target=MIMETypeBackend, attribute='get_mime_type') as mocked_get_mime_type:
+            self._test_document_version_page.generate_image()
+
+        self.assertEqual(mocked_get_mime_type.call_count, 0)
+
     def test_version_page_cache_update_on_transformation(self):
         BaseTransformation.register(
             layer=self._test_layer, transformation=TransformationRotate90
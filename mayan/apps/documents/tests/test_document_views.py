@@ -1,5 +1,10 @@
 from django.test import override_settings
 
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
+from mayan.apps.views.literals import (
+    TEXT_CURSOR_PARAMETER, TEXT_SORT_FIELD_PARAMETER
+)
+
 from ..events import (
     event_document_trashed, event_document_type_changed, event_document_viewed
 )
@@ -151,6 +156,88 @@ class DocumentTrashViewTestCase(
         self.assertEqual(events.count(), 0)
 
 
+@override_settings(VIEWS_PAGINATE_BY=2, VIEWS_PAGINATION_CURSOR_ENABLE=True)
+class DocumentCursorPaginationViewTestCase(
+    DocumentViewTestMixin, SettingOverrideTestMixin,
+    GenericDocumentViewTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stubs(count=3)
+
+        for document in self._test_document_list:
+            self.grant_access(
+                obj=document, permission=permission_document_view
+            )
+
+    def test_document_list_view_cursor_pagination(self):
+        test_document_list = sorted(
+            self._test_document_list, key=lambda document: document.pk,
+            reverse=True
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_list_view()
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            response.context['object_list'], test_document_list[:2]
+        )
+        self.assertEqual(
+            response.context['pagination_cursor_next'],
+            test_document_list[1].pk
+        )
+
+        response = self._request_test_document_list_view(
+            data={
+                TEXT_CURSOR_PARAMETER: response.context['pagination_cursor_next']
+            }
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            response.context['object_list'], test_document_list[2:]
+        )
+        self.assertEqual(response.context['pagination_cursor_next'], None)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_list_view_cursor_pagination_invalid_cursor(self):
+        self._clear_events()
+
+        response = self._request_test_document_list_view(
+            data={TEXT_CURSOR_PARAMETER: 'invalid'}
+        )
+        self.assertEqual(response.status_code, 404)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_list_view_cursor_pagination_sorted(self):
+        test_document_list = sorted(
+            self._test_document_list, key=lambda document: document.label
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_list_view(
+            data={TEXT_SORT_FIELD_PARAMETER: 'label'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertFalse('pagination_cursor_enabled' in response.context)
+        self.assertEqual(
+            list(response.context['object_list']), test_document_list[:2]
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+
 class DocumentViewTestCase(
     DocumentViewTestMixin, GenericDocumentViewTestCase
 ):
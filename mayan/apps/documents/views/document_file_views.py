@@ -40,7 +40,9 @@ from ..permissions import (
     permission_document_file_view
 )
 from ..settings import setting_preview_height, setting_preview_width
-from ..tasks import task_document_file_delete, task_document_file_size_update
+from ..tasks import (
+    task_document_file_delete, task_document_file_introspect
+)
 
 from .misc_views import DocumentPrintBaseView, PrintFormView
 
@@ -167,7 +169,7 @@ class DocumentFileIntrospectView(MultipleObjectConfirmActionView):
         return result
 
     def object_action(self, form, instance):
-        task_document_file_size_update.apply_async(
+        task_document_file_introspect.apply_async(
             kwargs={
                 'action_name': DEFAULT_DOCUMENT_FILE_ACTION_NAME,
                 'document_file_id': instance.pk,
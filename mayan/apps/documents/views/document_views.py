@@ -33,6 +33,7 @@ logger = logging.getLogger(name=__name__)
 
 class DocumentListView(SingleObjectListView):
     object_permission = permission_document_view
+    pagination_cursor_ordering = '-pk'
     view_icon = icon_document_list
 
     def get_context_data(self, **kwargs):
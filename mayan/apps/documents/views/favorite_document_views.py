@@ -20,6 +20,8 @@ logger = logging.getLogger(name=__name__)
 
 
 class FavoriteDocumentListView(DocumentListView):
+    # The list has its own ordering.
+    pagination_cursor_ordering = None
     view_icon = icon_document_favorite_list
 
     def get_document_queryset(self):
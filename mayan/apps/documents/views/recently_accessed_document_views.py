@@ -9,6 +9,8 @@ from .document_views import DocumentListView
 
 
 class RecentlyAccessedDocumentListView(DocumentListView):
+    # The list has its own ordering.
+    pagination_cursor_ordering = None
     view_icon = icon_document_recently_accessed_list
 
     def get_document_queryset(self):
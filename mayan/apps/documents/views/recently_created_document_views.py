@@ -7,6 +7,8 @@ from .document_views import DocumentListView
 
 
 class RecentCreatedDocumentListView(DocumentListView):
+    # The list has its own ordering.
+    pagination_cursor_ordering = None
     view_icon = icon_document_recently_created_list
 
     def get_document_queryset(self):
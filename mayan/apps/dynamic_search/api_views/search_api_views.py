@@ -3,6 +3,7 @@ from rest_framework.exceptions import ParseError
 from mayan.apps.rest_api import generics
 
 from ..exceptions import DynamicSearchException
+from ..pagination import SearchResultPagination
 from ..search_models import SearchModel
 from ..serializers import (
     DummySearchResultModelSerializer, SearchModelSerializer
@@ -44,6 +45,7 @@ class APISearchView(
     """
     get: Perform a search operation.
     """
+    pagination_class = SearchResultPagination
 
     def get_serializer_class(self):
         if getattr(self, 'swagger_fake_view', False):
@@ -52,8 +54,21 @@ class APISearchView(
             return self.search_model.serializer
 
     def get_source_queryset(self):
+        paginator_cursor = self.paginator.get_paginator_cursor(
+            request=self.request, view=self
+        )
+
         try:
-            return self.get_search_queryset()
+            if paginator_cursor:
+                return self.get_search_queryset(
+                    cursor=paginator_cursor.decode_cursor(
+                        request=self.request
+                    ), limit=self.paginator.get_page_size(
+                        request=self.request
+                    )
+                )
+            else:
+                return self.get_search_queryset()
         except DynamicSearchException as exception:
             raise ParseError(
                 detail=str(exception)
@@ -0,0 +1,2 @@
+from .backend import DatabaseSearchBackend  # NOQA
+from .backend_query_types import *  # NOQA
@@ -0,0 +1,236 @@
+import re
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+
+from ...literals import SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH
+from ...search_models import SearchModel
+
+from ..django.backend import DjangoSearchBackend
+
+from .literals import (
+    DATABASE_BULK_CREATE_BATCH_SIZE, DATABASE_TOKENIZED_FIELD_CLASSES,
+    DATABASE_TOKEN_LOOKUP_CHUNK_SIZE, DATABASE_TOKEN_REGULAR_EXPRESSION
+)
+
+
+class DatabaseSearchBackend(DjangoSearchBackend):
+    """
+    Keeps an inverted index of the text search fields in the primary
+    database. Each distinct token is stored once in a vocabulary table and
+    a posting table records the search model, search field and object of
+    every token occurrence. Text queries are first resolved against the
+    postings and the resulting candidates are verified using the queries of
+    the Django backend, returning the same results without scanning every
+    row of the search model. Queries on other field types are resolved as
+    in the Django backend.
+    """
+    feature_reindex = True
+
+    @staticmethod
+    def get_token_list(value):
+        """
+        Split a value into the lowercase list of its words. Hyphens are
+        treated as word characters to match the query value
+        transformations.
+        """
+        if isinstance(value, (list, tuple)):
+            value = ' '.join(
+                str(item) for item in value
+            )
+
+        value = str(value).replace('-', '_').lower()
+
+        return re.findall(
+            pattern=DATABASE_TOKEN_REGULAR_EXPRESSION, string=value
+        )
+
+    def _do_search_model_index(self, search_model, instance_field_data_dict):
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+        SearchIndexToken = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexToken'
+        )
+
+        search_field_name_list = [
+            search_field.field_name for search_field in search_model.search_fields if self.get_search_field_is_tokenized(
+                search_field=search_field
+            )
+        ]
+
+        posting_set = set()
+        for object_id, instance_field_data in instance_field_data_dict.items():
+            for field_name in search_field_name_list:
+                value = instance_field_data.get(field_name)
+                if value is not None:
+                    for token in self.get_token_list(value=value):
+                        if len(token) <= SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH:
+                            posting_set.add(
+                                (object_id, field_name, token)
+                            )
+
+        token_value_list = list(
+            {posting[2] for posting in posting_set}
+        )
+
+        with transaction.atomic():
+            SearchIndexPosting.objects.filter(
+                object_id__in=list(instance_field_data_dict),
+                search_model_name=search_model.full_name
+            ).delete()
+
+            SearchIndexToken.objects.bulk_create(
+                batch_size=DATABASE_BULK_CREATE_BATCH_SIZE,
+                ignore_conflicts=True, objs=[
+                    SearchIndexToken(value=value) for value in token_value_list
+                ]
+            )
+
+            token_id_dict = {}
+            for index in range(0, len(token_value_list), DATABASE_TOKEN_LOOKUP_CHUNK_SIZE):
+                token_id_dict.update(
+                    SearchIndexToken.objects.filter(
+                        value__in=token_value_list[
+                            index:index + DATABASE_TOKEN_LOOKUP_CHUNK_SIZE
+                        ]
+                    ).values_list('value', 'id')
+                )
+
+            SearchIndexPosting.objects.bulk_create(
+                batch_size=DATABASE_BULK_CREATE_BATCH_SIZE, objs=[
+                    SearchIndexPosting(
+                        field_name=field_name, object_id=object_id,
+                        search_model_name=search_model.full_name,
+                        token_id=token_id_dict[token]
+                    ) for object_id, field_name, token in posting_set
+                ]
+            )
+
+    def _get_status(self):
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+        SearchIndexToken = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexToken'
+        )
+
+        result = []
+
+        title = 'Database search model indexing status'
+        result.append(title)
+        result.append(
+            len(title) * '='
+        )
+
+        for search_model in SearchModel.all():
+            queryset = SearchIndexPosting.objects.filter(
+                search_model_name=search_model.full_name
+            ).values('object_id').distinct()
+
+            result.append(
+                '{}: {}'.format(
+                    search_model.label, queryset.count()
+                )
+            )
+
+        result.append(
+            'Tokens: {}'.format(
+                SearchIndexToken.objects.count()
+            )
+        )
+
+        return '\n'.join(result)
+
+    def deindex_instance(self, instance):
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        SearchIndexPosting.objects.filter(
+            object_id=instance.pk, search_model_name=search_model.full_name
+        ).delete()
+
+    def get_search_field_is_tokenized(self, search_field):
+        return search_field.concrete and search_field.field_class in DATABASE_TOKENIZED_FIELD_CLASSES
+
+    def get_search_field_token_query(self, search_field, token_query_list):
+        """
+        Return a query matching the objects having, in the search field,
+        at least one token matching each of the token queries.
+        """
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+        SearchIndexToken = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexToken'
+        )
+
+        result = Q()
+
+        for token_query in token_query_list:
+            queryset_postings = SearchIndexPosting.objects.filter(
+                field_name=search_field.field_name,
+                search_model_name=search_field.search_model.full_name,
+                token__in=SearchIndexToken.objects.filter(token_query)
+            )
+
+            result &= Q(
+                pk__in=queryset_postings.values('object_id')
+            )
+
+        return result
+
+    def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        instance_field_data = search_model.populate(
+            exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+            instance=instance, search_backend=self
+        )
+
+        self._do_search_model_index(
+            instance_field_data_dict={instance.pk: instance_field_data},
+            search_model=search_model
+        )
+
+    def index_instances(self, search_model, id_list):
+        queryset = search_model.get_queryset()
+        queryset = queryset.filter(pk__in=id_list)
+
+        # Objects no longer part of the search model queryset lose their
+        # postings.
+        instance_field_data_dict = {
+            object_id: {} for object_id in id_list
+        }
+        for instance, instance_field_data in search_model.populate_bulk(
+            queryset=queryset, search_backend=self
+        ):
+            instance_field_data_dict[instance.pk] = instance_field_data
+
+        self._do_search_model_index(
+            instance_field_data_dict=instance_field_data_dict,
+            search_model=search_model
+        )
+
+    def reset(self, search_model=None):
+        self.tear_down(search_model=search_model)
+
+    def tear_down(self, search_model=None):
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+        SearchIndexToken = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexToken'
+        )
+
+        if search_model:
+            SearchIndexPosting.objects.filter(
+                search_model_name=search_model.full_name
+            ).delete()
+        else:
+            SearchIndexPosting.objects.all().delete()
+            SearchIndexToken.objects.all().delete()
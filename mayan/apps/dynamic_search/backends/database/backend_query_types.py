@@ -0,0 +1,179 @@
+import re
+
+from django.db.models import Q
+
+from ...literals import SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH
+from ...search_query_types import BackendQueryType
+
+from ..django import backend_query_types as django_backend_query_types
+from ..django.literals import MAXIMUM_FUZZY_TERM_LENGTH
+
+from .backend import DatabaseSearchBackend
+from .literals import (
+    DATABASE_TOKEN_REGULAR_EXPRESSION,
+    DATABASE_VALUE_REGULAR_EXPRESSION_SPECIAL_CHARACTERS
+)
+
+
+class BackendQueryTypeTokenMixin:
+    def get_token_list(self):
+        """
+        Return the tokens of the value that can be looked up in the
+        vocabulary. Tokens longer than the maximum length are not indexed.
+        """
+        return [
+            token for token in self.search_backend.get_token_list(
+                value=self.value
+            ) if len(token) <= SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH
+        ]
+
+    def get_value_is_token(self):
+        return re.fullmatch(
+            pattern=DATABASE_TOKEN_REGULAR_EXPRESSION, string=self.value
+        ) is not None and len(self.value) <= SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH
+
+    def do_resolve_token_query(self, query, token_query_list):
+        """
+        Restrict the query to the objects whose postings match the token
+        queries. When the value is a single token, the postings are
+        equivalent to the query and the query is not evaluated.
+        """
+        token_query = self.search_backend.get_search_field_token_query(
+            search_field=self.search_field, token_query_list=token_query_list
+        )
+
+        if self.get_value_is_token():
+            return token_query
+        else:
+            return token_query & query
+
+
+class BackendQueryTypeExact(
+    BackendQueryTypeTokenMixin,
+    django_backend_query_types.BackendQueryTypeExact
+):
+    def do_resolve(self):
+        query = super().do_resolve()
+
+        if query is None or not self.search_backend.get_search_field_is_tokenized(search_field=self.search_field):
+            return query
+
+        if re.search(
+            pattern=DATABASE_VALUE_REGULAR_EXPRESSION_SPECIAL_CHARACTERS,
+            string=self.value
+        ):
+            # The value is used as a regular expression by the Django
+            # backend. Its words are not guaranteed to be tokens.
+            return query
+
+        token_list = self.get_token_list()
+
+        if not token_list:
+            return query
+
+        return self.do_resolve_token_query(
+            query=query, token_query_list=[
+                Q(value=token) for token in token_list
+            ]
+        )
+
+
+class BackendQueryFuzzy(
+    BackendQueryTypeTokenMixin, django_backend_query_types.BackendQueryFuzzy
+):
+    def do_resolve(self):
+        if self.value is None or not self.search_backend.get_search_field_is_tokenized(search_field=self.search_field):
+            return super().do_resolve()
+
+        if len(self.value) > MAXIMUM_FUZZY_TERM_LENGTH:
+            backend_query_type = BackendQueryTypeExact(
+                is_quoted_value=self.is_quoted_value,
+                search_backend=self.search_backend,
+                search_field=self.search_field, value=self.value,
+                extra_kwargs=self.extra_kwargs
+            )
+            return backend_query_type.do_resolve()
+
+        if not self.get_value_is_token():
+            return super().do_resolve()
+
+        # The fuzzy patterns are matched against the whole token instead
+        # of the words of the field values.
+        pattern_list = django_backend_query_types.BackendQueryFuzzy.get_pattern_list(
+            value=self.value.lower()
+        )
+
+        return self.search_backend.get_search_field_token_query(
+            search_field=self.search_field, token_query_list=[
+                Q(
+                    value__regex='^({})$'.format(
+                        '|'.join(
+                            ''.join(pattern) for pattern in pattern_list
+                        )
+                    )
+                )
+            ]
+        )
+
+
+class BackendQueryTypePartial(
+    BackendQueryTypeTokenMixin,
+    django_backend_query_types.BackendQueryTypePartial
+):
+    def do_resolve(self):
+        query = super().do_resolve()
+
+        if query is None or not self.search_backend.get_search_field_is_tokenized(search_field=self.search_field):
+            return query
+
+        token_list = self.get_token_list()
+
+        if not token_list:
+            return query
+
+        # Each word of the value is contained in a word of the field
+        # value.
+        return self.do_resolve_token_query(
+            query=query, token_query_list=[
+                Q(value__contains=token) for token in token_list
+            ]
+        )
+
+
+BackendQueryType.register(
+    klass=BackendQueryTypeExact, search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=BackendQueryFuzzy, search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeGreaterThan,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeGreaterThanOrEqual,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeLessThan,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeLessThanOrEqual,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=BackendQueryTypePartial, search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeRange,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeRangeExclusive,
+    search_backend=DatabaseSearchBackend
+)
+BackendQueryType.register(
+    klass=django_backend_query_types.BackendQueryTypeRegularExpression,
+    search_backend=DatabaseSearchBackend
+)
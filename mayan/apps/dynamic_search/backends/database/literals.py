@@ -0,0 +1,9 @@
+from django.db import models
+
+DATABASE_BULK_CREATE_BATCH_SIZE = 1000
+DATABASE_TOKENIZED_FIELD_CLASSES = (
+    models.CharField, models.EmailField, models.TextField
+)
+DATABASE_TOKEN_LOOKUP_CHUNK_SIZE = 500
+DATABASE_TOKEN_REGULAR_EXPRESSION = r'\w+'
+DATABASE_VALUE_REGULAR_EXPRESSION_SPECIAL_CHARACTERS = r'[.^$*+?{}\[\]\\|()]'
@@ -14,7 +14,7 @@ from .literals import DJANGO_TO_DJANGO_FIELD_MAP
 class DjangoSearchBackend(SearchBackend):
     field_type_mapping = DJANGO_TO_DJANGO_FIELD_MAP
 
-    def _do_search_model_filter(self, filter_kwargs, search_field):
+    def _do_search_model_filter(self, filter_kwargs, search_field, limit=None):
         if search_field.field_class == models.UUIDField:
             # Remove hyphens when searching UUID fields.
             replace_function = Replace(
@@ -41,11 +41,12 @@ class DjangoSearchBackend(SearchBackend):
 
         try:
             queryset = queryset.filter(filter_kwargs)
-            values = queryset.values_list('pk', flat=True)
+            values_unique = queryset.values_list(
+                'pk', flat=True
+            ).order_by().distinct()
 
-            values_unique = tuple(
-                set(values)
-            )
+            if limit:
+                values_unique = values_unique[:limit]
 
             for entry in values_unique:
                 yield entry
@@ -68,7 +69,7 @@ class DjangoSearchBackend(SearchBackend):
 
     def _search(
         self, search_field, query_type, value, is_quoted_value=False,
-        is_raw_value=False
+        is_raw_value=False, limit=None
     ):
         self.do_query_type_verify(
             query_type=query_type, search_field=search_field
@@ -89,7 +90,7 @@ class DjangoSearchBackend(SearchBackend):
                 else:
                     if search_field_query is not None:
                         field_id_list = self._do_search_model_filter(
-                            filter_kwargs=search_field_query,
+                            filter_kwargs=search_field_query, limit=limit,
                             search_field=search_field
                         )
 
@@ -110,5 +111,6 @@ class DjangoSearchBackend(SearchBackend):
                     return ()
                 else:
                     return self._do_search_model_filter(
-                        filter_kwargs=filter_kwargs, search_field=search_field
+                        filter_kwargs=filter_kwargs, limit=limit,
+                        search_field=search_field
                     )
@@ -1,4 +1,4 @@
-import itertools
+import re
 
 from django.db import connection, models
 from django.db.models import Q
@@ -11,7 +11,7 @@ from ...search_query_types import (
 )
 
 from .backend import DjangoSearchBackend
-from .literals import DEFAULT_FUZZY_SLOP, MAXIMUM_FUZZY_OPTIONS
+from .literals import FUZZY_WILDCARD, MAXIMUM_FUZZY_TERM_LENGTH
 
 
 class BackendQueryTypeExact(BackendQueryType):
@@ -67,43 +67,97 @@ class BackendQueryTypeExact(BackendQueryType):
 
 
 class BackendQueryFuzzy(BackendQueryType):
+    """
+    Emulates fuzzy matching with a single regular expression matching any
+    word within one edit (deletion, insertion, substitution or
+    transposition of adjacent characters) of the search term. The
+    expression has an alternative per edit position, making its size
+    proportional to the square of the term length, and it is evaluated
+    by the database in a single query. Terms longer than
+    MAXIMUM_FUZZY_TERM_LENGTH are matched exactly.
+    """
     query_type = QueryTypeFuzzy
 
-    def do_resolve(self):
-        fuzzy_options = []
+    @staticmethod
+    def get_pattern_list(value):
+        """
+        Return the list of unique patterns, each as a list of escaped
+        characters or wildcards, within one edit of the value.
+        """
+        character_list = [re.escape(character) for character in value]
+        length = len(character_list)
+
+        result = set()
+        result.add(
+            tuple(character_list)
+        )
+
+        for index in range(length + 1):
+            prefix = character_list[:index]
+            suffix = character_list[index:]
+
+            # Insertion.
+            result.add(
+                tuple(prefix + [FUZZY_WILDCARD] + suffix)
+            )
 
-        if self.value is not None:
-            permutation_list = list(
-                set(
-                    [
-                        ''.join(letters) for letters in itertools.permutations(self.value)
-                    ]
+            if index < length:
+                # Deletion.
+                if length > 1:
+                    result.add(
+                        tuple(prefix + suffix[1:])
+                    )
+
+                # Substitution.
+                result.add(
+                    tuple(prefix + [FUZZY_WILDCARD] + suffix[1:])
                 )
-            )
 
-            for permutation in permutation_list:
-                difference_count = sum(1 for a, b in zip(self.value, permutation) if a != b)
+            if index < length - 1:
+                # Transposition.
+                result.add(
+                    tuple(prefix + [suffix[1], suffix[0]] + suffix[2:])
+                )
 
-                if difference_count <= DEFAULT_FUZZY_SLOP:
-                    fuzzy_options.append(permutation)
+        return sorted(result)
 
-            result = None
-            for entry in fuzzy_options[:MAXIMUM_FUZZY_OPTIONS]:
+    def do_resolve(self):
+        if self.value is not None:
+            if len(self.value.split()) != 1:
+                # Like in the backends supporting fuzzy matching natively,
+                # the term is matched against individual words. Empty
+                # values and phrases never match.
+                return None
+
+            if len(self.value) > MAXIMUM_FUZZY_TERM_LENGTH:
                 backend_query_type = BackendQueryTypeExact(
                     is_quoted_value=self.is_quoted_value,
-                    search_backend=self.search_field,
-                    search_field=self.search_field, value=entry,
+                    search_backend=self.search_backend,
+                    search_field=self.search_field, value=self.value,
                     extra_kwargs=self.extra_kwargs
                 )
+                return backend_query_type.do_resolve()
 
-                query = backend_query_type.do_resolve()
+            pattern_list = BackendQueryFuzzy.get_pattern_list(
+                value=self.value
+            )
 
-                if result is None:
-                    result = query
-                else:
-                    result |= query
+            if connection.vendor == 'postgresql':
+                value_template = r'\y({})\y'
+            else:
+                value_template = r'\b({})\b'
 
-            return result
+            return Q(
+                **{
+                    '{field_name}_clean__iregex'.format(
+                        field_name=self.search_field.field_name
+                    ): value_template.format(
+                        '|'.join(
+                            ''.join(pattern) for pattern in pattern_list
+                        )
+                    )
+                }
+            )
 
 
 class BackendQueryTypeGreaterThan(BackendQueryType):
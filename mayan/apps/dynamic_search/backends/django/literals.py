@@ -12,8 +12,6 @@ from ...value_transformations import (
     ValueTransformationToInteger, ValueTransformationToString
 )
 
-DEFAULT_FUZZY_SLOP = 2
-
 DJANGO_TO_DJANGO_FIELD_MAP = {
     models.AutoField: {
         'field': models.AutoField,
@@ -142,4 +140,6 @@ DJANGO_TO_DJANGO_FIELD_MAP = {
     }
 }
 
-MAXIMUM_FUZZY_OPTIONS = 50
+FUZZY_WILDCARD = r'\w'
+
+MAXIMUM_FUZZY_TERM_LENGTH = 64
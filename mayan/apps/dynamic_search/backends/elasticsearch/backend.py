@@ -57,7 +57,7 @@ class ElasticSearchBackend(SearchBackend):
         if self._test_mode:
             self.indices_namespace = 'mayan-test'
 
-    def do_search_execute(self, index_name, search):
+    def do_search_execute(self, index_name, search, limit=None):
         point_in_time_keep_alive = '5m'
 
         client = self._get_client()
@@ -72,6 +72,7 @@ class ElasticSearchBackend(SearchBackend):
         search = search.sort('_doc')
         search = search.source(False)
 
+        count = 0
         search_after = 0
 
         try:
@@ -88,6 +89,13 @@ class ElasticSearchBackend(SearchBackend):
                     result_id = entry.meta.id
                     yield result_id
 
+                    count += 1
+                    if limit and count >= limit:
+                        break
+
+                if limit and count >= limit:
+                    break
+
                 search_after = response[-1].meta.sort[0]
 
             client.close_point_in_time(
@@ -159,7 +167,7 @@ class ElasticSearchBackend(SearchBackend):
 
     def _search(
         self, search_field, query_type, value, is_quoted_value=False,
-        is_raw_value=False
+        is_raw_value=False, limit=None
     ):
         self.do_query_type_verify(
             query_type=query_type, search_field=search_field
@@ -191,7 +199,8 @@ class ElasticSearchBackend(SearchBackend):
                         search = search.filter(search_field_query)
 
                         result = self.do_search_execute(
-                            index_name=index_name, search=search
+                            index_name=index_name, limit=limit,
+                            search=search
                         )
                         yield from result
             else:
@@ -214,7 +223,7 @@ class ElasticSearchBackend(SearchBackend):
                     search = search.filter(search_field_query)
 
                     yield from self.do_search_execute(
-                        index_name=index_name, search=search
+                        index_name=index_name, limit=limit, search=search
                     )
 
     def _update_mappings(self, search_model=None):
@@ -296,10 +305,9 @@ class ElasticSearchBackend(SearchBackend):
 
             queryset = queryset.filter(pk__in=id_list)
 
-            for instance in queryset:
-                kwargs = search_model.populate(
-                    search_backend=self, instance=instance
-                )
+            for instance, kwargs in search_model.populate_bulk(
+                queryset=queryset, search_backend=self
+            ):
                 kwargs['_id'] = kwargs['id']
 
                 yield kwargs
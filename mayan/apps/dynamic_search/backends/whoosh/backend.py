@@ -8,7 +8,7 @@ from whoosh.filedb.filestore import FileStorage
 from whoosh.index import EmptyIndexError
 from whoosh.qparser import MultifieldParser, OrGroup
 from whoosh.query import Every
-from whoosh.writing import BufferedWriter
+from whoosh.writing import MERGE_SMALL
 
 from django.conf import settings
 
@@ -26,8 +26,8 @@ from ...search_fields import SearchFieldVirtualAllFields
 from ...search_models import SearchModel
 
 from .literals import (
-    DJANGO_TO_WHOOSH_FIELD_MAP, TEXT_LOCK_INSTANCE_DEINDEX,
-    TEXT_LOCK_INSTANCE_INDEX, WHOOSH_INDEX_DIRECTORY_NAME
+    DJANGO_TO_WHOOSH_FIELD_MAP, TEXT_LOCK_SEARCH_MODEL_INDEX,
+    WHOOSH_INDEX_DIRECTORY_NAME
 )
 
 logger = logging.getLogger(name=__name__)
@@ -39,8 +39,8 @@ class WhooshSearchBackend(SearchBackend):
     field_type_mapping = DJANGO_TO_WHOOSH_FIELD_MAP
 
     def __init__(
-        self, index_path=None, writer_limitmb=128, writer_multisegment=False,
-        writer_procs=1, **kwargs
+        self, index_path=None, writer_limitmb=128, writer_merge=False,
+        writer_multisegment=False, writer_procs=1, **kwargs
     ):
         super().__init__(**kwargs)
 
@@ -64,6 +64,8 @@ class WhooshSearchBackend(SearchBackend):
         if writer_procs:
             writer_procs = int(writer_procs)
 
+        self.writer_merge = any_to_bool(value=writer_merge)
+
         self.writer_kwargs = {
             'limitmb': writer_limitmb, 'multisegment': writer_multisegment,
             'procs': writer_procs
@@ -78,9 +80,11 @@ class WhooshSearchBackend(SearchBackend):
                 indexname=search_model.full_name, schema=schema
             )
 
-    def _do_query_resolve(self, index, query):
+    def _do_query_resolve(self, index, query, limit=None):
         with index.searcher() as searcher:
-            results = searcher.search(limit=None, q=query)
+            # With a limit, only the top scoring documents are collected
+            # instead of scoring and sorting every match.
+            results = searcher.search(limit=limit, q=query)
             logger.debug('results: %s', results)
 
             for result in results:
@@ -88,6 +92,61 @@ class WhooshSearchBackend(SearchBackend):
                     result['id']
                 )
 
+    def _do_search_model_submit(self, search_model, document_dict):
+        """
+        Add the documents to the index of the search model with a single
+        writer commit, replacing existing documents with the same ID. A
+        document value of `None` removes the document.
+        """
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=TEXT_LOCK_SEARCH_MODEL_INDEX.format(
+                    search_model.full_name
+                )
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                writer = self._get_writer(search_model=search_model)
+
+                try:
+                    for object_id, kwargs in document_dict.items():
+                        writer.delete_by_term('id', object_id)
+
+                        if kwargs is not None:
+                            writer.add_document(**kwargs)
+                except Exception as exception:
+                    writer.cancel()
+
+                    # The parenthesis is used to define a multi line error
+                    # message not a translatable string.
+                    error_text = (
+                        'Unexpected exception while '
+                        'indexing search object id: {id}, '
+                        'search model: {search_model}, '
+                        'index data: {index_data}, '
+                        'field map: {field_map}; '
+                        '{exception}'
+                    ).format(
+                        exception=exception,
+                        field_map=self.get_resolved_field_type_map(
+                            search_model=search_model
+                        ), id=object_id, index_data=kwargs,
+                        search_model=search_model.full_name
+                    )
+
+                    logger.error(error_text, exc_info=True)
+                    raise DynamicSearchBackendException(
+                        error_text
+                    ) from exception
+                else:
+                    writer.commit(merge=self.writer_merge)
+            except whoosh.index.LockError:
+                raise DynamicSearchRetry
+            finally:
+                lock.release()
+
     def _get_or_create_index(self, search_model):
         storage = self._get_storage()
         schema = self._get_search_model_schema(search_model=search_model)
@@ -155,7 +214,7 @@ class WhooshSearchBackend(SearchBackend):
 
     def _search(
         self, search_field, query_type, value, is_quoted_value=False,
-        is_raw_value=False
+        is_raw_value=False, limit=None
     ):
         self.do_query_type_verify(
             query_type=query_type, search_field=search_field
@@ -217,7 +276,9 @@ class WhooshSearchBackend(SearchBackend):
 
                 query = parser.parse(text=search_string)
 
-            return self._do_query_resolve(index=index, query=query)
+            return self._do_query_resolve(
+                index=index, limit=limit, query=query
+            )
         else:
             return ()
 
@@ -232,24 +293,14 @@ class WhooshSearchBackend(SearchBackend):
                 self._get_or_create_index(search_model=search_model)
 
     def deindex_instance(self, instance):
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_DEINDEX
-            )
-        except LockError:
-            raise
-        else:
-            try:
-                search_model = SearchModel.get_for_model(instance=instance)
-                index = self._get_or_create_index(search_model=search_model)
+        search_model = SearchModel.get_for_model(instance=instance)
 
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    with index.writer(**self.writer_kwargs) as writer:
-                        writer.delete_by_term(
-                            'id', str(instance.pk)
-                        )
-            finally:
-                lock.release()
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            self._do_search_model_submit(
+                document_dict={
+                    str(instance.pk): None
+                }, search_model=search_model
+            )
 
     def do_native_type_conversion(self, value):
         if isinstance(value, (list, tuple)):
@@ -258,136 +309,61 @@ class WhooshSearchBackend(SearchBackend):
             return value
 
     def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_INDEX
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            kwargs = search_model.populate(
+                search_backend=self, instance=instance,
+                exclude_model=exclude_model, exclude_kwargs=exclude_kwargs
             )
-        except LockError:
-            raise
-        else:
-            try:
-                search_model = SearchModel.get_for_model(instance=instance)
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    with self._get_writer(search_model=search_model) as writer:
-                        try:
-                            writer.delete_by_term(
-                                'id', str(instance.pk)
-                            )
-                        except Exception as exception:
-                            # The parenthesis is used to define a multi
-                            # line error message not a translatable string.
-                            error_text = (
-                                'Unexpected exception while '
-                                'deleting search object id: {id}, '
-                                'search model: {search_model}, '
-                                'raw data: {raw_data}, '
-                                'field map: {field_map}; '
-                                '{exception}'
-                            ).format(
-                                exception=exception,
-                                field_map=self.get_resolved_field_type_map(
-                                    search_model=search_model
-                                ), id=instance.pk,
-                                raw_data=instance.__dict__,
-                                search_model=search_model.full_name
-                            )
-
-                            logger.error(error_text, exc_info=True)
-                            raise DynamicSearchBackendException(
-                                error_text
-                            ) from exception
-                        else:
-                            kwargs = search_model.populate(
-                                search_backend=self, instance=instance,
-                                exclude_model=exclude_model,
-                                exclude_kwargs=exclude_kwargs
-                            )
-
-                            try:
-                                writer.add_document(**kwargs)
-                            except Exception as exception:
-                                # The parenthesis is used to define a multi
-                                # line error message not a translatable
-                                # string.
-                                error_text = (
-                                    'Unexpected exception while '
-                                    'indexing search object id: {id}, '
-                                    'search model: {search_model}, '
-                                    'index data: {index_data}, '
-                                    'raw data: {raw_data}, '
-                                    'field map: {field_map}; '
-                                    '{exception}'
-                                ).format(
-                                    exception=exception,
-                                    field_map=self.get_resolved_field_type_map(
-                                        search_model=search_model
-                                    ), id=instance.pk, index_data=kwargs,
-                                    raw_data=instance.__dict__,
-                                    search_model=search_model.full_name
-                                )
-
-                                logger.error(error_text, exc_info=True)
-                                raise DynamicSearchBackendException(
-                                    error_text
-                                ) from exception
 
-            except whoosh.index.LockError:
-                raise DynamicSearchRetry
-            finally:
-                lock.release()
+            self._do_search_model_submit(
+                document_dict={
+                    str(instance.pk): kwargs
+                }, search_model=search_model
+            )
 
     def index_instances(self, search_model, id_list):
         queryset = search_model.get_queryset()
         queryset = queryset.filter(pk__in=id_list)
 
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_INDEX
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            document_dict = {}
+            for instance, instance_field_data in search_model.populate_bulk(
+                queryset=queryset, search_backend=self
+            ):
+                document_dict[
+                    str(instance.pk)
+                ] = instance_field_data
+
+            self._do_search_model_submit(
+                document_dict=document_dict, search_model=search_model
             )
-        except LockError:
-            raise
-        else:
-            try:
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    index = self._get_or_create_index(search_model=search_model)
 
-                    writer = BufferedWriter(index=index)
-                    for instance in queryset:
-                        kwargs = search_model.populate(
-                            search_backend=self, instance=instance
+    def optimize(self):
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            for search_model in SearchModel.all():
+                try:
+                    lock = LockingBackend.get_backend().acquire_lock(
+                        name=TEXT_LOCK_SEARCH_MODEL_INDEX.format(
+                            search_model.full_name
                         )
-
-                        try:
-                            writer.update_document(**kwargs)
-                        except Exception as exception:
-                            # The parenthesis is used to define a multi
-                            # line error message not a translatable string.
-                            error_text = (
-                                'Unexpected exception while '
-                                'indexing search model: {search_model}, '
-                                'id_list: {id_list}',
-                                'index data: {index_data}, '
-                                'raw data: {raw_data}, '
-                                'field map: {field_map}; '
-                                '{exception}'
-                            ).format(
-                                exception=exception,
-                                field_map=self.get_resolved_field_type_map(
-                                    search_model=search_model
-                                ), id_list=id_list, index_data=kwargs,
-                                raw_data=instance.__dict__,
-                                search_model=search_model.full_name
-                            )
-
-                            logger.error(error_text, exc_info=True)
-                            raise DynamicSearchBackendException(
-                                error_text
-                            ) from exception
-                    writer.close()
-            except whoosh.index.LockError:
-                raise DynamicSearchRetry
-            finally:
-                lock.release()
+                    )
+                except LockError:
+                    # The index is being written, merge it on the next
+                    # run.
+                    logger.debug(
+                        'Unable to lock index of search model: %s',
+                        search_model.full_name
+                    )
+                else:
+                    try:
+                        writer = self._get_writer(search_model=search_model)
+                        writer.commit(mergetype=MERGE_SMALL)
+                    except whoosh.index.LockError:
+                        raise DynamicSearchRetry
+                    finally:
+                        lock.release()
 
     def reset(self, search_model=None):
         self.tear_down(search_model=search_model)
@@ -208,7 +208,6 @@ DJANGO_TO_WHOOSH_FIELD_MAP = {
     }
 }
 
-TEXT_LOCK_INSTANCE_DEINDEX = 'dynamic_search_deindex_instance'
-TEXT_LOCK_INSTANCE_INDEX = 'dynamic_search_index_instance'
+TEXT_LOCK_SEARCH_MODEL_INDEX = 'dynamic_search_index_{}'
 
 WHOOSH_INDEX_DIRECTORY_NAME = 'whoosh'
@@ -4,10 +4,7 @@ from mayan.apps.common.utils import (
 )
 
 from .search_backends import SearchBackend
-from .tasks import (
-    task_deindex_instance, task_index_instance,
-    task_index_related_instance_m2m
-)
+from .tasks import task_deindex_instance, task_index_related_instance_m2m
 
 
 def handler_deindex_instance(sender, **kwargs):
@@ -32,23 +29,18 @@ def handler_factory_index_related_instance_delete(reverse_field_path):
 
         entries = flatten_list(value=result)
 
-        def call_task(instance):
-            task_index_instance.apply_async(
-                kwargs={
-                    'app_label': instance._meta.app_label,
-                    'exclude_app_label': related_instance._meta.app_label,
-                    'exclude_kwargs': {'id': related_instance.pk},
-                    'exclude_model_name': related_instance._meta.model_name,
-                    'model_name': instance._meta.model_name,
-                    'object_id': instance.pk
-                }
-            )
-
         if isinstance(entries, Iterable):
-            for instance in entries:
-                call_task(instance=instance)
+            instance_list = entries
         else:
-            call_task(instance=result)
+            instance_list = (result,)
+
+        SearchBackend.index_instance_list_enqueue(
+            exclude_kwargs={
+                'exclude_app_label': related_instance._meta.app_label,
+                'exclude_kwargs': {'id': related_instance.pk},
+                'exclude_model_name': related_instance._meta.model_name
+            }, instance_list=instance_list
+        )
 
     return handler_index_by_related_to_delete_instance
 
@@ -63,20 +55,14 @@ def handler_factory_index_related_instance_save(reverse_field_path):
 
         entries = flatten_list(value=result)
 
-        def call_task(instance):
-            task_index_instance.apply_async(
-                kwargs={
-                    'app_label': instance._meta.app_label,
-                    'model_name': instance._meta.model_name,
-                    'object_id': instance.pk
-                }
-            )
-
         if isinstance(entries, Iterable):
-            for instance in entries:
-                call_task(instance=instance)
+            instance_list = entries
         else:
-            call_task(instance=result)
+            instance_list = (result,)
+
+        SearchBackend.index_instance_list_enqueue(
+            instance_list=instance_list
+        )
 
     return handler_index_by_related_instance
 
@@ -118,13 +104,7 @@ def handler_factory_index_related_instance_m2m(data):
 def handler_index_instance(sender, **kwargs):
     instance = kwargs['instance']
 
-    task_index_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
-    )
+    SearchBackend.index_instance_list_enqueue(instance_list=(instance,))
 
 
 def handler_search_backend_initialize(sender, **kwargs):
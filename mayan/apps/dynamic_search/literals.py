@@ -8,6 +8,9 @@ DEFAULT_SEARCH_BACKEND = 'mayan.apps.dynamic_search.backends.whoosh.WhooshSearch
 DEFAULT_SEARCH_BACKEND_ARGUMENTS = {}
 DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
 DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 25
+DEFAULT_SEARCH_INDEXING_QUEUE_DELAY = 5
+DEFAULT_SEARCH_INDEXING_QUEUE_ENABLE = True
+DEFAULT_SEARCH_INDEXING_QUEUE_FLUSH_SIZE = 1000
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'False'
 DEFAULT_SEARCH_QUERY_RESULTS_LIMIT = 100000
 DEFAULT_SEARCH_RESULTS_LIMIT = 1000
@@ -31,6 +34,7 @@ MATCH_ALL_FIELD_NAME = '_match_all'
 MESSAGE_FEATURE_NO_STATUS = 'This backend does not provide status information.'
 
 QUERY_PARAMETER_ANY_FIELD = 'q'
+QUERY_PARAMETER_CURSOR = '_cursor'
 
 SCOPE_DELIMITER = '_'
 SCOPE_MARKER = '__'
@@ -42,33 +46,44 @@ SCOPE_OPERATOR_OR = 'OR'
 
 
 def scope_operation_and(*args):
-    result = set(
+    # Dictionaries are used instead of sets to keep the order of the
+    # results of the first scope, which is the relevance order of the
+    # backends that support it.
+    result = dict.fromkeys(
         args[0]
     )
     for argument in args[1:]:
-        result = result.intersection(argument)
+        argument = set(argument)
+        result = {
+            key: None for key in result if key in argument
+        }
 
-    return result
+    return list(result)
 
 
 def scope_operation_not(*args):
-    result = set(
+    result = dict.fromkeys(
         args[0]
     )
     for argument in args[1:]:
-        result = result.difference(argument)
+        argument = set(argument)
+        result = {
+            key: None for key in result if key not in argument
+        }
 
-    return result
+    return list(result)
 
 
 def scope_operation_or(*args):
-    result = set(
+    result = dict.fromkeys(
         args[0]
     )
     for argument in args[1:]:
-        result = result.union(argument)
+        result.update(
+            dict.fromkeys(argument)
+        )
 
-    return result
+    return list(result)
 
 
 SCOPE_OPERATOR_CHOICES = {
@@ -80,8 +95,12 @@ SCOPE_OPERATOR_CHOICES = {
 DEFAULT_SEARCH_DEFAULT_OPERATOR = SCOPE_OPERATOR_AND
 DEFAULT_SEARCH_MODEL_FIELD_DISABLE = {}
 
+SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH = 64
+
 SEARCH_MODEL_NAME_KWARG = 'search_model_pk'
 
+SEARCH_RESULTS_RESTRICT_BATCH_SIZE = 500
+
 TASK_DEINDEX_INSTANCE_MAX_RETRIES = 40
 TASK_DEINDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 
@@ -91,9 +110,13 @@ TASK_INDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 TASK_INDEX_INSTANCES_MAX_RETRIES = 40
 TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX = 60
 
+TASK_INDEX_QUEUE_FLUSH_INTERVAL = 10  # 10 seconds.
+
 TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES = 40
 TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX = 60
 
+TASK_OPTIMIZE_BACKEND_INTERVAL = 10 * 60  # 10 minutes.
+
 TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL = 5 * 60  # 5 minutes.
 
 TERM_OPERATOR_AND = 'AND'
@@ -1,3 +1,4 @@
+from django.apps import apps
 from django.core.management.base import BaseCommand
 
 from ...search_backends import SearchBackend
@@ -7,8 +8,17 @@ class Command(BaseCommand):
     help = 'Show search backend statistics.'
 
     def handle(self, *args, **options):
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
         backend = SearchBackend.get_instance()
 
         result = backend.get_status()
 
         self.stdout.write(msg=result)
+        self.stdout.write(
+            msg='Indexing queue backlog: {}'.format(
+                SearchIndexQueueEntry.objects.count()
+            )
+        )
@@ -1,3 +1,5 @@
+from collections import defaultdict
+import functools
 import json
 
 from django.apps import apps
@@ -6,9 +8,13 @@ from django.db import models
 from django.db.models import F, Value
 from django.utils.timezone import now
 
-from mayan.apps.databases.manager_mixins import ManagerMinixCreateBulk
+from mayan.apps.databases.manager_mixins import (
+    ManagerMinixCreateBulk, ManagerMixinQueue
+)
 
+from .search_models import SearchModel
 from .settings import (
+    setting_indexing_chunk_size, setting_indexing_queue_delay,
     setting_saved_resultset_results_limit,
     setting_saved_resultset_time_to_live,
     setting_saved_resultsets_per_user_limit
@@ -84,3 +90,78 @@ class SavedResultsetManager(models.Manager):
         coroutine.close()
 
         return saved_resultset
+
+
+class SearchIndexQueueEntryManager(ManagerMixinQueue, models.Manager):
+    def enqueue(self, instance_list):
+        """
+        Add the instances to the queue. Instances already queued keep a
+        single entry and have their timestamp updated. Returns the number
+        of entries queued.
+        """
+        datetime_current = now()
+
+        entry_set = {
+            (
+                SearchModel.get_for_model(instance=instance).full_name,
+                instance.pk
+            ) for instance in instance_list
+        }
+
+        object_id_dictionary = defaultdict(list)
+
+        for search_model_name, object_id in entry_set:
+            object_id_dictionary[search_model_name].append(object_id)
+
+        queryset_queued = self.none()
+
+        for search_model_name, object_id_list in object_id_dictionary.items():
+            queryset_queued |= self.filter(
+                object_id__in=object_id_list,
+                search_model_name=search_model_name
+            )
+
+        self.queue_add(
+            batch_size=setting_indexing_chunk_size.value,
+            datetime_current=datetime_current, entry_list=[
+                self.model(
+                    datetime=datetime_current, object_id=object_id,
+                    search_model_name=search_model_name
+                ) for search_model_name, object_id in entry_set
+            ], queryset_queued=queryset_queued
+        )
+
+        return len(entry_set)
+
+    def flush(self):
+        """
+        Dispatch the entries that have not changed during the queue delay
+        as bulk indexing tasks. Returns the number of entries dispatched.
+        """
+        # Hidden import.
+        from .tasks import task_index_instances
+
+        search_model_name_list = self.order_by().values_list(
+            'search_model_name', flat=True
+        ).distinct()
+
+        def dispatch(entry_list, search_model_name):
+            task_index_instances.apply_async(
+                kwargs={
+                    'id_list': [entry[0] for entry in entry_list],
+                    'search_model_full_name': search_model_name
+                }
+            )
+
+        result = 0
+
+        for search_model_name in search_model_name_list:
+            result += self.queue_pop(
+                chunk_size=setting_indexing_chunk_size.value,
+                delay=setting_indexing_queue_delay.value,
+                field_names=('object_id',), func=functools.partial(
+                    dispatch, search_model_name=search_model_name
+                ), queryset=self.filter(search_model_name=search_model_name)
+            )
+
+        return result
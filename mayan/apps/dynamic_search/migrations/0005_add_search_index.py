@@ -0,0 +1,80 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0004_create_saved_resultsets')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexToken',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'value', models.CharField(
+                        max_length=64, unique=True, verbose_name='Value'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search index token',
+                'verbose_name_plural': 'Search index tokens'
+            }
+        ),
+        migrations.CreateModel(
+            name='SearchIndexPosting',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'field_name', models.CharField(
+                        max_length=255, verbose_name='Field name'
+                    )
+                ),
+                (
+                    'object_id', models.BigIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'token', models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='postings',
+                        to='dynamic_search.searchindextoken',
+                        verbose_name='Token'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search index posting',
+                'verbose_name_plural': 'Search index postings',
+                'indexes': [
+                    models.Index(
+                        fields=['token', 'search_model_name', 'field_name'],
+                        name='dynamic_search_posting_token'
+                    ),
+                    models.Index(
+                        fields=['search_model_name', 'object_id'],
+                        name='dynamic_search_posting_object'
+                    )
+                ]
+            }
+        )
+    ]
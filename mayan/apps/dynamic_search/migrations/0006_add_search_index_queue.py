@@ -0,0 +1,50 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0005_add_search_index')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexQueueEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'object_id', models.BigIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        db_index=True, help_text='The server date and time '
+                        'when the object was last queued.',
+                        verbose_name='Date time'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search index queue entry',
+                'verbose_name_plural': 'Search index queue entries',
+                'ordering': ('datetime',)
+            }
+        ),
+        migrations.AddConstraint(
+            model_name='searchindexqueueentry',
+            constraint=models.UniqueConstraint(
+                fields=('search_model_name', 'object_id'),
+                name='dynamic_search_queue_entry_unique'
+            )
+        )
+    ]
@@ -9,7 +9,11 @@ from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.templating.template_backends import Template
 
 from .events import event_saved_resultset_created
-from .managers import SavedResultsetEntryManager, SavedResultsetManager
+from .literals import SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH
+from .managers import (
+    SavedResultsetEntryManager, SavedResultsetManager,
+    SearchIndexQueueEntryManager
+)
 from .model_mixins import SavedResultsetBusinessLogicModelMixin
 
 
@@ -102,3 +106,84 @@ class SavedResultsetEntry(models.Model):
         verbose_name_plural = _(message='Saved resultset entries')
 
     objects = SavedResultsetEntryManager()
+
+
+class SearchIndexQueueEntry(models.Model):
+    """
+    Object waiting to be indexed. Each object is queued once regardless
+    of the number of changes made to it while queued.
+    """
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    object_id = models.BigIntegerField(verbose_name=_(message='Object ID'))
+    datetime = models.DateTimeField(
+        db_index=True, help_text=_(
+            message='The server date and time when the object was last '
+            'queued.'
+        ), verbose_name=_(message='Date time')
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('search_model_name', 'object_id'),
+                name='dynamic_search_queue_entry_unique'
+            )
+        ]
+        ordering = ('datetime',)
+        verbose_name = _(message='Search index queue entry')
+        verbose_name_plural = _(message='Search index queue entries')
+
+    objects = SearchIndexQueueEntryManager()
+
+
+class SearchIndexToken(models.Model):
+    """
+    Vocabulary of the database search backend. Each distinct token is
+    stored once and referenced by the postings of the objects containing
+    it.
+    """
+    value = models.CharField(
+        max_length=SEARCH_INDEX_TOKEN_MAXIMUM_LENGTH, unique=True,
+        verbose_name=_(message='Value')
+    )
+
+    class Meta:
+        verbose_name = _(message='Search index token')
+        verbose_name_plural = _(message='Search index tokens')
+
+    def __str__(self):
+        return self.value
+
+
+class SearchIndexPosting(models.Model):
+    """
+    Records that a token appears in a search field of an object of a
+    search model.
+    """
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    field_name = models.CharField(
+        max_length=255, verbose_name=_(message='Field name')
+    )
+    object_id = models.BigIntegerField(verbose_name=_(message='Object ID'))
+    token = models.ForeignKey(
+        db_index=False, on_delete=models.CASCADE, related_name='postings',
+        to=SearchIndexToken, verbose_name=_(message='Token')
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=('token', 'search_model_name', 'field_name'),
+                name='dynamic_search_posting_token'
+            ),
+            models.Index(
+                fields=('search_model_name', 'object_id'),
+                name='dynamic_search_posting_object'
+            )
+        ]
+        verbose_name = _(message='Search index posting')
+        verbose_name_plural = _(message='Search index postings')
@@ -0,0 +1,80 @@
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.rest_api.literals import (
+    PAGINATION_MODE_CURSOR, QUERY_PAGINATION_MODE_PARAMETER
+)
+from mayan.apps.rest_api.pagination import MayanPageNumberPagination
+
+from .literals import QUERY_PARAMETER_CURSOR
+
+
+class SearchResultCursorPagination(pagination.BasePagination):
+    """
+    Continuation of the search results in the relevance order of the
+    search backend. The view retrieves only the page of results starting
+    at the cursor and provides the cursor of the next page. Each page is
+    resolved again by the search backend instead of being sliced from a
+    result list truncated by the results limit.
+    """
+    cursor_query_param = QUERY_PARAMETER_CURSOR
+    invalid_cursor_message = _(message='Invalid cursor')
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        if cursor is None:
+            return None
+
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            raise NotFound(detail=self.invalid_cursor_message)
+        else:
+            if cursor < 0:
+                raise NotFound(detail=self.invalid_cursor_message)
+
+            return cursor
+
+    def get_next_link(self):
+        if self.cursor_next is None:
+            return None
+        else:
+            return replace_query_param(
+                key=self.cursor_query_param,
+                url=self.request.build_absolute_uri(), val=self.cursor_next
+            )
+
+    def get_paginated_response(self, data):
+        return Response(
+            data={
+                'next': self.get_next_link(),
+                'previous': None,
+                'results': data
+            }
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_next = view.search_cursor_next
+        self.request = request
+
+        return list(queryset)
+
+
+class SearchResultPagination(MayanPageNumberPagination):
+    """
+    Page number pagination of the search results bounded by the results
+    limit setting. The cursor pagination mode continues the results past
+    the limit.
+    """
+    def get_paginator_cursor(self, request, view):
+        pagination_mode = request.query_params.get(
+            QUERY_PAGINATION_MODE_PARAMETER
+        )
+
+        if pagination_mode == PAGINATION_MODE_CURSOR:
+            return SearchResultCursorPagination()
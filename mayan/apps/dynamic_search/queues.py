@@ -5,7 +5,10 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_e
 
-from .literals import TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+from .literals import (
+    TASK_INDEX_QUEUE_FLUSH_INTERVAL, TASK_OPTIMIZE_BACKEND_INTERVAL,
+    TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+)
 
 queue_search = CeleryQueue(
     label=_(message='Search'), name='search', worker=worker_e
@@ -30,6 +33,14 @@ queue_search.add_task_type(
         message='Index all instances of a search model to the search engine.'
     ), name='task_index_instances'
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_queue_flush',
+    label=_(
+        message='Dispatch the objects in the indexing queue to the search '
+        'engine.'
+    ), name='task_index_queue_flush',
+    schedule=timedelta(seconds=TASK_INDEX_QUEUE_FLUSH_INTERVAL)
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_related_instance_m2m',
     label=_(
@@ -38,6 +49,13 @@ queue_search.add_task_type(
     ), name='task_index_related_instance_m2m'
 )
 
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_optimize_backend',
+    label=_(
+        message='Merge the search backend indices to speed up searches.'
+    ), name='task_optimize_backend',
+    schedule=timedelta(seconds=TASK_OPTIMIZE_BACKEND_INTERVAL)
+)
 queue_search_slow.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_backend',
     label=_(
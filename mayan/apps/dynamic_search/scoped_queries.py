@@ -328,10 +328,13 @@ class ScopedQueryEntryDataFilter(ScopedQueryEntryData):
             query_type, value = QueryType.check_all(value=self.value)
 
             try:
+                # Request one result over the limit to detect when the
+                # limit is exceeded without fetching every result.
                 results = search_backend._search(
                     is_quoted_value=self.is_quoted_value,
-                    is_raw_value=self.is_raw_value, query_type=query_type,
-                    search_field=self.search_field, value=value
+                    is_raw_value=self.is_raw_value, limit=scope_limit + 1,
+                    query_type=query_type, search_field=self.search_field,
+                    value=value
                 )
 
                 count = 0
@@ -1,7 +1,9 @@
 import functools
+import itertools
 import logging
 
 from django.apps import apps
+from django.db.models import Case, When
 from django.db.models.signals import m2m_changed, post_save, pre_delete
 from django.utils.module_loading import import_string
 
@@ -10,11 +12,15 @@ from mayan.apps.common.utils import (
 )
 
 from .exceptions import DynamicSearchModelException, DynamicSearchQueryError
-from .literals import MESSAGE_FEATURE_NO_STATUS
+from .literals import (
+    MESSAGE_FEATURE_NO_STATUS, SEARCH_RESULTS_RESTRICT_BATCH_SIZE
+)
 from .search_interpreters import SearchInterpreter
 from .search_models import SearchModel
 from .settings import (
-    setting_backend, setting_backend_arguments, setting_results_limit
+    setting_backend, setting_backend_arguments,
+    setting_indexing_queue_delay, setting_indexing_queue_enable,
+    setting_indexing_queue_flush_size, setting_results_limit
 )
 
 logger = logging.getLogger(name=__name__)
@@ -144,17 +150,45 @@ class SearchBackend:
         return SearchBackend.get_class()(**kwargs)
 
     @staticmethod
-    def limit_queryset(queryset):
-        pk_list = queryset.values('pk')[:setting_results_limit.value]
-        return queryset.filter(pk__in=pk_list)
+    def index_instance_list_enqueue(instance_list, exclude_kwargs=None):
+        """
+        Request the indexing of the instances. When the indexing queue is
+        enabled, the instances are added to the queue. The queue is
+        processed after the changes that queued the instances complete,
+        making the exclusion of the related instances being removed
+        unnecessary.
+        """
+        # Hidden import
+        from .tasks import task_index_instance, task_index_queue_flush
+
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
+        if setting_indexing_queue_enable.value:
+            count = SearchIndexQueueEntry.objects.enqueue(
+                instance_list=instance_list
+            )
+
+            if count >= setting_indexing_queue_flush_size.value:
+                task_index_queue_flush.apply_async(
+                    countdown=setting_indexing_queue_delay.value
+                )
+        else:
+            for instance in instance_list:
+                task_kwargs = {
+                    'app_label': instance._meta.app_label,
+                    'model_name': instance._meta.model_name,
+                    'object_id': instance.pk
+                }
+                task_kwargs.update(exclude_kwargs or {})
+
+                task_index_instance.apply_async(kwargs=task_kwargs)
 
     @staticmethod
     def index_related_instance_m2m(
         action, instance, model, pk_set, search_model_related_paths
     ):
-        # Hidden import
-        from .tasks import task_index_instance
-
         if action in ('post_add', 'pre_remove'):
             instance_paths = search_model_related_paths.get(
                 instance._meta.model, ()
@@ -172,6 +206,8 @@ class SearchBackend:
             else:
                 exclude_kwargs = {}
 
+            entry_list = []
+
             for instance_path in instance_paths:
                 result = ResolverPipelineModelAttribute.resolve(
                     attribute=instance_path, obj=instance
@@ -185,19 +221,13 @@ class SearchBackend:
                     ignored.
                     """
 
-                entries = flatten_list(value=result)
-
-                for entry in entries:
-                    task_kwargs = {
-                        'app_label': entry._meta.app_label,
-                        'model_name': entry._meta.model_name,
-                        'object_id': entry.pk
-                    }
-                    task_kwargs.update(exclude_kwargs)
+                entry_list.extend(
+                    flatten_list(value=result)
+                )
 
-                    task_index_instance.apply_async(
-                        kwargs=task_kwargs
-                    )
+            SearchBackend.index_instance_list_enqueue(
+                exclude_kwargs=exclude_kwargs, instance_list=entry_list
+            )
 
             if action == 'pre_remove':
                 exclude_kwargs = {
@@ -208,30 +238,127 @@ class SearchBackend:
             else:
                 exclude_kwargs = {}
 
+            entry_list = []
+
             for model_instance in model._meta.default_manager.filter(pk__in=pk_set):
                 for instance_path in model_paths:
                     result = ResolverPipelineModelAttribute.resolve(
                         attribute=instance_path, obj=model_instance
                     )
 
-                    entries = flatten_list(value=result)
-
-                    for entry in entries:
-                        task_kwargs = {
-                            'app_label': entry._meta.app_label,
-                            'model_name': entry._meta.model_name,
-                            'object_id': entry.pk
-                        }
-                        task_kwargs.update(exclude_kwargs)
+                    entry_list.extend(
+                        flatten_list(value=result)
+                    )
 
-                        task_index_instance.apply_async(
-                            kwargs=task_kwargs
-                        )
+            SearchBackend.index_instance_list_enqueue(
+                exclude_kwargs=exclude_kwargs, instance_list=entry_list
+            )
 
     def __init__(self, _test_mode=False):
         self._test_mode = _test_mode
 
-    def _search(self, limit, query, search_model, user):
+    def _do_search(
+        self, query, search_model, user, cursor=None, limit=None,
+        queryset=None
+    ):
+        """
+        Resolve the query and return the search interpreter, the queryset
+        of the results the user has access to in the relevance order of
+        the backend and the cursor of the next results.
+        """
+        search_interpreter = SearchInterpreter.init(
+            query=query, search_model=search_model
+        )
+
+        id_list = search_interpreter.do_resolve(search_backend=self)
+
+        queryset = queryset or search_model.get_queryset()
+
+        result_id_list, cursor = self._do_search_result_restrict(
+            cursor=cursor, id_list=id_list, limit=limit, queryset=queryset,
+            search_model=search_model, user=user
+        )
+
+        queryset = queryset.filter(pk__in=result_id_list)
+
+        if result_id_list:
+            queryset = queryset.order_by(
+                Case(
+                    *(
+                        When(pk=pk, then=position)
+                        for position, pk in enumerate(result_id_list)
+                    )
+                )
+            )
+
+        return (search_interpreter, queryset, cursor)
+
+    def _do_search_result_restrict(
+        self, id_list, queryset, search_model, user, cursor=None, limit=None
+    ):
+        """
+        Return the IDs of the results the user has access to, in the
+        order provided by the backend, starting at the `cursor` position
+        of the backend results and up to `limit` results or the results
+        limit. The access control is checked in batches to avoid filtering
+        the queryset with the entire list of results. Also returns the
+        cursor of the next result or None if there are no more results.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        cursor = cursor or 0
+        limit = limit or setting_results_limit.value
+
+        id_iterator = itertools.islice(id_list, cursor, None)
+        id_set = set()
+        position = cursor
+        result = []
+
+        while True:
+            id_batch = list(
+                itertools.islice(
+                    id_iterator, SEARCH_RESULTS_RESTRICT_BATCH_SIZE
+                )
+            )
+
+            if not id_batch:
+                return (result, None)
+
+            queryset_batch = queryset.filter(pk__in=id_batch)
+
+            if search_model.permission:
+                queryset_batch = AccessControlList.objects.restrict_queryset(
+                    permission=search_model.permission,
+                    queryset=queryset_batch, user=user
+                )
+
+            # Backends might return the IDs as text.
+            id_allowed_set = {
+                str(pk) for pk in queryset_batch.values_list('pk', flat=True)
+            }
+
+            for pk in id_batch:
+                position += 1
+
+                pk_text = str(pk)
+                if pk_text in id_allowed_set and pk_text not in id_set:
+                    id_set.add(pk_text)
+                    result.append(pk)
+
+                    if len(result) >= limit:
+                        return (result, position)
+
+    def _search(
+        self, search_field, query_type, value, is_quoted_value=False,
+        is_raw_value=False, limit=None
+    ):
+        """
+        Return the IDs of the objects matching the value. Backends that
+        support it return the IDs ordered by relevance. When `limit` is
+        specified, only that many IDs are required.
+        """
         raise NotImplementedError
 
     def deindex_instance(self, instance):
@@ -318,6 +445,12 @@ class SearchBackend:
         Optional method to setup the backend. Executed once on every boot up.
         """
 
+    def optimize(self):
+        """
+        Optional method to merge or compact the search backend persistent
+        structures. Executed periodically.
+        """
+
     def refresh(self):
         """
         Forces all indexes to update and present an actual view of the
@@ -332,31 +465,15 @@ class SearchBackend:
     def search(
         self, query, search_model, user, store_resultset=False, queryset=None
     ):
-        AccessControlList = apps.get_model(
-            app_label='acls', model_name='AccessControlList'
-        )
         SavedResultset = apps.get_model(
             app_label='dynamic_search', model_name='SavedResultset'
         )
 
-        search_interpreter = SearchInterpreter.init(
-            query=query, search_model=search_model
+        search_interpreter, queryset, cursor = self._do_search(
+            query=query, queryset=queryset, search_model=search_model,
+            user=user
         )
 
-        id_list = search_interpreter.do_resolve(search_backend=self)
-
-        queryset = queryset or search_model.get_queryset()
-
-        queryset = queryset.filter(pk__in=id_list)
-
-        if search_model.permission:
-            queryset = AccessControlList.objects.restrict_queryset(
-                permission=search_model.permission, queryset=queryset,
-                user=user
-            )
-
-        queryset = SearchBackend.limit_queryset(queryset=queryset)
-
         if store_resultset:
             search_explainer_text = search_interpreter.to_explain()
 
@@ -370,6 +487,23 @@ class SearchBackend:
 
         return (saved_resultset, queryset)
 
+    def search_page(
+        self, query, search_model, user, limit, cursor=None, queryset=None
+    ):
+        """
+        Return a queryset with up to `limit` results starting at the
+        `cursor` position of the backend results and the cursor to pass
+        to obtain the next results. The cursor is None when there are no
+        more results. Unlike `search`, the results are not bounded by the
+        results limit.
+        """
+        search_interpreter, queryset, cursor = self._do_search(
+            cursor=cursor, limit=limit, query=query, queryset=queryset,
+            search_model=search_model, user=user
+        )
+
+        return (queryset, cursor)
+
     def tear_down(self):
         """
         Optional method to clean up and/or destroy search backend structures
@@ -160,6 +160,24 @@ class SearchField:
             'transformations', {}
         )
 
+    def get_instance_value_bulk(
+        self, instance_list, search_backend, instance_field_data_dict
+    ):
+        """
+        Return a dictionary with the value of the field for each instance
+        keyed by the instance primary key.
+        """
+        result = {}
+
+        for instance in instance_list:
+            result[instance.pk] = self.get_instance_value(
+                instance=instance,
+                instance_field_data=instance_field_data_dict[instance.pk],
+                search_backend=search_backend
+            )
+
+        return result
+
     def get_help_text(self):
         return self.help_text or getattr(self.model_field, 'help_text', '')
 
@@ -308,6 +326,49 @@ class SearchFieldRelated(SearchFieldConcrete):
 
         return search_backend.do_native_type_conversion(value=result)
 
+    def get_instance_value_bulk(
+        self, instance_list, search_backend, instance_field_data_dict
+    ):
+        """
+        Fetch the related values of all the instances with a single query.
+        """
+        last_field = self.field_name.split(LOOKUP_SEP)[-1]
+
+        value_dict = {
+            instance.pk: [] for instance in instance_list
+        }
+
+        sub_queryset = self.related_model._meta.default_manager.filter(
+            **{
+                '{}{}in'.format(self.reverse_path, LOOKUP_SEP): list(
+                    value_dict
+                )
+            }
+        ).values_list(self.reverse_path, last_field)
+
+        sub_queryset = sub_queryset.filter(
+            **{
+                '{field_name}{lookup_separator}isnull'.format(
+                    field_name=last_field, lookup_separator=LOOKUP_SEP
+                ): False
+            }
+        )
+
+        sub_queryset = sub_queryset.distinct()
+
+        for pk, item in sub_queryset:
+            item_value = self.do_value_index_transform(
+                search_backend=search_backend, value=item
+            )
+            if item_value:
+                value_dict[pk].append(item_value)
+
+        return {
+            pk: search_backend.do_native_type_conversion(
+                value=value
+            ) for pk, value in value_dict.items()
+        }
+
 
 class SearchFieldVirtual(SearchField):
     """
@@ -316,6 +316,48 @@ class SearchModel(AppsModuleLoaderMixin):
 
         return instance_field_data
 
+    def populate_bulk(self, queryset, search_backend):
+        """
+        Return a list of the queryset instances and their field data.
+        Related search fields are resolved with a single query for all
+        the instances instead of one query per instance.
+        """
+        select_related_list = [
+            search_field.field_name for search_field in self.search_fields
+            if search_field.concrete
+            if not search_field.collection
+            if search_field.model_field.is_relation
+        ]
+
+        if select_related_list:
+            queryset = queryset.select_related(*select_related_list)
+
+        instance_list = list(queryset)
+
+        instance_field_data_dict = {
+            instance.pk: {} for instance in instance_list
+        }
+
+        # Process the search fields by order of priority. This makes sure
+        # that virtual fields are processed last.
+        for search_field in self.search_fields_priority_sorted:
+            field_value_dict = search_field.get_instance_value_bulk(
+                instance_field_data_dict=instance_field_data_dict,
+                instance_list=instance_list, search_backend=search_backend
+            )
+
+            for pk, field_value in field_value_dict.items():
+                if field_value is not None:
+                    instance_field_data_dict[pk][
+                        search_field.field_name
+                    ] = field_value
+
+        return [
+            (
+                instance, instance_field_data_dict[instance.pk]
+            ) for instance in instance_list
+        ]
+
     @property
     def proxies(self):
         result = []
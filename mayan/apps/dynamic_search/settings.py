@@ -5,7 +5,9 @@ from mayan.apps.smart_settings.settings import setting_cluster
 from .literals import (
     DEFAULT_SEARCH_BACKEND, DEFAULT_SEARCH_BACKEND_ARGUMENTS,
     DEFAULT_SEARCH_DEFAULT_OPERATOR, DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH,
-    DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    DEFAULT_SEARCH_INDEXING_CHUNK_SIZE, DEFAULT_SEARCH_INDEXING_QUEUE_DELAY,
+    DEFAULT_SEARCH_INDEXING_QUEUE_ENABLE,
+    DEFAULT_SEARCH_INDEXING_QUEUE_FLUSH_SIZE,
     DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
     DEFAULT_SEARCH_MODEL_FIELD_DISABLE,
     DEFAULT_SEARCH_QUERY_RESULTS_LIMIT, DEFAULT_SEARCH_RESULTS_LIMIT,
@@ -53,6 +55,31 @@ setting_indexing_chunk_size = setting_namespace.do_setting_add(
         message='Amount of objects to process when performing bulk indexing.'
     )
 )
+setting_indexing_queue_delay = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_INDEXING_QUEUE_DELAY,
+    global_name='SEARCH_INDEXING_QUEUE_DELAY', help_text=_(
+        message='Time in seconds that an object must remain unchanged in '
+        'the indexing queue before it is indexed. Repeated changes to an '
+        'object during this time result in a single indexing. Must be '
+        'long enough for the changes that queued the object to complete.'
+    )
+)
+setting_indexing_queue_enable = setting_namespace.do_setting_add(
+    choices=('false', 'true'), default=DEFAULT_SEARCH_INDEXING_QUEUE_ENABLE,
+    global_name='SEARCH_INDEXING_QUEUE_ENABLE', help_text=_(
+        message='Collect the objects to index in a deduplicated queue that '
+        'is processed periodically in batches instead of indexing each '
+        'object as soon as it changes.'
+    )
+)
+setting_indexing_queue_flush_size = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_INDEXING_QUEUE_FLUSH_SIZE,
+    global_name='SEARCH_INDEXING_QUEUE_FLUSH_SIZE', help_text=_(
+        message='Number of objects queued by a single change that causes '
+        'the indexing queue to be processed without waiting for the next '
+        'periodic run.'
+    )
+)
 setting_match_all_default_value = setting_namespace.do_setting_add(
     global_name='SEARCH_MATCH_ALL_DEFAULT_VALUE',
     default=DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE, help_text=_(
@@ -132,6 +132,18 @@ def task_index_instances(self, search_model_full_name, id_list):
         raise DynamicSearchException(error_message) from exception
 
 
+@app.task(ignore_result=True)
+def task_index_queue_flush():
+    SearchIndexQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+    )
+
+    count = SearchIndexQueueEntry.objects.flush()
+
+    if count:
+        logger.info('Dispatched %d queued objects', count)
+
+
 @app.task(
     bind=True, ignore_result=True,
     max_retries=TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES,
@@ -167,6 +179,19 @@ def task_index_related_instance_m2m(
     )
 
 
+@app.task(ignore_result=True)
+def task_optimize_backend():
+    search_backend = SearchBackend.get_instance()
+
+    try:
+        search_backend.optimize()
+    except (DynamicSearchRetry, LockError) as exception:
+        # Optimization is periodic, try again on the next run.
+        logger.info(
+            str(exception)
+        )
+
+
 @app.task(ignore_result=True)
 def task_reindex_backend():
     search_backend = SearchBackend.get_instance()
@@ -1,5 +1,14 @@
 import uuid
 
+TEST_DATABASE_TOKEN_LIST = ['test_char', 'value', 'other']
+TEST_DATABASE_TOKEN_VALUE = 'Test-char VALUE, other.'
+
+TEST_FUZZY_TERM = 'abcdefghijklmnopqrstuvwxyz0123456789abcd'
+TEST_FUZZY_TERM_LENGTH_MAXIMUM = 40
+TEST_FUZZY_TERM_LENGTH_MINIMUM = 3
+
+TEST_INDEX_SEGMENT_COUNT = 6
+
 TEST_OBJECT_BIG_INTEGER_VALUE = 2 ** 60
 TEST_OBJECT_BOOLEAN_VALUE = True
 TEST_OBJECT_CHAR_VALUE = 'test char value'
@@ -13,10 +22,15 @@ TEST_OBJECT_UUID_VALUE = uuid.uuid4()
 TEST_QUERY_TYPE_ALIAS_INVALID = '|||'
 
 TEST_SEARCH_MODEL_FIELD_NAME = 'test'
+TEST_SEARCH_MODEL_POPULATE_BULK_QUERY_COUNT = 4
 
 TEST_SEARCH_OBJECT_TERM = 'document'
 TEST_SEARCH_OBJECT_TERMS = ('document', 'stub')
 
+TEST_SEARCH_RESULTS_LIMIT = 5
+TEST_SEARCH_RESULTS_PAGE_SIZE = 4
+TEST_SEARCH_RESULTS_RESTRICT_BATCH_SIZE = 3
+
 # General
 
 TEST_SCOPED_QUERY_ENTRY_SCOPE_IDENTIFIER = '0'
@@ -1,6 +1,6 @@
-from unittest import skip
+from unittest import mock, skip
 
-from django.test import tag
+from django.test import override_settings, tag
 
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.search import search_model_document
@@ -8,7 +8,10 @@ from mayan.apps.documents.tests.mixins.document_mixins import (
     DocumentTestMixin
 )
 
-from ..literals import TEST_SEARCH_OBJECT_TERM
+from ..literals import (
+    TEST_SEARCH_OBJECT_TERM, TEST_SEARCH_RESULTS_LIMIT,
+    TEST_SEARCH_RESULTS_PAGE_SIZE, TEST_SEARCH_RESULTS_RESTRICT_BATCH_SIZE
+)
 
 from .base import TestSearchObjectSimpleTestMixin
 
@@ -38,6 +41,127 @@ class SearchBackendLimitTestMixin(
             queryset.count(), test_document_count
         )
 
+    @mock.patch(
+        target='mayan.apps.dynamic_search.search_backends.SEARCH_RESULTS_RESTRICT_BATCH_SIZE',
+        new=TEST_SEARCH_RESULTS_RESTRICT_BATCH_SIZE
+    )
+    @override_settings(SEARCH_RESULTS_LIMIT=TEST_SEARCH_RESULTS_LIMIT)
+    def test_search_results_limit_with_access(self):
+        test_document_count = 20
+        self._create_test_document_stubs(count=test_document_count)
+
+        test_document_list = self._test_document_list[
+            -test_document_count:
+        ][::2]
+
+        for test_document in test_document_list:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        self._clear_events()
+
+        saved_resultset, queryset = self._test_search_backend.search(
+            search_model=search_model_document,
+            query={
+                'label': '*{}'.format(TEST_SEARCH_OBJECT_TERM)
+            },
+            user=self._test_case_user
+        )
+        self.assertEqual(
+            queryset.count(), TEST_SEARCH_RESULTS_LIMIT
+        )
+
+        for test_document in queryset:
+            self.assertTrue(test_document in test_document_list)
+
+    def test_search_results_relevance_order(self):
+        self._create_test_document_stubs(count=4)
+
+        for test_document in self._test_document_list:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        test_document_id_list = [
+            test_document.pk for test_document in self._test_document_list
+        ][::-1]
+
+        self._clear_events()
+
+        with mock.patch.object(
+            attribute='_search', return_value=test_document_id_list,
+            target=self._test_search_backend._backend
+        ):
+            saved_resultset, queryset = self._test_search_backend.search(
+                search_model=search_model_document,
+                query={
+                    'label': '*{}'.format(TEST_SEARCH_OBJECT_TERM)
+                },
+                user=self._test_case_user
+            )
+
+        self.assertEqual(
+            list(
+                queryset.values_list('pk', flat=True)
+            ), test_document_id_list
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @mock.patch(
+        target='mayan.apps.dynamic_search.search_backends.SEARCH_RESULTS_RESTRICT_BATCH_SIZE',
+        new=TEST_SEARCH_RESULTS_RESTRICT_BATCH_SIZE
+    )
+    @override_settings(SEARCH_RESULTS_LIMIT=TEST_SEARCH_RESULTS_LIMIT)
+    def test_search_page(self):
+        test_document_count = 20
+        self._create_test_document_stubs(count=test_document_count)
+
+        test_document_list = self._test_document_list[
+            -test_document_count:
+        ][::2]
+
+        for test_document in test_document_list:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        self._clear_events()
+
+        cursor = None
+        page_count = 0
+        result_id_list = []
+
+        while True:
+            queryset, cursor = self._test_search_backend.search_page(
+                cursor=cursor, limit=TEST_SEARCH_RESULTS_PAGE_SIZE,
+                search_model=search_model_document,
+                query={
+                    'label': '*{}'.format(TEST_SEARCH_OBJECT_TERM)
+                },
+                user=self._test_case_user
+            )
+            page_count += 1
+            result_id_list.extend(
+                queryset.values_list('pk', flat=True)
+            )
+
+            if cursor is None:
+                break
+
+        # The pages continue past the results limit.
+        self.assertTrue(page_count > 1)
+        self.assertEqual(
+            sorted(result_id_list), sorted(
+                test_document.pk for test_document in test_document_list
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
 
 class BackendSearchTestMixin:
     _test_search_model = None
@@ -65,6 +189,11 @@ class BackendSearchTestMixin:
         )
 
 
+@tag('search-database')
+class DatabaseSearchBackendTestMixin:
+    _test_search_backend_path = 'mayan.apps.dynamic_search.backends.database.DatabaseSearchBackend'
+
+
 @tag('search-django')
 class DjangoSearchBackendTestMixin:
     _test_search_backend_path = 'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend'
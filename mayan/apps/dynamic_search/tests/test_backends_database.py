@@ -0,0 +1,166 @@
+from unittest import skip
+
+from django.apps import apps
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..search_query_types import (
+    QueryTypeExact, QueryTypeFuzzy, QueryTypePartial
+)
+
+from .literals import (
+    TEST_DATABASE_TOKEN_LIST, TEST_DATABASE_TOKEN_VALUE,
+    TEST_OBJECT_CHAR_VALUE
+)
+from .mixins.backend_mixins import (
+    BackendSearchTestMixin, DatabaseSearchBackendTestMixin,
+    SearchBackendLimitTestMixin
+)
+from .mixins.backend_query_type_mixins import (
+    BackendFieldTypeQueryTypeTestCaseMixin
+)
+from .mixins.backend_search_field_mixins import (
+    BackendSearchFieldTestCaseMixin
+)
+from .mixins.base import TestSearchObjectSimpleTestMixin
+
+
+class DatabaseSearchBackendSearchFieldTestCase(
+    BackendSearchFieldTestCaseMixin, DatabaseSearchBackendTestMixin,
+    BaseTestCase
+):
+    """
+    Field test case for the database backend.
+    """
+
+
+class DatabaseSearchBackendFieldTypeQueryTypeTestCase(
+    BackendFieldTypeQueryTypeTestCaseMixin, DatabaseSearchBackendTestMixin,
+    BaseTestCase
+):
+    @skip(reason='Backend does not support the feature.')
+    def test_search_field_type_char_search_exact_accent(self):
+        """
+        Matches are verified using the queries of the Django backend which
+        does not support this feature.
+        """
+
+
+class DatabaseSearchBackendLimitTestCase(
+    DatabaseSearchBackendTestMixin, SearchBackendLimitTestMixin,
+    BaseTestCase
+):
+    """
+    Search limit test case for the database backend.
+    """
+
+
+class DatabaseSearchBackendSpecificTestCase(
+    BackendSearchTestMixin, TestSearchObjectSimpleTestMixin,
+    DatabaseSearchBackendTestMixin, BaseTestCase
+):
+    def _get_test_object_posting_queryset(self):
+        SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+
+        return SearchIndexPosting.objects.filter(
+            object_id=self._test_object.pk,
+            search_model_name=self._test_search_model.full_name
+        )
+
+    def test_deindex_instance(self):
+        self._test_object.delete()
+
+        self.assertFalse(
+            self._get_test_object_posting_queryset().exists()
+        )
+
+    def test_index_instance(self):
+        token_list = self._get_test_object_posting_queryset().filter(
+            field_name='char'
+        ).values_list('token__value', flat=True)
+
+        self.assertEqual(
+            sorted(token_list), sorted(
+                TEST_OBJECT_CHAR_VALUE.split()
+            )
+        )
+
+    def test_index_instance_non_text_fields(self):
+        self.assertFalse(
+            self._get_test_object_posting_queryset().filter(
+                field_name__in=('integer', 'uuid')
+            ).exists()
+        )
+
+    def test_index_instances(self):
+        self._get_test_object_posting_queryset().delete()
+
+        self._test_search_backend.index_instances(
+            id_list=(self._test_object.pk,),
+            search_model=self._test_search_model
+        )
+
+        self.assertTrue(
+            self._get_test_object_posting_queryset().exists()
+        )
+
+    def test_search_exact_uses_postings(self):
+        self._get_test_object_posting_queryset().delete()
+
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', query_type=QueryTypeExact, value='char'
+            )
+        )
+        self.assertFalse(self._test_object.id in id_list)
+
+    def test_search_exact_phrase(self):
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', is_quoted_value=True,
+                query_type=QueryTypeExact, value='char value'
+            )
+        )
+        self.assertTrue(self._test_object.id in id_list)
+
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', is_quoted_value=True,
+                query_type=QueryTypeExact, value='value char'
+            )
+        )
+        self.assertFalse(self._test_object.id in id_list)
+
+    def test_search_fuzzy_uses_postings(self):
+        self._get_test_object_posting_queryset().delete()
+
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', query_type=QueryTypeFuzzy, value='chra'
+            )
+        )
+        self.assertFalse(self._test_object.id in id_list)
+
+    def test_search_partial_uses_postings(self):
+        self._get_test_object_posting_queryset().delete()
+
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', query_type=QueryTypePartial, value='har'
+            )
+        )
+        self.assertFalse(self._test_object.id in id_list)
+
+    def test_status(self):
+        self.assertTrue(
+            'Tokens:' in self._test_search_backend.get_status()
+        )
+
+    def test_token_list(self):
+        self.assertEqual(
+            self._test_search_backend.get_token_list(
+                value=TEST_DATABASE_TOKEN_VALUE
+            ), TEST_DATABASE_TOKEN_LIST
+        )
@@ -2,6 +2,12 @@ from unittest import skip
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..backends.django.backend_query_types import BackendQueryFuzzy
+
+from .literals import (
+    TEST_FUZZY_TERM, TEST_FUZZY_TERM_LENGTH_MAXIMUM,
+    TEST_FUZZY_TERM_LENGTH_MINIMUM
+)
 from .mixins.backend_mixins import (
     DjangoSearchBackendTestMixin, SearchBackendLimitTestMixin
 )
@@ -33,20 +39,6 @@ class DjangoSearchBackendFieldTypeQueryTypeTestCase(
         for this feature to work.
         """
 
-    @skip(reason='Backend does not support the feature.')
-    def test_search_field_type_char_search_fuzzy(self):
-        """
-        This query type is emulated and does not return the same results
-        as backends support this natively.
-        """
-
-    @skip(reason='Backend does not support the feature.')
-    def test_search_field_type_text_search_fuzzy(self):
-        """
-        This query type is emulated and does not return the same results
-        as backends support this natively.
-        """
-
 
 class DjangoSearchBackendLimitTestCase(
     DjangoSearchBackendTestMixin, SearchBackendLimitTestMixin, BaseTestCase
@@ -54,3 +46,30 @@ class DjangoSearchBackendLimitTestCase(
     """
     Search limit test case for the Django backend.
     """
+
+
+class DjangoSearchBackendQueryFuzzyTestCase(BaseTestCase):
+    def test_pattern_list(self):
+        pattern_list = [
+            ''.join(pattern) for pattern in BackendQueryFuzzy.get_pattern_list(
+                value='char'
+            )
+        ]
+
+        self.assertTrue('char' in pattern_list)
+        self.assertTrue('chr' in pattern_list)
+        self.assertTrue('chra' in pattern_list)
+        self.assertTrue('c\\war' in pattern_list)
+        self.assertTrue('ch\\war' in pattern_list)
+
+    def test_pattern_list_size(self):
+        for length in range(TEST_FUZZY_TERM_LENGTH_MINIMUM, TEST_FUZZY_TERM_LENGTH_MAXIMUM + 1):
+            pattern_list = BackendQueryFuzzy.get_pattern_list(
+                value=TEST_FUZZY_TERM[:length]
+            )
+
+            # One pattern per insertion, deletion, substitution and
+            # transposition position, plus the term itself.
+            self.assertTrue(
+                len(pattern_list) <= 4 * length + 1
+            )
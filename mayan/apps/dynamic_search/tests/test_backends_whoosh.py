@@ -2,6 +2,7 @@ from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..search_query_types import QueryTypeExact
 
+from .literals import TEST_INDEX_SEGMENT_COUNT
 from .mixins.backend_mixins import (
     BackendSearchTestMixin, SearchBackendLimitTestMixin,
     WhooshSearchBackendTestMixin
@@ -45,6 +46,51 @@ class WhooshSearchBackendSpecificTestCase(
     BackendSearchTestMixin, TestSearchObjectSimpleTestMixin,
     WhooshSearchBackendTestMixin, BaseTestCase
 ):
+    def _get_test_index_segment_count(self):
+        index = self._test_search_backend._get_or_create_index(
+            search_model=self._test_search_model
+        )
+        return len(
+            index._segments()
+        )
+
+    def test_index_instances_single_commit(self):
+        self._create_test_search_objects()
+        self._create_test_search_objects()
+
+        segment_count = self._get_test_index_segment_count()
+
+        self._test_search_backend.index_instances(
+            id_list=self._test_search_model.get_queryset().values_list(
+                'pk', flat=True
+            ), search_model=self._test_search_model
+        )
+
+        self.assertEqual(
+            self._get_test_index_segment_count(), segment_count + 1
+        )
+
+    def test_optimize(self):
+        for index in range(TEST_INDEX_SEGMENT_COUNT):
+            self._create_test_search_objects()
+
+        segment_count = self._get_test_index_segment_count()
+
+        self._test_search_backend.optimize()
+
+        self.assertTrue(
+            self._get_test_index_segment_count() < segment_count
+        )
+
+        id_list = tuple(
+            self._do_backend_search(
+                field_name='char', query_type=QueryTypeExact, value='char'
+            )
+        )
+        self.assertEqual(
+            len(id_list), TEST_INDEX_SEGMENT_COUNT + 1
+        )
+
     def test_whoosh_datetime_search_raw_parsed_date_human_today(self):
         generator = self._do_backend_search(
             field_name='datetime',
@@ -1,5 +1,7 @@
 from unittest import skip
 
+from django.test import override_settings
+
 from mayan.apps.common.tests.mixins import ManagementCommandTestMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
@@ -244,6 +246,20 @@ class ElasticSearchStatusManagementCommandTestCase(
     """Test against ElasticSearch backend."""
 
 
+@override_settings(SEARCH_INDEXING_QUEUE_ENABLE=True)
+class SearchStatusManagementCommandIndexingQueueTestCase(
+    SearchStatusManagementCommandTestCaseMixin, BaseTestCase
+):
+    def test_artifacts(self):
+        stdout, stderr = self._call_test_management_command()
+
+        self.assertTrue(
+            'Indexing queue backlog: {}'.format(
+                len(self._test_object_list)
+            ) in stdout
+        )
+
+
 class WhooshSearchStatusManagementCommandTestCase(
     SearchStatusManagementCommandTestCaseMixin, BaseTestCase
 ):
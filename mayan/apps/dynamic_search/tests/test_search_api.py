@@ -1,10 +1,26 @@
+from urllib.parse import parse_qs, urlparse
+
 from rest_framework import status
 
+from django.test import override_settings
+
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.tests.mixins.document_mixins import (
     DocumentTestMixin
 )
+from mayan.apps.rest_api.literals import (
+    DEFAULT_PAGE_SIZE_QUERY_PARAMETER, PAGINATION_MODE_CURSOR,
+    QUERY_PAGINATION_MODE_PARAMETER
+)
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
+
+from ..literals import QUERY_PARAMETER_CURSOR
+
+from .literals import (
+    TEST_SEARCH_OBJECT_TERM, TEST_SEARCH_RESULTS_LIMIT,
+    TEST_SEARCH_RESULTS_PAGE_SIZE
+)
 
 from .mixins.base import TestSearchObjectSimpleTestMixin
 from .mixins.search_api_mixins import SearchAPIViewTestMixin
@@ -146,6 +162,92 @@ class SearchAPIViewTestCase(
         self.assertEqual(events.count(), 0)
 
 
+@override_settings(SEARCH_RESULTS_LIMIT=TEST_SEARCH_RESULTS_LIMIT)
+class SearchAPIViewCursorPaginationTestCase(
+    DocumentTestMixin, SearchAPIViewTestMixin, SettingOverrideTestMixin,
+    TestSearchObjectSimpleTestMixin, BaseAPITestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stubs(count=TEST_SEARCH_RESULTS_LIMIT + 2)
+
+        for test_document in self._test_document_list:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+    def test_search_api_view_cursor_pagination(self):
+        self._clear_events()
+
+        query = {
+            DEFAULT_PAGE_SIZE_QUERY_PARAMETER: TEST_SEARCH_RESULTS_PAGE_SIZE,
+            QUERY_PAGINATION_MODE_PARAMETER: PAGINATION_MODE_CURSOR
+        }
+        page_count = 0
+        result_id_list = []
+
+        while True:
+            response = self._request_search_simple_view(
+                query=query, search_term='*{}'.format(TEST_SEARCH_OBJECT_TERM)
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            page_count += 1
+            result_id_list.extend(
+                result['id'] for result in response.data['results']
+            )
+
+            if not response.data['next']:
+                break
+
+            query[QUERY_PARAMETER_CURSOR] = parse_qs(
+                qs=urlparse(
+                    url=response.data['next']
+                ).query
+            )[QUERY_PARAMETER_CURSOR][0]
+
+        # The results continue past the results limit.
+        self.assertEqual(page_count, 2)
+        self.assertEqual(
+            sorted(result_id_list), sorted(
+                test_document.pk for test_document in self._test_document_list
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_search_api_view_cursor_pagination_invalid_cursor(self):
+        self._clear_events()
+
+        response = self._request_search_simple_view(
+            query={
+                QUERY_PAGINATION_MODE_PARAMETER: PAGINATION_MODE_CURSOR,
+                QUERY_PARAMETER_CURSOR: 'invalid'
+            }, search_term='*{}'.format(TEST_SEARCH_OBJECT_TERM)
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_search_api_view_page_number_pagination(self):
+        self._clear_events()
+
+        response = self._request_search_simple_view(
+            search_term='*{}'.format(TEST_SEARCH_OBJECT_TERM)
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['count'], TEST_SEARCH_RESULTS_LIMIT
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+
 class SearchFilterCombinatiomAPITestCase(
     SearchAPIViewTestMixin, DocumentTestMixin,
     TestSearchObjectSimpleTestMixin, BaseAPITestCase
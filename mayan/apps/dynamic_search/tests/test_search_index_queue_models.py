@@ -0,0 +1,97 @@
+from unittest import mock
+
+from kombu.exceptions import OperationalError
+
+from django.apps import apps
+from django.test import override_settings
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from .mixins.backend_mixins import DatabaseSearchBackendTestMixin
+from .mixins.base import TestSearchObjectSimpleTestMixin
+
+
+@override_settings(SEARCH_INDEXING_QUEUE_ENABLE=True)
+class SearchIndexQueueEntryModelTestCase(
+    DatabaseSearchBackendTestMixin, TestSearchObjectSimpleTestMixin,
+    BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self.SearchIndexPosting = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexPosting'
+        )
+        self.SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
+    def _get_test_object_queue_entry_queryset(self):
+        return self.SearchIndexQueueEntry.objects.filter(
+            object_id=self._test_object.pk,
+            search_model_name=self._test_search_model.full_name
+        )
+
+    def _get_test_object_posting_queryset(self):
+        return self.SearchIndexPosting.objects.filter(
+            object_id=self._test_object.pk,
+            search_model_name=self._test_search_model.full_name
+        )
+
+    def test_enqueue(self):
+        self.assertEqual(
+            self._get_test_object_queue_entry_queryset().count(), 1
+        )
+        self.assertFalse(
+            self._get_test_object_posting_queryset().exists()
+        )
+
+    def test_enqueue_deduplication(self):
+        self._test_object.save()
+        self._test_object.save()
+
+        self.assertEqual(
+            self._get_test_object_queue_entry_queryset().count(), 1
+        )
+
+    def test_enqueue_datetime_update(self):
+        queue_entry = self._get_test_object_queue_entry_queryset().get()
+
+        self._test_object.save()
+
+        self.assertTrue(
+            self._get_test_object_queue_entry_queryset().get().datetime > queue_entry.datetime
+        )
+
+    @override_settings(SEARCH_INDEXING_QUEUE_DELAY=0)
+    def test_flush(self):
+        self.SearchIndexQueueEntry.objects.flush()
+
+        self.assertEqual(
+            self._get_test_object_queue_entry_queryset().count(), 0
+        )
+        self.assertTrue(
+            self._get_test_object_posting_queryset().exists()
+        )
+
+    def test_flush_delay(self):
+        self.SearchIndexQueueEntry.objects.flush()
+
+        self.assertEqual(
+            self._get_test_object_queue_entry_queryset().count(), 1
+        )
+
+    @override_settings(SEARCH_INDEXING_QUEUE_DELAY=0)
+    def test_flush_dispatch_error(self):
+        with mock.patch(
+            side_effect=OperationalError,
+            target='mayan.apps.dynamic_search.tasks.task_index_instances.apply_async'
+        ):
+            with self.assertRaises(expected_exception=OperationalError):
+                self.SearchIndexQueueEntry.objects.flush()
+
+        self.assertEqual(
+            self._get_test_object_queue_entry_queryset().count(), 1
+        )
+        self.assertFalse(
+            self._get_test_object_posting_queryset().exists()
+        )
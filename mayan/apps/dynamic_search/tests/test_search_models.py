@@ -5,8 +5,10 @@ from mayan.apps.testing.tests.base import BaseTestCase
 from ..search_models import SearchModel
 from ..settings import setting_search_model_field_disable
 
-from .literals import TEST_SEARCH_MODEL_FIELD_NAME
-from .mixins.base import SearchTestMixin
+from .literals import (
+    TEST_SEARCH_MODEL_FIELD_NAME, TEST_SEARCH_MODEL_POPULATE_BULK_QUERY_COUNT
+)
+from .mixins.base import SearchTestMixin, TestSearchObjectHierarchyTestMixin
 
 
 class SearchModelTestCase(SearchTestMixin, BaseTestCase):
@@ -75,3 +77,43 @@ class SearchModelTestCase(SearchTestMixin, BaseTestCase):
         self.assertTrue(
             test_search_field not in self._test_search_model.search_fields
         )
+
+
+class SearchModelPopulateBulkTestCase(
+    TestSearchObjectHierarchyTestMixin, BaseTestCase
+):
+    def _get_test_queryset(self):
+        return self._test_search_grandparent.get_queryset().order_by('pk')
+
+    def test_populate_bulk(self):
+        result = self._test_search_grandparent.populate_bulk(
+            queryset=self._get_test_queryset(),
+            search_backend=self._test_search_backend
+        )
+
+        self.assertEqual(
+            result, [
+                (
+                    instance, self._test_search_grandparent.populate(
+                        instance=instance,
+                        search_backend=self._test_search_backend
+                    )
+                ) for instance in self._get_test_queryset()
+            ]
+        )
+
+    def test_populate_bulk_query_count(self):
+        for index in range(3):
+            self._test_model_dict['TestModelGrandParent'].objects.create(
+                label='grandparent_{}'.format(index)
+            )
+
+        with self.assertNumQueries(
+            num=TEST_SEARCH_MODEL_POPULATE_BULK_QUERY_COUNT
+        ):
+            result = self._test_search_grandparent.populate_bulk(
+                queryset=self._get_test_queryset(),
+                search_backend=self._test_search_backend
+            )
+
+        self.assertEqual(len(result), 4)
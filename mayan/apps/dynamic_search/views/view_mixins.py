@@ -157,7 +157,14 @@ class SearchModelViewMixin:
 
 
 class SearchResultViewMixin(SearchQueryViewMixin):
-    def do_search_execute(self, store_resultset=False):
+    search_cursor_next = None
+
+    def do_search_execute(self, store_resultset=False, cursor=None, limit=None):
+        """
+        Perform the search. When `limit` is specified, only a page of
+        results starting at `cursor` is returned and the cursor of the
+        next page is stored in `search_cursor_next`.
+        """
         query_dict = self.get_search_query()
 
         self.search_interpreter = SearchInterpreter.init(
@@ -170,11 +177,20 @@ class SearchResultViewMixin(SearchQueryViewMixin):
         if query_clean and not query_is_empty:
             try:
                 search_backend = SearchBackend.get_instance()
-                saved_resultset, queryset = search_backend.search(
-                    search_model=self.search_model,
-                    store_resultset=store_resultset, query=query_clean,
-                    user=self.request.user
-                )
+
+                if limit:
+                    saved_resultset = None
+                    queryset, self.search_cursor_next = search_backend.search_page(
+                        cursor=cursor, limit=limit,
+                        search_model=self.search_model, query=query_clean,
+                        user=self.request.user
+                    )
+                else:
+                    saved_resultset, queryset = search_backend.search(
+                        search_model=self.search_model,
+                        store_resultset=store_resultset, query=query_clean,
+                        user=self.request.user
+                    )
             except DynamicSearchException as exception:
                 if settings.DEBUG or settings.TESTING:
                     raise
@@ -188,7 +204,9 @@ class SearchResultViewMixin(SearchQueryViewMixin):
             queryset = self.search_model.get_queryset().none()
             return (None, queryset)
 
-    def get_search_queryset(self):
-        saved_resultset, queryset = self.do_search_execute()
+    def get_search_queryset(self, cursor=None, limit=None):
+        saved_resultset, queryset = self.do_search_execute(
+            cursor=cursor, limit=limit
+        )
 
         return queryset
@@ -29,6 +29,7 @@ class APIEventListView(generics.ListAPIView):
     get: Returns a list of all the available events.
     """
     mayan_view_permission_map = {'GET': permission_events_view}
+    pagination_cursor_ordering = '-pk'
     serializer_class = EventSerializer
     source_queryset = Action.objects.all()
 
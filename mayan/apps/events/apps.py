@@ -1,5 +1,10 @@
+import atexit
+
+from celery.signals import task_postrun
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.signals import request_finished
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -12,7 +17,8 @@ from mayan.apps.common.menus import (
 from mayan.apps.forms import column_widgets
 from mayan.apps.navigation.source_columns import SourceColumn
 
-from .classes import EventTypeNamespace
+from .classes import EventCommitBuffer, EventTypeNamespace
+from .handlers import handler_event_commit_buffer_flush
 from .html_widgets import widget_event_actor_link, widget_event_type_link
 from .links import (
     link_event_list, link_event_list_clear, link_event_list_export,
@@ -235,3 +241,17 @@ class EventsApp(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_event_list,)
         )
+
+        # Send the events buffered by a worker when the request or task
+        # that committed them finishes and when the process exits.
+        atexit.register(EventCommitBuffer.flush)
+
+        request_finished.connect(
+            dispatch_uid='events_handler_event_commit_buffer_flush_request',
+            receiver=handler_event_commit_buffer_flush
+        )
+        # Celery signals only accept the receiver as a positional argument.
+        task_postrun.connect(
+            handler_event_commit_buffer_flush,
+            dispatch_uid='events_handler_event_commit_buffer_flush_task'
+        )
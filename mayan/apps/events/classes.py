@@ -1,16 +1,18 @@
 import csv
 import logging
+import threading
 
 from furl import furl
 
 from django.apps import apps
-from django.contrib.auth import get_user_model
+from django.db import connection, models
+from django.db.models import F, Value
+from django.db.models.signals import post_save
 from django.db.utils import OperationalError, ProgrammingError
 from django.urls import reverse
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
-from actstream import action
-
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 from mayan.apps.common.menus import menu_list_facet
 from mayan.apps.organizations.utils import get_organization_installation_url
@@ -27,7 +29,10 @@ from .literals import (
 from .permissions import (
     permission_events_clear, permission_events_export, permission_events_view
 )
-from .settings import setting_disable_asynchronous_mode
+from .settings import (
+    setting_commit_buffer_enable, setting_commit_buffer_size,
+    setting_disable_asynchronous_mode
+)
 
 DEFAULT_ACTION_EXPORTER_FIELD_NAMES = (
     'timestamp', 'id', 'actor_content_type', 'actor_object_id', 'actor',
@@ -131,6 +136,50 @@ class ActionExporter:
             )
 
 
+class EventCommitBuffer:
+    """
+    Buffer the events committed by each worker thread. The buffered events
+    are sent as a single batch task when the buffer is full or when the
+    request or task that committed them finishes.
+    """
+    _thread_local = threading.local()
+
+    @classmethod
+    def append(cls, event_entry):
+        event_entry_list = cls.get_event_entry_list()
+        event_entry_list.append(event_entry)
+
+        buffer_full = len(event_entry_list) >= setting_commit_buffer_size.value
+
+        if not setting_commit_buffer_enable.value or buffer_full:
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        # Hidden import.
+        # This circular import is necessary.
+        from .tasks import task_event_commit_batch
+
+        event_entry_list = cls.get_event_entry_list()
+
+        if event_entry_list:
+            # Replace the buffer before sending the batch in case the
+            # task is executed eagerly and commits events of its own.
+            cls._thread_local.event_entry_list = []
+
+            task_event_commit_batch.apply_async(
+                kwargs={'event_entry_list': event_entry_list}
+            )
+
+    @classmethod
+    def get_event_entry_list(cls):
+        try:
+            return cls._thread_local.event_entry_list
+        except AttributeError:
+            cls._thread_local.event_entry_list = []
+            return cls._thread_local.event_entry_list
+
+
 class EventModelRegistry:
     _registry = set()
 
@@ -290,6 +339,189 @@ class EventType:
             event_type_list=cls._registry.values()
         )
 
+    @classmethod
+    def do_commit_batch(cls, event_list):
+        """
+        Store a batch of events. Each event is a dictionary with the keys
+        `event_type`, `action_object`, `actor`, `target`, and `timestamp`.
+        The actions are inserted in bulk, the subscribers of the entire
+        batch are resolved with a single query and the notifications are
+        inserted in bulk.
+        """
+        # Hidden import.
+        from actstream.registry import check as registry_check
+
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+        EventSubscription = apps.get_model(
+            app_label='events', model_name='EventSubscription'
+        )
+        Notification = apps.get_model(
+            app_label='events', model_name='Notification'
+        )
+        ObjectEventSubscription = apps.get_model(
+            app_label='events', model_name='ObjectEventSubscription'
+        )
+
+        action_list = []
+        # List of the actions and the subscription keys that produce
+        # notifications for each.
+        action_subscription_key_list = []
+
+        for event in event_list:
+            action_object = event['action_object']
+            actor = event['actor']
+            event_type = event['event_type']
+            target = event['target']
+
+            if actor is None and target is None:
+                # If the actor and the target are None there is no way to
+                # create a new event.
+                logger.warning(
+                    'Attempting to commit event "%s" without an actor or a '
+                    'target. This is not supported.', event_type
+                )
+                continue
+
+            action = Action(
+                actor=actor or target, timestamp=event['timestamp'],
+                verb=event_type.id
+            )
+
+            subscription_key_list = []
+
+            # Subscriptions are only checked for actions with a target or
+            # an action object.
+            if action_object or target:
+                subscription_key_list.append(
+                    (event_type.id, None, None)
+                )
+
+            for obj in (action_object, target):
+                if obj is not None:
+                    registry_check(obj)
+                    content_type = ContentType.objects.get_for_model(
+                        model=obj
+                    )
+
+                    subscription_key_list.append(
+                        (event_type.id, content_type.pk, obj.pk)
+                    )
+
+            action.action_object = action_object
+            action.target = target
+
+            action_list.append(action)
+            action_subscription_key_list.append(
+                (action, subscription_key_list)
+            )
+
+        if not action_list:
+            return
+
+        if connection.features.can_return_rows_from_bulk_insert:
+            Action.objects.bulk_create(objs=action_list)
+
+            # `bulk_create` does not send the `post_save` signal. Send it
+            # to trigger the workflows and indexes as if the actions were
+            # saved individually.
+            for action in action_list:
+                post_save.send(
+                    created=True, instance=action, raw=False, sender=Action,
+                    update_fields=None, using=connection.alias
+                )
+        else:
+            # The database backend does not return the primary keys of
+            # bulk inserted rows and these are required to create the
+            # notifications.
+            for action in action_list:
+                action.save(force_insert=True)
+
+        # Create notifications for the actions created by the events
+        # committed.
+        subscription_key_set = {
+            subscription_key for action, subscription_key_list in action_subscription_key_list
+            for subscription_key in subscription_key_list
+        }
+
+        if not subscription_key_set:
+            return
+
+        event_type_id_set = set()
+        content_type_id_set = set()
+        object_id_set = set()
+
+        for event_type_id, content_type_id, object_id in subscription_key_set:
+            event_type_id_set.add(event_type_id)
+
+            if content_type_id:
+                content_type_id_set.add(content_type_id)
+                object_id_set.add(object_id)
+
+        # Gather the users subscribed globally to the events, and to the
+        # action objects and targets of the events using the same columns
+        # to union both into a single query.
+        queryset_event_subscriptions = EventSubscription.objects.filter(
+            stored_event_type__name__in=event_type_id_set
+        ).annotate(
+            subscription_event_type_id=F('stored_event_type__name'),
+            subscription_content_type_id=Value(
+                None, output_field=models.IntegerField()
+            ),
+            subscription_object_id=Value(
+                None, output_field=models.IntegerField()
+            ),
+            subscription_user_id=F('user_id')
+        )
+
+        queryset_object_event_subscriptions = ObjectEventSubscription.objects.filter(
+            content_type_id__in=content_type_id_set,
+            object_id__in=object_id_set,
+            stored_event_type__name__in=event_type_id_set
+        ).annotate(
+            subscription_event_type_id=F('stored_event_type__name'),
+            subscription_content_type_id=F('content_type_id'),
+            subscription_object_id=F('object_id'),
+            subscription_user_id=F('user_id')
+        ).order_by()
+
+        field_names = (
+            'subscription_event_type_id', 'subscription_content_type_id',
+            'subscription_object_id', 'subscription_user_id'
+        )
+
+        queryset_subscriptions = queryset_event_subscriptions.values_list(
+            *field_names
+        ).union(
+            queryset_object_event_subscriptions.values_list(*field_names)
+        )
+
+        subscription_user_id_dictionary = {}
+        for event_type_id, content_type_id, object_id, user_id in queryset_subscriptions:
+            subscription_user_id_dictionary.setdefault(
+                (event_type_id, content_type_id, object_id), set()
+            ).add(user_id)
+
+        notification_list = []
+
+        for action, subscription_key_list in action_subscription_key_list:
+            # Add a single notification for the same user-event-object.
+            user_id_set = set()
+
+            for subscription_key in subscription_key_list:
+                user_id_set.update(
+                    subscription_user_id_dictionary.get(subscription_key, ())
+                )
+
+            for user_id in sorted(user_id_set):
+                notification_list.append(
+                    Notification(action=action, user_id=user_id)
+                )
+
+        Notification.objects.bulk_create(objs=notification_list)
+
     @classmethod
     def get(cls, id):
         return cls._registry[id]
@@ -331,89 +563,30 @@ class EventType:
         return '{}: {}'.format(self.namespace.label, self.label)
 
     def _commit(self, action_object=None, actor=None, target=None):
-        EventSubscription = apps.get_model(
-            app_label='events', model_name='EventSubscription'
-        )
-        Notification = apps.get_model(
-            app_label='events', model_name='Notification'
-        )
-        ObjectEventSubscription = apps.get_model(
-            app_label='events', model_name='ObjectEventSubscription'
-        )
-        User = get_user_model()
-
-        if actor is None and target is None:
-            # If the actor and the target are None there is no way to
-            # create a new event.
-            logger.warning(
-                'Attempting to commit event "%s" without an actor or a '
-                'target. This is not supported.', self
+        EventType.do_commit_batch(
+            event_list=(
+                {
+                    'action_object': action_object, 'actor': actor,
+                    'event_type': self, 'target': target,
+                    'timestamp': now()
+                },
             )
-            return
-
-        result = action.send(
-            actor or target, actor=actor, verb=self.id,
-            action_object=action_object, target=target
-        )[0][1]
-        # The [0][1] means: get the first and only action from the list
-        # and ignore the handler.
-
-        # Create notifications for the actions created by the event committed.
-
-        # Gather the users subscribed globally to the event.
-        queryset_users = User.objects.filter(
-            id__in=EventSubscription.objects.filter(
-                stored_event_type__name=result.verb
-            ).values('user')
         )
 
-        # Gather the users subscribed to the target object event.
-        if result.target:
-            queryset_users = queryset_users | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.target_content_type,
-                    object_id=result.target.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
-
-        # Gather the users subscribed to the action object event.
-        if result.action_object:
-            queryset_users = queryset_users | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.action_object_content_type,
-                    object_id=result.action_object.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
-
-        for user in queryset_users:
-            if result.action_object:
-                Notification.objects.create(action=result, user=user)
-                # Don't check or add any other notification for the
-                # same user-event-object.
-                continue
-
-            if result.target:
-                Notification.objects.create(action=result, user=user)
-                # Don't check or add any other notification for the
-                # same user-event-object.
-                continue
-
     def commit(self, action_object=None, actor=None, target=None):
-        # Hidden import.
-        # This circular import is necessary.
-        from .tasks import task_event_commit
-
-        task_kwargs = {'event_id': self.id}
-
         if setting_disable_asynchronous_mode.value:
             self._commit(
                 action_object=action_object, actor=actor, target=target
             )
         else:
+            # Store the time of the commit and not the time when the
+            # buffered event is stored to preserve the order of the events.
+            event_entry = {
+                'event_id': self.id, 'timestamp': now().isoformat()
+            }
+
             if action_object:
-                task_kwargs.update(
+                event_entry.update(
                     {
                         'action_object_app_label': action_object._meta.app_label,
                         'action_object_model_name': action_object._meta.model_name,
@@ -422,7 +595,7 @@ class EventType:
                 )
 
             if actor:
-                task_kwargs.update(
+                event_entry.update(
                     {
                         'actor_app_label': actor._meta.app_label,
                         'actor_model_name': actor._meta.model_name,
@@ -431,7 +604,7 @@ class EventType:
                 )
 
             if target:
-                task_kwargs.update(
+                event_entry.update(
                     {
                         'target_app_label': target._meta.app_label,
                         'target_model_name': target._meta.model_name,
@@ -439,7 +612,7 @@ class EventType:
                     }
                 )
 
-            task_event_commit.apply_async(kwargs=task_kwargs)
+            EventCommitBuffer.append(event_entry=event_entry)
 
     def do_delete(self):
         self.__class__._registry.pop(self.id)
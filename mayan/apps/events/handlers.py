@@ -0,0 +1,5 @@
+from .classes import EventCommitBuffer
+
+
+def handler_event_commit_buffer_flush(sender, **kwargs):
+    EventCommitBuffer.flush()
@@ -2,6 +2,8 @@ from django.utils.translation import gettext_lazy as _
 
 DEFAULT_EVENT_LIST_EXPORT_FILENAME = 'events_list.csv'
 
+DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE = True
+DEFAULT_EVENTS_COMMIT_BUFFER_SIZE = 100
 DEFAULT_EVENTS_DISABLE_ASYNCHRONOUS_MODE = False
 
 DEFAULT_EVENTS_PRUNE_BACKEND = None
@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
+    DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE, DEFAULT_EVENTS_COMMIT_BUFFER_SIZE,
     DEFAULT_EVENTS_DISABLE_ASYNCHRONOUS_MODE, DEFAULT_EVENTS_PRUNE_BACKEND,
     DEFAULT_EVENTS_PRUNE_BACKEND_ARGUMENTS,
     DEFAULT_EVENTS_PRUNE_TASK_INTERVAL
@@ -12,6 +13,24 @@ setting_namespace = setting_cluster.do_namespace_add(
     label=_(message='Events'), name='events'
 )
 
+setting_commit_buffer_enable = setting_namespace.do_setting_add(
+    default=DEFAULT_EVENTS_COMMIT_BUFFER_ENABLE,
+    global_name='EVENTS_COMMIT_BUFFER_ENABLE',
+    help_text=_(
+        message='Buffer the events committed by each worker and send them '
+        'to be stored as a single batch when the request or task ends or '
+        'when the buffer is full. When disabled, each event is sent as soon '
+        'as it is committed.'
+    )
+)
+setting_commit_buffer_size = setting_namespace.do_setting_add(
+    default=DEFAULT_EVENTS_COMMIT_BUFFER_SIZE,
+    global_name='EVENTS_COMMIT_BUFFER_SIZE',
+    help_text=_(
+        message='Maximum number of events a worker will buffer before '
+        'sending them to be stored as a batch.'
+    )
+)
 setting_disable_asynchronous_mode = setting_namespace.do_setting_add(
     default=DEFAULT_EVENTS_DISABLE_ASYNCHRONOUS_MODE,
     global_name='EVENTS_DISABLE_ASYNCHRONOUS_MODE',
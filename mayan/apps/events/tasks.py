@@ -1,6 +1,9 @@
+import logging
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.db import OperationalError
+from django.utils.dateparse import parse_datetime
 
 from mayan.apps.databases.classes import QuerysetParametersSerializer
 from mayan.celery import app
@@ -11,6 +14,8 @@ from .events import event_events_cleared
 from .permissions import permission_events_clear
 from .settings import setting_event_prune_backend
 
+logger = logging.getLogger(name=__name__)
+
 
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_event_commit(
@@ -58,6 +63,78 @@ def task_event_commit(
         raise self.retry(exc=exception)
 
 
+@app.task(bind=True, ignore_result=True, retry_backoff=True)
+def task_event_commit_batch(self, event_entry_list):
+    # Gather the primary keys of each model to fetch the objects of all
+    # the events of the batch with a single query per model.
+    model_object_id_dictionary = {}
+
+    for event_entry in event_entry_list:
+        for name in ('action_object', 'actor', 'target'):
+            object_id = event_entry.get(
+                '{}_id'.format(name)
+            )
+            if object_id:
+                model_object_id_dictionary.setdefault(
+                    (
+                        event_entry['{}_app_label'.format(name)],
+                        event_entry['{}_model_name'.format(name)]
+                    ), set()
+                ).add(object_id)
+
+    try:
+        model_object_dictionary = {}
+
+        for key, object_id_set in model_object_id_dictionary.items():
+            app_label, model_name = key
+            Model = apps.get_model(app_label=app_label, model_name=model_name)
+
+            model_object_dictionary[key] = Model.objects.in_bulk(
+                id_list=object_id_set
+            )
+
+        event_list = []
+
+        for event_entry in event_entry_list:
+            event = {
+                'event_type': EventType.get(id=event_entry['event_id']),
+                'timestamp': parse_datetime(event_entry['timestamp'])
+            }
+
+            for name in ('action_object', 'actor', 'target'):
+                object_id = event_entry.get(
+                    '{}_id'.format(name)
+                )
+                if object_id:
+                    event[name] = model_object_dictionary[
+                        (
+                            event_entry['{}_app_label'.format(name)],
+                            event_entry['{}_model_name'.format(name)]
+                        )
+                    ].get(object_id)
+
+                    if event[name] is None:
+                        # The object was deleted before the batch was
+                        # processed, skip this event without affecting the
+                        # rest of the batch.
+                        logger.warning(
+                            'Unable to commit event "%s"; %s "%s.%s" with '
+                            'id %s does not exist.', event['event_type'],
+                            name, event_entry['{}_app_label'.format(name)],
+                            event_entry['{}_model_name'.format(name)],
+                            object_id
+                        )
+                        break
+                else:
+                    event[name] = None
+            else:
+                event_list.append(event)
+
+        EventType.do_commit_batch(event_list=event_list)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(ignore_result=True)
 def task_event_prune():
     if setting_event_prune_backend.value:
@@ -5,9 +5,12 @@ from django.utils import timezone
 from actstream.models import Action
 
 from mayan.apps.acls.classes import ModelPermission
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
 from mayan.apps.testing.tests.mixins import TestMixinObjectCreationTrack
 
-from ...classes import EventModelRegistry, EventType, ModelEventType
+from ...classes import (
+    EventCommitBuffer, EventModelRegistry, EventType, ModelEventType
+)
 from ...permissions import permission_events_view
 
 from .event_type_mixins import EventTypeTestMixin
@@ -49,6 +52,20 @@ class EventsExportViewTestMixin:
         )
 
 
+class EventCommitBufferTestMixin(SettingOverrideTestMixin):
+    """
+    Discard the events left in the buffer by each test.
+    """
+    def tearDown(self):
+        super().tearDown()
+        EventCommitBuffer.get_event_entry_list().clear()
+
+    def _flush_test_events(self):
+        # Store the events buffered by the test setup and remove them.
+        EventCommitBuffer.flush()
+        self._clear_events()
+
+
 class EventListAPIViewTestMixin:
     def _request_test_event_list_api_view(self):
         return self.get(viewname='rest_api:event-list')
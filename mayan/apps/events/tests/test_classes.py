@@ -1,12 +1,189 @@
+from django.core.signals import request_finished
+from django.test import override_settings
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import EventModelRegistry, ModelEventType
+from ..classes import EventCommitBuffer, EventModelRegistry, ModelEventType
 from ..decorators import method_event
 from ..event_managers import EventManagerMethodAfter
+from ..models import EventSubscription, Notification, ObjectEventSubscription
 
+from .mixins.event_mixins import (
+    EventCommitBufferTestMixin, EventObjectTestMixin
+)
 from .mixins.event_type_mixins import EventTypeTestMixin
 
 
+@override_settings(
+    EVENTS_COMMIT_BUFFER_ENABLE=True, EVENTS_COMMIT_BUFFER_SIZE=3
+)
+class EventCommitBufferTestCase(
+    EventCommitBufferTestMixin, EventObjectTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_test_object_with_event_type_and_permission()
+        self._create_test_object()
+        self._flush_test_events()
+
+    def _commit_test_events(self, count):
+        for index in range(count):
+            self._test_event_type.commit(
+                actor=self._test_case_user,
+                target=self._test_object_list[index % 2]
+            )
+
+    def test_commit_buffered(self):
+        self._commit_test_events(count=2)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+        EventCommitBuffer.flush()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+
+        self.assertEqual(events[0].actor, self._test_case_user)
+        self.assertEqual(events[0].target, self._test_object_list[0])
+        self.assertEqual(events[0].verb, self._test_event_type.id)
+        self.assertEqual(events[1].target, self._test_object_list[1])
+
+    def test_commit_buffer_full(self):
+        self._commit_test_events(count=4)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 3)
+
+        EventCommitBuffer.flush()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 4)
+
+    def test_commit_buffer_request_finished(self):
+        self._commit_test_events(count=2)
+
+        request_finished.send(sender=self.__class__)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+
+    def test_commit_buffer_deleted_object(self):
+        self._commit_test_events(count=2)
+
+        self._test_object_list[0].delete()
+
+        EventCommitBuffer.flush()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+        self.assertEqual(events[0].target, self._test_object_list[1])
+
+    def test_commit_buffer_timestamp(self):
+        self._commit_test_events(count=2)
+
+        self._test_event_type.commit(
+            actor=self._test_case_user, target=self._test_object_list[0]
+        )
+
+        events = self._get_test_events()
+        self.assertTrue(events[0].timestamp <= events[1].timestamp)
+        self.assertTrue(events[1].timestamp <= events[2].timestamp)
+        self.assertEqual(events[2].target, self._test_object_list[0])
+
+
+@override_settings(
+    EVENTS_COMMIT_BUFFER_ENABLE=True, EVENTS_COMMIT_BUFFER_SIZE=100
+)
+class EventTypeCommitBatchTestCase(
+    EventCommitBufferTestMixin, EventObjectTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._create_test_event_type()
+        self._create_test_object_with_event_type_and_permission()
+        self._create_test_object()
+        self._create_test_user()
+        self._flush_test_events()
+
+    def test_notification_global_subscription(self):
+        EventSubscription.objects.create(
+            stored_event_type=self._test_event_type.get_stored_event_type(),
+            user=self._test_user
+        )
+
+        for test_object in self._test_object_list:
+            self._test_event_type.commit(
+                actor=self._test_case_user, target=test_object
+            )
+
+        with self.assertNumQueries(num=5):
+            # Fetch the actor and the targets, insert the actions, resolve
+            # the subscribers, and insert the notifications.
+            EventCommitBuffer.flush()
+
+        queryset = Notification.objects.filter(user=self._test_user)
+        self.assertEqual(queryset.count(), 2)
+
+    def test_notification_object_subscription(self):
+        ObjectEventSubscription.objects.create(
+            content_object=self._test_object_list[0],
+            stored_event_type=self._test_event_type.get_stored_event_type(),
+            user=self._test_user
+        )
+
+        for test_object in self._test_object_list:
+            self._test_event_type.commit(
+                actor=self._test_case_user, target=test_object
+            )
+
+        EventCommitBuffer.flush()
+
+        queryset = Notification.objects.filter(user=self._test_user)
+        self.assertEqual(queryset.count(), 1)
+        self.assertEqual(
+            queryset.first().action.target, self._test_object_list[0]
+        )
+
+    def test_notification_single_per_user(self):
+        EventSubscription.objects.create(
+            stored_event_type=self._test_event_type.get_stored_event_type(),
+            user=self._test_user
+        )
+        ObjectEventSubscription.objects.create(
+            content_object=self._test_object_list[0],
+            stored_event_type=self._test_event_type.get_stored_event_type(),
+            user=self._test_user
+        )
+
+        self._test_event_type.commit(
+            action_object=self._test_object_list[0],
+            actor=self._test_case_user, target=self._test_object_list[0]
+        )
+
+        EventCommitBuffer.flush()
+
+        queryset = Notification.objects.filter(user=self._test_user)
+        self.assertEqual(queryset.count(), 1)
+
+    def test_notification_actor_only(self):
+        EventSubscription.objects.create(
+            stored_event_type=self._test_event_type.get_stored_event_type(),
+            user=self._test_user
+        )
+
+        self._test_event_type.commit(actor=self._test_case_user)
+
+        EventCommitBuffer.flush()
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+
+        queryset = Notification.objects.filter(user=self._test_user)
+        self.assertEqual(queryset.count(), 0)
+
+
 class EventManagerTestCase(EventTypeTestMixin, BaseTestCase):
     def setUp(self):
         super().setUp()
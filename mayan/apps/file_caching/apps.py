@@ -1,3 +1,8 @@
+import atexit
+
+from celery.signals import task_postrun
+
+from django.core.signals import request_finished
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -18,6 +23,10 @@ from .dashboard_widgets import (
 from .events import (
     event_cache_edited, event_cache_partition_purged, event_cache_purged
 )
+from .handlers import (
+    handler_cache_partition_file_hits_flush,
+    handler_cache_partition_file_hits_flush_exit
+)
 from .links import (
     link_cache_list, link_cache_purge_multiple,
     link_cache_purge_single, link_cache_tool
@@ -103,3 +112,17 @@ class FileCachingAppConfig(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_cache_tool,)
         )
+
+        # Write the buffered file hits when the interval elapsed at the end
+        # of each request or task and when the process exits.
+        atexit.register(handler_cache_partition_file_hits_flush_exit)
+
+        request_finished.connect(
+            dispatch_uid='file_caching_handler_cache_partition_file_hits_flush_request',
+            receiver=handler_cache_partition_file_hits_flush
+        )
+        # Celery signals only accept the receiver as a positional argument.
+        task_postrun.connect(
+            handler_cache_partition_file_hits_flush,
+            dispatch_uid='file_caching_handler_cache_partition_file_hits_flush_task'
+        )
@@ -0,0 +1,274 @@
+from collections import Counter, OrderedDict, defaultdict
+import hashlib
+import logging
+import threading
+import time
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db.models import F
+from django.utils.encoding import force_bytes
+
+from .literals import (
+    CACHE_PARTITION_FILE_HITS_FLUSH_COUNT,
+    CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL,
+    CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE,
+    CACHE_PARTITION_FILE_INDEX_TIMEOUT
+)
+from .settings import (
+    setting_memory_tier_maximum_size, setting_memory_tier_shared_cache_name,
+    setting_memory_tier_shared_cache_timeout
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class CachePartitionFileHits:
+    """
+    Process wide buffer of cache partition file hits. Hits are counted in
+    memory and written to the database in batches, either after a number
+    of hits or after an interval, instead of one UPDATE per file access.
+    """
+    _counter = Counter()
+    _counter_lock = threading.Lock()
+    _time_flush = time.monotonic()
+
+    @classmethod
+    def add(cls, cache_partition_file_id):
+        with cls._counter_lock:
+            cls._counter[cache_partition_file_id] += 1
+
+        cls.flush_if_due()
+
+    @classmethod
+    def flush(cls):
+        """
+        Write the buffered hits to the database. Files with the same
+        number of hits are updated with a single query.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        with cls._counter_lock:
+            counter = cls._counter
+            cls._counter = Counter()
+            cls._time_flush = time.monotonic()
+
+        if not counter:
+            return
+
+        hits_dictionary = defaultdict(list)
+
+        for cache_partition_file_id, hits in counter.items():
+            hits_dictionary[hits].append(cache_partition_file_id)
+
+        for hits, id_list in hits_dictionary.items():
+            queryset_files = CachePartitionFile.objects.filter(pk__in=id_list)
+            queryset_files.update(
+                hits=F('hits') + hits
+            )
+
+        logger.debug('Flushed hits of %d cache partition files.', len(counter))
+
+    @classmethod
+    def flush_if_due(cls):
+        """
+        Flush the buffered hits if enough hits were buffered or if the
+        flush interval elapsed. Called after each hit and when a request
+        or a task finishes, so that idle workers don't keep hits pending.
+        """
+        with cls._counter_lock:
+            flush = cls._counter and (
+                sum(
+                    cls._counter.values()
+                ) >= CACHE_PARTITION_FILE_HITS_FLUSH_COUNT or (
+                    time.monotonic() - cls._time_flush
+                ) >= CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL
+            )
+
+        if flush:
+            cls.flush()
+
+
+class CachePartitionFileIndex:
+    """
+    Process local index of the complete cache partition files. Resolves
+    the filename of a hot file to its row without a query. Entries expire
+    after a short time to bound how long a file deleted by another process
+    is still reported. Only used by lookups that tolerate such files, never
+    to decide whether a file needs to be generated.
+    """
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def delete(cls, cache_partition_id, filename):
+        with cls._lock:
+            cls._entries.pop((cache_partition_id, filename), None)
+
+    @classmethod
+    def get(cls, cache_partition_id, filename):
+        """
+        Return a dictionary with the field values of the file or None if
+        the file is not indexed or its entry expired.
+        """
+        key = (cache_partition_id, filename)
+
+        with cls._lock:
+            try:
+                time_added, values = cls._entries[key]
+            except KeyError:
+                return
+
+            time_elapsed = time.monotonic() - time_added
+
+            if time_elapsed >= CACHE_PARTITION_FILE_INDEX_TIMEOUT:
+                del cls._entries[key]
+            else:
+                cls._entries.move_to_end(key=key)
+                return values
+
+    @classmethod
+    def set(cls, cache_partition_file):
+        key = (
+            cache_partition_file.partition_id, cache_partition_file.filename
+        )
+        values = {
+            field.attname: getattr(cache_partition_file, field.attname)
+            for field in cache_partition_file._meta.concrete_fields
+        }
+
+        with cls._lock:
+            cls._entries[key] = (time.monotonic(), values)
+            cls._entries.move_to_end(key=key)
+
+            maximum_size = CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE
+            while len(cls._entries) > maximum_size:
+                cls._entries.popitem(last=False)
+
+
+class CachePartitionFileMemoryTier:
+    """
+    Keeps the content of frequently requested cache partition files in
+    memory in front of the cache storage. The first tier is a process
+    local LRU bounded by size. The optional second tier is a Django cache
+    backend shared between processes (Redis, Memcached).
+    Entries are keyed by the partition name and the filename. Since cache
+    filenames already encode the content they represent (like the hash
+    of the transformations of an image), a changed content produces a
+    different key and stale entries simply age out.
+    """
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    _size = 0
+
+    @staticmethod
+    def get_key(partition_name, filename):
+        return 'file_caching-{}'.format(
+            hashlib.sha256(
+                string=force_bytes(
+                    s='{}-{}'.format(partition_name, filename)
+                )
+            ).hexdigest()
+        )
+
+    @staticmethod
+    def get_shared_cache():
+        name = setting_memory_tier_shared_cache_name.value
+        if name:
+            return caches[name]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._size = 0
+
+    @classmethod
+    def delete(cls, partition_name, filename):
+        key = cls.get_key(partition_name=partition_name, filename=filename)
+
+        cls._local_delete(key=key)
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            shared_cache.delete(key=key)
+
+    @classmethod
+    def get(cls, partition_name, filename):
+        """
+        Return the content of the file or None if the file is not in
+        any of the tiers.
+        """
+        key = cls.get_key(partition_name=partition_name, filename=filename)
+
+        with cls._lock:
+            try:
+                cls._entries.move_to_end(key=key)
+            except KeyError:
+                pass
+            else:
+                return cls._entries[key]
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            data = shared_cache.get(key=key)
+            if data is not None:
+                cls._local_set(data=data, key=key)
+                return data
+
+    @classmethod
+    def get_size(cls):
+        return cls._size
+
+    @classmethod
+    def is_enabled(cls):
+        maximum_size = setting_memory_tier_maximum_size.value
+        shared_cache_name = setting_memory_tier_shared_cache_name.value
+
+        return bool(maximum_size or shared_cache_name)
+
+    @classmethod
+    def set(cls, data, partition_name, filename):
+        key = cls.get_key(partition_name=partition_name, filename=filename)
+
+        cls._local_set(data=data, key=key)
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            shared_cache.set(
+                key=key, timeout=setting_memory_tier_shared_cache_timeout.value,
+                value=data
+            )
+
+    @classmethod
+    def _local_delete(cls, key):
+        with cls._lock:
+            data = cls._entries.pop(key, None)
+            if data is not None:
+                cls._size -= len(data)
+
+    @classmethod
+    def _local_set(cls, data, key):
+        maximum_size = setting_memory_tier_maximum_size.value
+
+        if not maximum_size or len(data) > maximum_size:
+            return
+
+        with cls._lock:
+            data_previous = cls._entries.pop(key, None)
+            if data_previous is not None:
+                cls._size -= len(data_previous)
+
+            cls._entries[key] = data
+            cls._size += len(data)
+
+            while cls._size > maximum_size:
+                key_evicted, data_evicted = cls._entries.popitem(last=False)
+                cls._size -= len(data_evicted)
@@ -63,7 +63,7 @@ class DashboardWidgetFileCacheSizeUsed(DashboardWidgetNumeric):
         )['total_size'] or 1  # Cannot be 0 to avoid a division by zero.
 
         total_size_used = queryset.aggregate(
-            total_size=Sum('partitions__files__file_size')
+            total_size=Sum('total_size')
         )['total_size'] or 0
 
         return format_lazy(
@@ -0,0 +1,23 @@
+import logging
+
+from django.db import DatabaseError
+
+from .classes import CachePartitionFileHits
+
+logger = logging.getLogger(name=__name__)
+
+
+def handler_cache_partition_file_hits_flush(sender, **kwargs):
+    CachePartitionFileHits.flush_if_due()
+
+
+def handler_cache_partition_file_hits_flush_exit():
+    # The database might no longer be available when the process exits.
+    # The hits only order the pruning of the files and can be lost.
+    try:
+        CachePartitionFileHits.flush()
+    except DatabaseError as exception:
+        logger.warning(
+            'Unable to flush the cache partition file hits on exit; %s',
+            exception
+        )
@@ -1,2 +1,11 @@
+CACHE_PARTITION_FILE_HITS_FLUSH_COUNT = 100
+CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL = 10  # Seconds
+CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE = 10000
+CACHE_PARTITION_FILE_INDEX_TIMEOUT = 60  # Seconds
+CACHE_PRUNE_BATCH_SIZE = 100
+
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_MEMORY_TIER_MAXIMUM_SIZE = 32 * 2 ** 20  # 32 Megabytes
+DEFAULT_MEMORY_TIER_SHARED_CACHE_NAME = None
+DEFAULT_MEMORY_TIER_SHARED_CACHE_TIMEOUT = 3600  # Seconds
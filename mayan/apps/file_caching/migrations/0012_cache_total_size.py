@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0011_alter_cache_maximum_size')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache', name='total_size',
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, help_text='Current size of the '
+                'cache in bytes.', verbose_name='Total size'
+            )
+        )
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.db.models import Sum
+
+
+def code_cache_total_size_update(apps, schema_editor):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        queryset_files = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache=cache)
+
+        cache.total_size = queryset_files.aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(
+            update_fields=('total_size',)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0012_cache_total_size')
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=code_cache_total_size_update,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -3,7 +3,8 @@ import logging
 
 from django.apps import apps
 from django.core.files.base import ContentFile
-from django.db.models import F, Sum
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Greatest
 from django.template.defaultfilters import filesizeformat
 from django.utils.functional import cached_property
 from django.utils.text import format_lazy
@@ -18,8 +19,10 @@ from mayan.apps.lock_manager.decorators import (
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.classes import DefinedStorage
 
+from .classes import CachePartitionFileHits, CachePartitionFileIndex
 from .events import event_cache_partition_purged, event_cache_purged
 from .exceptions import FileCachingException
+from .literals import CACHE_PRUNE_BATCH_SIZE
 from .settings import (
     setting_maximum_failed_prune_attempts,
     setting_maximum_normal_prune_attempts
@@ -88,14 +91,16 @@ class CacheBusinessLogicMixin:
 
     def get_total_size(self):
         """
-        Return the actual usage of the cache.
+        Return the actual usage of the cache from the running size counter.
         """
-        queryset_files = self.get_files()
-        queryset_files_aggregated = queryset_files.aggregate(
-            file_size__sum=Sum('file_size')
-        )
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
 
-        return queryset_files_aggregated['file_size__sum'] or 0
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+        self.total_size = queryset_caches.values_list(
+            'total_size', flat=True
+        ).first() or 0
+
+        return self.total_size
 
     def get_total_size_display(self):
         total_size = self.get_total_size()
@@ -123,34 +128,43 @@ class CacheBusinessLogicMixin:
     def prune(self):
         """
         Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        maximum size of the cache. Files are selected for eviction in
+        batches using the running size counter instead of recalculating the
+        size of the cache after each deletion.
         """
         failed_attempts = 0
         normal_attempts = 0
-        file_index = 0
 
         CachePartitionFile = apps.get_model(
             app_label='file_caching', model_name='CachePartitionFile'
         )
 
-        get_queryset_eviction = self.get_queryset_files_for_eviction()
+        # Make the buffered hits count for the eviction order.
+        CachePartitionFileHits.flush()
 
-        while self.get_total_size() >= self.maximum_size:
-            try:
-                cache_partition_file = get_queryset_eviction[
-                    file_index
-                ]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-                get_queryset_eviction = self.get_queryset_files_for_eviction()
-            else:
+        size_excess = self.get_total_size() - self.maximum_size
+
+        while size_excess >= 0:
+            queryset_eviction = self.get_queryset_files_for_eviction()
+
+            cache_partition_file_list = list(
+                queryset_eviction[:CACHE_PRUNE_BATCH_SIZE]
+            )
+
+            if not cache_partition_file_list:
+                # The size counter is out of sync with the files.
+                self.total_size_update()
+                break
+
+            size_freed = 0
+
+            for cache_partition_file in cache_partition_file_list:
                 try:
                     cache_partition_file.delete()
                 except CachePartitionFile.DoesNotExist:
                     # The file selected from deletion was deleted by another
                     # process before the lock was acquired.
-                    file_index += 1
+                    """Ignore and attempt the next file."""
                 except LockError:
                     logger.debug(
                         'Lock error trying to delete file "%s" for '
@@ -158,15 +172,14 @@ class CacheBusinessLogicMixin:
                         cache_partition_file
                     )
                     failed_attempts += 1
-                    file_index += 1
 
                     if failed_attempts > setting_maximum_failed_prune_attempts.value:
                         raise FileCachingException(
                             'Too many cache prune attempts failed.'
                         )
                 else:
-                    file_index = 0
                     normal_attempts += 1
+                    size_freed += cache_partition_file.file_size
 
                     if normal_attempts > setting_maximum_normal_prune_attempts.value:
                         raise FileCachingException(
@@ -174,6 +187,11 @@ class CacheBusinessLogicMixin:
                             'single new file.'
                         )
 
+                    if size_freed > size_excess:
+                        break
+
+            size_excess = self.get_total_size() - self.maximum_size
+
     @method_event(
         event=event_cache_purged,
         event_manager_class=EventManagerMethodAfter,
@@ -215,6 +233,37 @@ class CacheBusinessLogicMixin:
 
         return defined_storage_instance
 
+    def total_size_add(self, size):
+        """
+        Update the running size counter of the cache by the given amount
+        of bytes. Negative values reduce the counter.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+        queryset_caches.update(
+            total_size=Greatest(
+                F('total_size') + size, Value(0)
+            )
+        )
+
+    def total_size_update(self):
+        """
+        Recalculate the running size counter of the cache from the size of
+        its files.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        queryset_files = self.get_files()
+        queryset_files_aggregated = queryset_files.aggregate(
+            file_size__sum=Sum('file_size')
+        )
+
+        self.total_size = queryset_files_aggregated['file_size__sum'] or 0
+
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+        queryset_caches.update(total_size=self.total_size)
+
 
 class CachePartitionBusinessLogicMixin:
     @staticmethod
@@ -288,8 +337,65 @@ class CachePartitionBusinessLogicMixin:
             logger.debug('unable to obtain lock: %s', lock_name)
             raise
 
-    def get_file(self, filename):
-        return self.files.get(filename=filename)
+    def file_hit_add(self, filename):
+        """
+        Record a hit of a file whose content was served without opening
+        it, like from the memory tier, so that the eviction order of the
+        partition files accounts for it.
+        """
+        try:
+            cache_partition_file = self.get_file(
+                _use_index=True, filename=filename
+            )
+        except self.files.model.DoesNotExist:
+            """
+            The file was pruned while its content is still kept in
+            memory. There is nothing to record.
+            """
+        else:
+            CachePartitionFileHits.add(
+                cache_partition_file_id=cache_partition_file.pk
+            )
+
+    def get_file(self, filename, _use_index=False):
+        """
+        Pass `_use_index=True` to resolve complete files from the process
+        local index and avoid a query for each hit of hot files. The index
+        can report files deleted by another process and is not used when
+        the result decides whether a file needs to be generated.
+        """
+        if _use_index:
+            values = CachePartitionFileIndex.get(
+                cache_partition_id=self.pk, filename=filename
+            )
+        else:
+            values = None
+
+        if values is None:
+            cache_partition_file = self.files.get(filename=filename)
+
+            if cache_partition_file.file_size:
+                CachePartitionFileIndex.set(
+                    cache_partition_file=cache_partition_file
+                )
+        else:
+            cache_partition_file = self.files.model.from_db(
+                db=self.files.db, field_names=tuple(values),
+                values=tuple(
+                    values.values()
+                )
+            )
+            cache_partition_file.partition = self
+
+        return cache_partition_file
+
+    def get_file_is_complete(self, filename):
+        """
+        Return True if the file exists and its content was written. Files
+        have a size of zero until their creation finishes. Does not lock
+        the file and is meant for optimistic lookups.
+        """
+        return self.files.filter(file_size__gt=0, filename=filename).exists()
 
     def get_file_lock_name(self, filename):
         return 'cache_partition-file-{}-{}-{}'.format(
@@ -377,10 +483,14 @@ class CachePartitionFileBusinessLogicMixin:
         Called after creation and initial write only.
         """
         storage_instance = self.partition.cache.storage
+        file_size_previous = self.file_size
         self.file_size = storage_instance.size(name=self.full_filename)
         self.save(
             update_fields=('file_size',)
         )
+        self.partition.cache.total_size_add(
+            size=self.file_size - file_size_previous
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -403,47 +513,66 @@ class CachePartitionFileBusinessLogicMixin:
             parent=self.partition.name, filename=self.filename
         )
 
-    @contextmanager
-    def open(self):
+    def get_mime_type_cache_key(self):
         """
-        Open the file for reading only.
+        Return a key identifying the content of the file to cache its
+        MIME type. The primary key changes when the file is recreated.
         """
-        CachePartitionFile = apps.get_model(
-            app_label='file_caching', model_name='CachePartitionFile'
-        )
+        return 'file_caching-{}-{}'.format(self.pk, self.full_filename)
 
+    @contextmanager
+    def open(self, _acquire_lock=True):
+        """
+        Open the file for reading only. Complete files are never rewritten,
+        the lock only keeps them from being pruned while being read. Pass
+        `_acquire_lock=False` to read a complete file without the lock.
+        Files still being written always take the lock.
+        """
+        lock = None
         lock_name = self._lock_manager_get_lock_name()
-        try:
-            logger.debug('trying to acquire lock: %s', lock_name)
-            locking_backend_class = LockingBackend.get_backend()
 
-            self._lock = locking_backend_class.acquire_lock(name=lock_name)
+        if _acquire_lock or not self.file_size:
+            try:
+                logger.debug('trying to acquire lock: %s', lock_name)
+                locking_backend_class = LockingBackend.get_backend()
 
-            queryset_partition_files = CachePartitionFile.objects.filter(
-                pk=self.pk
+                lock = locking_backend_class.acquire_lock(name=lock_name)
+            except LockError:
+                logger.debug('unable to obtain lock: %s', lock_name)
+                raise
+
+            logger.debug('acquired lock: %s', lock_name)
+
+        CachePartitionFileHits.add(cache_partition_file_id=self.pk)
+        self._storage_object = None
+        try:
+            storage_instance = self.partition.cache.storage
+            self._storage_object = storage_instance.open(
+                mode='rb', name=self.full_filename
             )
+        except Exception as exception:
+            CachePartitionFileIndex.delete(
+                cache_partition_id=self.partition_id, filename=self.filename
+            )
+
+            # The file was deleted by another process after being
+            # selected. Report it as missing to have the caller generate
+            # it again.
+            if not self.__class__.objects.filter(pk=self.pk).exists():
+                raise self.__class__.DoesNotExist(
+                    'Cache partition file "{}" was deleted.'.format(
+                        self.full_filename
+                    )
+                ) from exception
 
-            queryset_partition_files.update(
-                hits=F('hits') + 1
+            logger.error(
+                'Unexpected exception opening the cache file; %s',
+                exception, exc_info=True
             )
-            logger.debug('acquired lock: %s', lock_name)
-            self._storage_object = None
-            try:
-                storage_instance = self.partition.cache.storage
-                self._storage_object = storage_instance.open(
-                    mode='rb', name=self.full_filename
-                )
-            except Exception as exception:
-                logger.error(
-                    'Unexpected exception opening the cache file; %s',
-                    exception, exc_info=True
-                )
-                raise
-            else:
-                yield self._storage_object
-            finally:
-                self.close(_acquire_lock=False)
-                self._lock.release()
-        except LockError:
-            logger.debug('unable to obtain lock: %s', lock_name)
             raise
+        else:
+            yield self._storage_object
+        finally:
+            self.close(_acquire_lock=False)
+            if lock:
+                lock.release()
@@ -8,6 +8,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.lock_manager.decorators import locked_class_method
 
+from .classes import CachePartitionFileIndex, CachePartitionFileMemoryTier
 from .events import event_cache_created, event_cache_edited
 from .model_mixins import (
     CacheBusinessLogicMixin, CachePartitionBusinessLogicMixin,
@@ -30,6 +31,11 @@ class Cache(CacheBusinessLogicMixin, ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_(message='Maximum size')
     )
+    total_size = models.PositiveBigIntegerField(
+        default=0, editable=False, help_text=_(
+            message='Current size of the cache in bytes.'
+        ), verbose_name=_(message='Total size')
+    )
 
     class Meta:
         ordering = ('id',)
@@ -129,4 +135,17 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
     def delete(self, *args, **kwargs):
         storage_instance = self.partition.cache.storage
         storage_instance.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        CachePartitionFileIndex.delete(
+            cache_partition_id=self.partition_id, filename=self.filename
+        )
+        CachePartitionFileMemoryTier.delete(
+            filename=self.filename, partition_name=self.partition.name
+        )
+        result = super().delete(*args, **kwargs)
+
+        if result[1].get(self._meta.label):
+            # Only update the size counter if the row was actually deleted
+            # by this call and not by another process.
+            self.partition.cache.total_size_add(size=-self.file_size)
+
+        return result
@@ -4,7 +4,9 @@ from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS, DEFAULT_MEMORY_TIER_MAXIMUM_SIZE,
+    DEFAULT_MEMORY_TIER_SHARED_CACHE_NAME,
+    DEFAULT_MEMORY_TIER_SHARED_CACHE_TIMEOUT
 )
 
 setting_namespace = setting_cluster.do_namespace_add(
@@ -26,3 +28,27 @@ setting_maximum_normal_prune_attempts = setting_namespace.do_setting_add(
         'space for new a file being requested, before giving up.'
     )
 )
+setting_memory_tier_maximum_size = setting_namespace.do_setting_add(
+    default=DEFAULT_MEMORY_TIER_MAXIMUM_SIZE,
+    global_name='FILE_CACHING_MEMORY_TIER_MAXIMUM_SIZE', help_text=_(
+        message='Maximum size in bytes of the per process memory tier that '
+        'keeps frequently requested cache files, like page images, in '
+        'front of the cache storage. Use 0 to disable the memory tier.'
+    )
+)
+setting_memory_tier_shared_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_MEMORY_TIER_SHARED_CACHE_NAME,
+    global_name='FILE_CACHING_MEMORY_TIER_SHARED_CACHE_NAME', help_text=_(
+        message='Name of a Django cache backend from the CACHES setting to '
+        'use as a shared memory tier between processes. For example a '
+        'Redis or Memcached cache backend. Leave empty to use only the per '
+        'process memory tier.'
+    )
+)
+setting_memory_tier_shared_cache_timeout = setting_namespace.do_setting_add(
+    default=DEFAULT_MEMORY_TIER_SHARED_CACHE_TIMEOUT,
+    global_name='FILE_CACHING_MEMORY_TIER_SHARED_CACHE_TIMEOUT', help_text=_(
+        message='Time in seconds that a file is kept in the shared memory '
+        'tier.'
+    )
+)
@@ -5,4 +5,7 @@ TEST_CACHE_PARTITION_FILE_FILENAME = 'test_cache_partition_file_filename'
 TEST_CACHE_PARTITION_FILE_SIZE = 1 * 2 ** 20  # 1 Megabyte
 TEST_CACHE_PARTITION_NAME = 'test_cache_partition_name'
 
+TEST_MEMORY_TIER_DATA = b'0' * 1024
+TEST_MEMORY_TIER_MAXIMUM_SIZE = 2 * 1024  # 2 Kilobytes
+
 TEST_STORAGE_NAME_FILE_CACHING_TEST_STORAGE = 'file_caching__test_storage'
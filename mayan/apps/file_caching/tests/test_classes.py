@@ -0,0 +1,135 @@
+from unittest import mock
+
+from django.core.cache import caches
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import CachePartitionFileMemoryTier
+
+from .literals import (
+    TEST_CACHE_PARTITION_FILE_FILENAME, TEST_CACHE_PARTITION_NAME,
+    TEST_MEMORY_TIER_DATA, TEST_MEMORY_TIER_MAXIMUM_SIZE
+)
+from .mixins import CacheTestMixin
+
+
+class CachePartitionFileMemoryTierTestCase(CacheTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        CachePartitionFileMemoryTier.clear()
+
+    def tearDown(self):
+        CachePartitionFileMemoryTier.clear()
+        super().tearDown()
+
+    def test_get_and_set(self):
+        CachePartitionFileMemoryTier.set(
+            data=TEST_MEMORY_TIER_DATA,
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+            partition_name=TEST_CACHE_PARTITION_NAME
+        )
+
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                partition_name=TEST_CACHE_PARTITION_NAME
+            ), TEST_MEMORY_TIER_DATA
+        )
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get_size(),
+            len(TEST_MEMORY_TIER_DATA)
+        )
+
+    def test_least_recently_used_eviction(self):
+        with mock.patch(target='mayan.apps.file_caching.classes.setting_memory_tier_maximum_size') as mock_setting:
+            mock_setting.value = TEST_MEMORY_TIER_MAXIMUM_SIZE
+
+            for index in range(3):
+                CachePartitionFileMemoryTier.set(
+                    data=TEST_MEMORY_TIER_DATA,
+                    filename='{}_{}'.format(
+                        TEST_CACHE_PARTITION_FILE_FILENAME, index
+                    ), partition_name=TEST_CACHE_PARTITION_NAME
+                )
+
+                if index == 1:
+                    # Refresh the first entry to make the second entry the
+                    # least recently used.
+                    CachePartitionFileMemoryTier.get(
+                        filename='{}_0'.format(
+                            TEST_CACHE_PARTITION_FILE_FILENAME
+                        ), partition_name=TEST_CACHE_PARTITION_NAME
+                    )
+
+        self.assertTrue(
+            CachePartitionFileMemoryTier.get_size() <= TEST_MEMORY_TIER_MAXIMUM_SIZE
+        )
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                filename='{}_0'.format(TEST_CACHE_PARTITION_FILE_FILENAME),
+                partition_name=TEST_CACHE_PARTITION_NAME
+            ), TEST_MEMORY_TIER_DATA
+        )
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                filename='{}_1'.format(TEST_CACHE_PARTITION_FILE_FILENAME),
+                partition_name=TEST_CACHE_PARTITION_NAME
+            ), None
+        )
+
+    def test_cache_partition_file_delete(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+
+        CachePartitionFileMemoryTier.set(
+            data=TEST_MEMORY_TIER_DATA,
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+            partition_name=TEST_CACHE_PARTITION_NAME
+        )
+
+        self._test_cache_partition_file.delete()
+
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                partition_name=TEST_CACHE_PARTITION_NAME
+            ), None
+        )
+        self.assertEqual(CachePartitionFileMemoryTier.get_size(), 0)
+
+    def test_shared_tier(self):
+        shared_cache = caches['default']
+
+        with mock.patch.object(target=CachePartitionFileMemoryTier, attribute='get_shared_cache', return_value=shared_cache):
+            CachePartitionFileMemoryTier.set(
+                data=TEST_MEMORY_TIER_DATA,
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                partition_name=TEST_CACHE_PARTITION_NAME
+            )
+
+            # Simulate a different process with an empty local tier.
+            CachePartitionFileMemoryTier.clear()
+
+            self.assertEqual(
+                CachePartitionFileMemoryTier.get(
+                    filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                    partition_name=TEST_CACHE_PARTITION_NAME
+                ), TEST_MEMORY_TIER_DATA
+            )
+
+            CachePartitionFileMemoryTier.delete(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                partition_name=TEST_CACHE_PARTITION_NAME
+            )
+
+        self.assertEqual(
+            shared_cache.get(
+                key=CachePartitionFileMemoryTier.get_key(
+                    filename=TEST_CACHE_PARTITION_FILE_FILENAME,
+                    partition_name=TEST_CACHE_PARTITION_NAME
+                )
+            ), None
+        )
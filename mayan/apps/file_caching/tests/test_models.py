@@ -3,6 +3,7 @@ from unittest import mock
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import CachePartitionFileHits, CachePartitionFileIndex
 from ..events import (
     event_cache_created, event_cache_edited, event_cache_partition_purged,
     event_cache_purged
@@ -159,6 +160,61 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         with self._test_cache_partition_file.open():
             """Do nothing"""
 
+        CachePartitionFileHits.flush()
+
+        self._test_cache_partition_file.refresh_from_db()
+
+        self.assertEqual(
+            self._test_cache_partition_file.hits,
+            cache_partition_file_hits + 1
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_hits_buffered(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFileHits.flush()
+
+        cache_partition_file_hits = self._test_cache_partition_file.hits
+
+        self._clear_events()
+
+        with self._test_cache_partition_file.open():
+            """Do nothing"""
+
+        self._test_cache_partition_file.refresh_from_db()
+
+        self.assertEqual(
+            self._test_cache_partition_file.hits, cache_partition_file_hits
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_hits_flush_if_due(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFileHits.flush()
+
+        cache_partition_file_hits = self._test_cache_partition_file.hits
+
+        self._clear_events()
+
+        with self._test_cache_partition_file.open():
+            """Do nothing"""
+
+        with mock.patch(
+            target='mayan.apps.file_caching.classes.CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL',
+            new=0
+        ):
+            CachePartitionFileHits.flush_if_due()
+
         self._test_cache_partition_file.refresh_from_db()
 
         self.assertEqual(
@@ -169,6 +225,128 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_cache_partition_file_index(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFileIndex.clear()
+
+        self._clear_events()
+
+        self._test_cache_partition.get_file(
+            filename=self._test_cache_partition_file.filename
+        )
+
+        with self.assertNumQueries(num=0):
+            cache_partition_file = self._test_cache_partition.get_file(
+                _use_index=True,
+                filename=self._test_cache_partition_file.filename
+            )
+
+        self.assertEqual(
+            cache_partition_file, self._test_cache_partition_file
+        )
+        self.assertEqual(
+            cache_partition_file.file_size,
+            self._test_cache_partition_file.file_size
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_index_delete(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        self._test_cache_partition.get_file(
+            filename=self._test_cache_partition_file.filename
+        )
+
+        self._clear_events()
+
+        self._test_cache_partition_file.delete()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self._test_cache_partition.get_file(
+                filename=self._test_cache_partition_file.filename
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_partition_file_index_deleted_by_other_process(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        self._test_cache_partition.get_file(
+            filename=self._test_cache_partition_file.filename
+        )
+
+        self._clear_events()
+
+        # Delete the row and the content without evicting the index entry
+        # of this process, like another process would.
+        self._test_cache.storage.delete(
+            name=self._test_cache_partition_file.full_filename
+        )
+        CachePartitionFile.objects.filter(
+            pk=self._test_cache_partition_file.pk
+        ).delete()
+
+        self.assertFalse(
+            self._test_cache_partition.get_file_is_complete(
+                filename=self._test_cache_partition_file.filename
+            )
+        )
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self._test_cache_partition.get_file(
+                filename=self._test_cache_partition_file.filename
+            )
+
+        cache_partition_file = self._test_cache_partition.get_file(
+            _use_index=True, filename=self._test_cache_partition_file.filename
+        )
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            with cache_partition_file.open(_acquire_lock=False):
+                """Open the file, the content is not read."""
+
+        self.assertIsNone(
+            CachePartitionFileIndex.get(
+                cache_partition_id=self._test_cache_partition.pk,
+                filename=self._test_cache_partition_file.filename
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_total_size_counter(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        self._clear_events()
+
+        self._create_test_cache_partition_file(file_size=2)
+        self._create_test_cache_partition_file(file_size=3)
+
+        self.assertEqual(self._test_cache.get_total_size(), 5)
+
+        self._test_cache_partition_file_list[0].delete()
+
+        self.assertEqual(self._test_cache.get_total_size(), 3)
+
+        self._test_cache.total_size_update()
+
+        self.assertEqual(self._test_cache.get_total_size(), 3)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_cache_partition_file_lru_eviction(self):
         self._create_test_cache(
             extra_data={
@@ -262,6 +440,24 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_cache_partition_file_open_without_lock(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        self._clear_events()
+
+        with self._test_cache_partition_file.open():
+            with self._test_cache_partition_file.open(_acquire_lock=False) as file_object:
+                self.assertEqual(
+                    len(
+                        file_object.read()
+                    ), self._test_cache_partition_file.file_size
+                )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_incremental_file_index_cache_prune(self):
         self._create_test_cache(
             extra_data={
@@ -2,7 +2,6 @@ import hashlib
 import json
 import logging
 import os
-import threading
 import time
 import uuid
 
@@ -15,35 +14,128 @@ from mayan.apps.storage.settings import setting_temporary_directory
 from ..exceptions import LockError
 
 from .base import LockingBackend
+from .literals import (
+    FILE_LOCK_DIRECTORY_SUFFIX, FILE_LOCK_EXPIRED_PURGE_INTERVAL
+)
 
-lock = threading.Lock()
 logger = logging.getLogger(name=__name__)
 
 
 class FileLock(LockingBackend):
+    """
+    Each lock is stored in its own file, named after the hash of the lock
+    name, containing the lock expiration and the UUID of the holder.
+    Access to a lock file is serialized with an exclusive `flock` on that
+    file alone, making the cost of acquiring and releasing a lock
+    independent of the number of locks held and allowing unrelated locks
+    to be operated on concurrently.
+    Released locks remove their file. Since a lock file can be removed
+    between its opening and the `flock` call, the identity of the locked
+    file is compared with the one in the directory, and the opening is
+    retried if they differ.
+    The files of locks that expired without being released are removed
+    periodically when acquiring locks.
+    """
+    _time_purge_expired = 0
+
     @classmethod
     def _acquire_lock(cls, name, timeout):
+        time_now = time.monotonic()
+        if time_now - cls._time_purge_expired >= FILE_LOCK_EXPIRED_PURGE_INTERVAL:
+            cls._time_purge_expired = time_now
+            cls.purge_locks_expired()
+
         instance = FileLock(name=name, timeout=timeout)
         return instance
 
     @classmethod
     def _initialize(cls):
-        cls.lock_file = os.path.join(
-            setting_temporary_directory.value, hashlib.sha256(
-                string=force_bytes(s=settings.SECRET_KEY)
-            ).hexdigest()
+        cls.lock_directory = os.path.join(
+            setting_temporary_directory.value, '{}{}'.format(
+                hashlib.sha256(
+                    string=force_bytes(s=settings.SECRET_KEY)
+                ).hexdigest(), FILE_LOCK_DIRECTORY_SUFFIX
+            )
         )
-        open(file=cls.lock_file, mode='a').close()
-        logger.debug('lock_file: %s', cls.lock_file)
+        os.makedirs(name=cls.lock_directory, exist_ok=True)
+        logger.debug('lock_directory: %s', cls.lock_directory)
+
+    @classmethod
+    def _open_lock_file(cls, path):
+        """
+        Return the descriptor of the lock file, exclusively locked and
+        guaranteed to still be linked in the lock directory.
+        """
+        while True:
+            file_descriptor = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+            locks.lock(f=file_descriptor, flags=locks.LOCK_EX)
+
+            try:
+                stat_path = os.stat(path)
+            except FileNotFoundError:
+                stat_path = None
+
+            stat_file_descriptor = os.fstat(file_descriptor)
+
+            if stat_path and os.path.samestat(stat_path, stat_file_descriptor):
+                return file_descriptor
+            else:
+                # The file was removed by the release of the lock after
+                # it was opened. Retry with the new file.
+                os.close(file_descriptor)
 
     @classmethod
     def _purge_locks(cls):
-        lock.acquire()
-        with open(file=cls.lock_file, mode='r+') as file_object:
-            locks.lock(f=file_object, flags=locks.LOCK_EX)
-            file_object.seek(0)
-            file_object.truncate()
-            lock.release()
+        for filename in os.listdir(path=cls.lock_directory):
+            path = os.path.join(cls.lock_directory, filename)
+            file_descriptor = cls._open_lock_file(path=path)
+            try:
+                os.unlink(path)
+            finally:
+                os.close(file_descriptor)
+
+    @classmethod
+    def purge_locks_expired(cls):
+        """
+        Remove the files of the expired locks. Locks are only removed when
+        released, the files of locks whose holder ended without releasing
+        them would otherwise remain until the same lock is acquired again.
+        """
+        if not cls._is_initialized:
+            cls._initialize()
+            cls._is_initialized = True
+
+        for filename in os.listdir(path=cls.lock_directory):
+            path = os.path.join(cls.lock_directory, filename)
+            file_descriptor = cls._open_lock_file(path=path)
+            try:
+                lock_data = cls._read_lock_data(
+                    file_descriptor=file_descriptor
+                )
+
+                if not lock_data or 0 < lock_data['expiration'] < time.time():
+                    os.unlink(path)
+            finally:
+                os.close(file_descriptor)
+
+    @staticmethod
+    def _read_lock_data(file_descriptor):
+        os.lseek(file_descriptor, 0, os.SEEK_SET)
+
+        data = b''
+        while True:
+            chunk = os.read(file_descriptor, 4096)
+            if not chunk:
+                break
+            data += chunk
+
+        if data:
+            try:
+                return json.loads(s=data)
+            except ValueError:
+                logger.warning(
+                    'Lock file with invalid content found; ignoring.'
+                )
 
     def _get_lock_dictionary(self):
         if self.timeout:
@@ -59,6 +151,13 @@ class FileLock(LockingBackend):
 
         return result
 
+    def _get_lock_file_path(self):
+        return os.path.join(
+            self.__class__.lock_directory, hashlib.sha256(
+                string=force_bytes(s=self.name)
+            ).hexdigest()
+        )
+
     def _init(self, name, timeout):
         self.name = name
         self.timeout = timeout
@@ -66,59 +165,43 @@ class FileLock(LockingBackend):
             uuid.uuid4()
         )
 
-        lock.acquire()
-        with open(file=self.__class__.lock_file, mode='r+') as file_object:
-            locks.lock(f=file_object, flags=locks.LOCK_EX)
-
-            data = file_object.read()
+        file_descriptor = self.__class__._open_lock_file(
+            path=self._get_lock_file_path()
+        )
+        try:
+            lock_data = self._read_lock_data(file_descriptor=file_descriptor)
 
-            if data:
-                file_locks = json.loads(s=data)
-            else:
-                file_locks = {}
-
-            if name in file_locks:
-                # Someone already got this lock, check to see if it is expired.
-                if file_locks[name]['expiration'] and time.time() > file_locks[name]['expiration']:
-                    # It expires and has expired, we re-acquired it.
-                    file_locks[name] = self._get_lock_dictionary()
-                else:
-                    lock.release()
+            if lock_data:
+                # Someone already got this lock, check to see if it is
+                # expired.
+                if not lock_data['expiration'] or time.time() <= lock_data['expiration']:
                     raise LockError
-            else:
-                file_locks[name] = self._get_lock_dictionary()
 
-            file_object.seek(0)
-            file_object.truncate()
-            file_object.write(
-                json.dumps(obj=file_locks)
+            os.ftruncate(file_descriptor, 0)
+            os.lseek(file_descriptor, 0, os.SEEK_SET)
+            os.write(
+                file_descriptor, force_bytes(
+                    s=json.dumps(
+                        obj=self._get_lock_dictionary()
+                    )
+                )
             )
-            lock.release()
+        finally:
+            os.close(file_descriptor)
 
     def _release(self):
-        lock.acquire()
-        with open(file=self.__class__.lock_file, mode='r+') as file_object:
-            locks.lock(f=file_object, flags=locks.LOCK_EX)
-            try:
-                file_locks = json.loads(
-                    s=file_object.read()
-                )
-            except EOFError:
-                file_locks = {}
-
-            if self.name in file_locks:
-                if file_locks[self.name]['uuid'] == self.uuid:
-                    file_locks.pop(self.name)
-                else:
-                    # Lock expired and someone else acquired it
-                    pass
+        path = self._get_lock_file_path()
+
+        file_descriptor = self.__class__._open_lock_file(path=path)
+        try:
+            lock_data = self._read_lock_data(file_descriptor=file_descriptor)
+
+            if not lock_data or lock_data['uuid'] == self.uuid:
+                # Remove the lock or the empty file created when opening
+                # a lock that was already released.
+                os.unlink(path)
             else:
-                # Lock expired and someone else released it
+                # Lock expired and someone else acquired it.
                 pass
-
-            file_object.seek(0)
-            file_object.truncate()
-            file_object.write(
-                json.dumps(obj=file_locks)
-            )
-            lock.release()
+        finally:
+            os.close(file_descriptor)
@@ -1,3 +1,6 @@
+FILE_LOCK_DIRECTORY_SUFFIX = '_locks'
+FILE_LOCK_EXPIRED_PURGE_INTERVAL = 600  # Seconds
+
 REDIS_LOCK_NAME_PREFIX = '_mayan_lock:'
 REDIS_LOCK_VERSION_REQUIRED = (3, 3)
 REDIS_SCAN_KEYS_COUNT = 5000
@@ -1,2 +1,3 @@
 TEST_LOCK_1 = 'test lock 1'
+TEST_LOCK_CONCURRENT_THREAD_COUNT = 8
 TEST_LOCK_LONG_NAME = 'a' * 255
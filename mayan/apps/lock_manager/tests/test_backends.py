@@ -1,9 +1,15 @@
-from unittest import skip
+import os
+import threading
+import time
+from unittest import mock, skip
 
 from django.test import override_settings
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..exceptions import LockError
+
+from .literals import TEST_LOCK_1, TEST_LOCK_CONCURRENT_THREAD_COUNT
 from .mixins import (
     LockBackendTestCaseMixin, LockBackendTestMixin, DefaultTimeoutTestMixin
 )
@@ -15,6 +21,87 @@ class FileLockBackendTestCase(
 ):
     _test_locking_backend_string = 'mayan.apps.lock_manager.backends.file_lock.FileLock'
 
+    def test_concurrent_acquire(self):
+        lock_list = []
+
+        def thread_function():
+            try:
+                lock_list.append(
+                    self._test_locking_backend.acquire_lock(name=TEST_LOCK_1)
+                )
+            except LockError:
+                """Expected for all threads but one."""
+
+        thread_list = [
+            threading.Thread(target=thread_function)
+            for index in range(TEST_LOCK_CONCURRENT_THREAD_COUNT)
+        ]
+
+        for thread in thread_list:
+            thread.start()
+
+        for thread in thread_list:
+            thread.join()
+
+        self.assertEqual(len(lock_list), 1)
+
+        # Cleanup.
+        lock_list[0].release()
+
+    def test_release_lock_file_removal(self):
+        lock_1 = self._test_locking_backend.acquire_lock(name=TEST_LOCK_1)
+
+        lock_directory_file_count = len(
+            os.listdir(path=self._test_locking_backend.lock_directory)
+        )
+
+        lock_1.release()
+
+        self.assertEqual(
+            len(
+                os.listdir(path=self._test_locking_backend.lock_directory)
+            ), lock_directory_file_count - 1
+        )
+
+    def test_purge_locks_expired(self):
+        lock_1 = self._test_locking_backend.acquire_lock(
+            name=TEST_LOCK_1, timeout=1
+        )
+
+        lock_directory_file_count = len(
+            os.listdir(path=self._test_locking_backend.lock_directory)
+        )
+
+        with mock.patch(target='mayan.apps.lock_manager.backends.file_lock.time.time', return_value=time.time() + 2):
+            self._test_locking_backend.purge_locks_expired()
+
+        self.assertEqual(
+            len(
+                os.listdir(path=self._test_locking_backend.lock_directory)
+            ), lock_directory_file_count - 1
+        )
+
+        # Cleanup.
+        lock_1.release()
+
+    def test_purge_locks_expired_held_lock(self):
+        lock_1 = self._test_locking_backend.acquire_lock(name=TEST_LOCK_1)
+
+        lock_directory_file_count = len(
+            os.listdir(path=self._test_locking_backend.lock_directory)
+        )
+
+        self._test_locking_backend.purge_locks_expired()
+
+        self.assertEqual(
+            len(
+                os.listdir(path=self._test_locking_backend.lock_directory)
+            ), lock_directory_file_count
+        )
+
+        # Cleanup.
+        lock_1.release()
+
 
 class ModelLockBackendTestCase(
     LockBackendTestMixin, LockBackendTestCaseMixin, DefaultTimeoutTestMixin,
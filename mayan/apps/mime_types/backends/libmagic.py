@@ -0,0 +1,144 @@
+import ctypes
+import ctypes.util
+import threading
+
+from django.utils.encoding import force_str
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.dependencies.exceptions import DependenciesException
+
+from ..classes import MIMETypeBackend
+from ..exceptions import MIMETypeBackendError
+
+from .literals import (
+    DEFAULT_LIBMAGIC_BUFFER_SIZE, DEFAULT_LIBMAGIC_LIBRARY_NAME,
+    LIBMAGIC_FLAG_MIME_ENCODING, LIBMAGIC_FLAG_MIME_TYPE
+)
+
+
+class MIMETypeBackendLibMagic(MIMETypeBackend):
+    """
+    Detect the MIME type calling libmagic in process instead of executing
+    an external program. Only the header of the file, up to `buffer_size`
+    bytes, is read into memory and no temporary file is created.
+    libmagic handles are not thread safe, each thread opens and keeps its
+    own.
+    """
+    _library_cache = {}
+    _library_cache_lock = threading.Lock()
+    _thread_local = threading.local()
+
+    @staticmethod
+    def get_library(library_path):
+        with MIMETypeBackendLibMagic._library_cache_lock:
+            try:
+                return MIMETypeBackendLibMagic._library_cache[library_path]
+            except KeyError:
+                library = ctypes.CDLL(library_path)
+
+                library.magic_buffer.argtypes = (
+                    ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t
+                )
+                library.magic_buffer.restype = ctypes.c_char_p
+                library.magic_close.argtypes = (ctypes.c_void_p,)
+                library.magic_close.restype = None
+                library.magic_error.argtypes = (ctypes.c_void_p,)
+                library.magic_error.restype = ctypes.c_char_p
+                library.magic_load.argtypes = (
+                    ctypes.c_void_p, ctypes.c_char_p
+                )
+                library.magic_load.restype = ctypes.c_int
+                library.magic_open.argtypes = (ctypes.c_int,)
+                library.magic_open.restype = ctypes.c_void_p
+
+                MIMETypeBackendLibMagic._library_cache[library_path] = library
+                return library
+
+    def _init(self, buffer_size=None, library_path=None, magic_file_path=None):
+        self.buffer_size = buffer_size or DEFAULT_LIBMAGIC_BUFFER_SIZE
+        self.library_path = library_path or ctypes.util.find_library(
+            name=DEFAULT_LIBMAGIC_LIBRARY_NAME
+        )
+        self.magic_file_path = magic_file_path
+
+        if not self.library_path:
+            raise DependenciesException(
+                _(message='libmagic not installed or not found.')
+            )
+
+        try:
+            self.library = MIMETypeBackendLibMagic.get_library(
+                library_path=self.library_path
+            )
+        except OSError as exception:
+            raise DependenciesException(
+                _(message='Unable to load libmagic; %s') % exception
+            )
+
+    def _get_handle(self, flags):
+        thread_local = MIMETypeBackendLibMagic._thread_local
+
+        try:
+            handles = thread_local.handles
+        except AttributeError:
+            handles = thread_local.handles = {}
+
+        key = (self.library_path, self.magic_file_path, flags)
+
+        try:
+            return handles[key]
+        except KeyError:
+            handle = self.library.magic_open(flags)
+
+            if not handle:
+                raise MIMETypeBackendError('Unable to open libmagic handle.')
+
+            if self.magic_file_path:
+                magic_file_path = self.magic_file_path.encode()
+            else:
+                magic_file_path = None
+
+            if self.library.magic_load(handle, magic_file_path) != 0:
+                error_message = self.library.magic_error(handle)
+                self.library.magic_close(handle)
+                raise MIMETypeBackendError(
+                    'Unable to load magic database; {}'.format(
+                        force_str(s=error_message)
+                    )
+                )
+
+            handles[key] = handle
+            return handle
+
+    def _get_mime_type(self, file_object, mime_type_only):
+        file_object.seek(0)
+        data = file_object.read(self.buffer_size)
+        file_object.seek(0)
+
+        file_mime_type = self.get_buffer_result(
+            data=data, flags=LIBMAGIC_FLAG_MIME_TYPE
+        )
+
+        if mime_type_only:
+            file_mime_encoding = 'binary'
+        else:
+            file_mime_encoding = self.get_buffer_result(
+                data=data, flags=LIBMAGIC_FLAG_MIME_ENCODING
+            )
+
+        return (file_mime_type, file_mime_encoding)
+
+    def get_buffer_result(self, data, flags):
+        handle = self._get_handle(flags=flags)
+
+        result = self.library.magic_buffer(handle, data, len(data))
+
+        if result is None:
+            error_message = self.library.magic_error(handle)
+            raise MIMETypeBackendError(
+                'Unable to detect MIME type; {}'.format(
+                    force_str(s=error_message)
+                )
+            )
+
+        return force_str(s=result)
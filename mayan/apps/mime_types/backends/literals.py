@@ -1,2 +1,7 @@
 DEFAULT_FILE_PATH = '/usr/bin/file'
 DEFAULT_MIMETYPE_PATH = '/usr/bin/mimetype'
+DEFAULT_LIBMAGIC_BUFFER_SIZE = 1048576  # 1 MiB, libmagic's default bytes_max.
+DEFAULT_LIBMAGIC_LIBRARY_NAME = 'magic'
+
+LIBMAGIC_FLAG_MIME_ENCODING = 0x000400
+LIBMAGIC_FLAG_MIME_TYPE = 0x000010
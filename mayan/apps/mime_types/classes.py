@@ -1,19 +1,30 @@
+from collections import OrderedDict
 import logging
+import threading
 
 from django.utils.module_loading import import_string
 
+from .literals import MIME_TYPE_CACHE_MAXIMUM_SIZE
 from .settings import setting_backend, setting_backend_arguments
 
 logger = logging.getLogger(name=__name__)
 
 
 class MIMETypeBackend:
+    _mime_type_cache = OrderedDict()
+    _mime_type_cache_lock = threading.Lock()
+
     @staticmethod
     def get_backend_instance():
         return import_string(dotted_path=setting_backend.value)(
             **setting_backend_arguments.value
         )
 
+    @staticmethod
+    def mime_type_cache_clear():
+        with MIMETypeBackend._mime_type_cache_lock:
+            MIMETypeBackend._mime_type_cache.clear()
+
     def __init__(self, **kwargs):
         self.kwargs = kwargs
         return self._init(**kwargs)
@@ -21,7 +32,38 @@ class MIMETypeBackend:
     def _init(self, **kwargs):
         """Option method for subclasses to overload."""
 
-    def get_mime_type(self, file_object, mime_type_only=False):
-        return self._get_mime_type(
+    def get_mime_type(self, file_object, cache_key=None, mime_type_only=False):
+        """
+        Return a tuple of MIME type and encoding of the file object.
+        Callers able to identify the content of the file object, like a
+        checksum or a cache file name, can pass it as `cache_key` to reuse
+        the result of a previous detection instead of running the backend
+        again.
+        """
+        if cache_key is None:
+            return self._get_mime_type(
+                file_object=file_object, mime_type_only=mime_type_only
+            )
+
+        key = (cache_key, mime_type_only)
+
+        with MIMETypeBackend._mime_type_cache_lock:
+            try:
+                result = MIMETypeBackend._mime_type_cache[key]
+            except KeyError:
+                """Not cached, detect below."""
+            else:
+                MIMETypeBackend._mime_type_cache.move_to_end(key=key)
+                return result
+
+        result = self._get_mime_type(
             file_object=file_object, mime_type_only=mime_type_only
         )
+
+        with MIMETypeBackend._mime_type_cache_lock:
+            MIMETypeBackend._mime_type_cache[key] = result
+
+            while len(MIMETypeBackend._mime_type_cache) > MIME_TYPE_CACHE_MAXIMUM_SIZE:
+                MIMETypeBackend._mime_type_cache.popitem(last=False)
+
+        return result
@@ -0,0 +1,4 @@
+class MIMETypeBackendError(Exception):
+    """
+    Raised by the MIME type backend
+    """
@@ -1,2 +1,4 @@
 DEFAULT_MIME_TYPE_BACKEND = 'mayan.apps.mime_types.backends.file_command.MIMETypeBackendFileCommand'
 DEFAULT_MIME_TYPE_BACKEND_ARGUMENTS = {}
+
+MIME_TYPE_CACHE_MAXIMUM_SIZE = 1024
@@ -3,3 +3,9 @@
 # during the MIME type detection phase. Different architectures may need
 # different values.
 MAXIMUM_HEAP_MEMORY = 140000000
+
+TEST_MIME_TYPE_CACHE_KEY = 'test_mime_type_cache_key'
+
+TEST_MIME_TYPE_PDF = 'application/pdf'
+TEST_MIME_TYPE_TEXT = 'text/plain'
+TEST_MIME_TYPE_TEXT_ENCODING = 'us-ascii'
@@ -0,0 +1,77 @@
+import threading
+
+from mayan.apps.documents.tests.literals import (
+    TEST_DOCUMENT_SMALL_MIMETYPE, TEST_FILE_PDF_PATH, TEST_FILE_SMALL_PATH,
+    TEST_FILE_TEXT_PATH
+)
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..backends.file_command import MIMETypeBackendFileCommand
+from ..backends.libmagic import MIMETypeBackendLibMagic
+
+from .literals import (
+    TEST_MIME_TYPE_PDF, TEST_MIME_TYPE_TEXT, TEST_MIME_TYPE_TEXT_ENCODING
+)
+
+
+class MIMETypeBackendLibMagicTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mime_type_backend = MIMETypeBackendLibMagic()
+
+    def test_get_mime_type(self):
+        with open(file=TEST_FILE_TEXT_PATH, mode='rb') as file_object:
+            mime_type, encoding = self.mime_type_backend.get_mime_type(
+                file_object=file_object
+            )
+
+            self.assertEqual(file_object.tell(), 0)
+
+        self.assertEqual(mime_type, TEST_MIME_TYPE_TEXT)
+        self.assertEqual(encoding, TEST_MIME_TYPE_TEXT_ENCODING)
+
+    def test_get_mime_type_mime_type_only(self):
+        with open(file=TEST_FILE_SMALL_PATH, mode='rb') as file_object:
+            mime_type, encoding = self.mime_type_backend.get_mime_type(
+                file_object=file_object, mime_type_only=True
+            )
+
+        self.assertEqual(mime_type, TEST_DOCUMENT_SMALL_MIMETYPE)
+        self.assertEqual(encoding, 'binary')
+
+    def test_get_mime_type_matches_file_command(self):
+        mime_type_backend_file_command = MIMETypeBackendFileCommand()
+
+        for path in (TEST_FILE_PDF_PATH, TEST_FILE_SMALL_PATH, TEST_FILE_TEXT_PATH):
+            with open(file=path, mode='rb') as file_object:
+                self.assertEqual(
+                    self.mime_type_backend.get_mime_type(
+                        file_object=file_object
+                    ),
+                    mime_type_backend_file_command.get_mime_type(
+                        file_object=file_object
+                    )
+                )
+
+    def test_get_mime_type_threads(self):
+        results = []
+
+        def thread_function():
+            with open(file=TEST_FILE_PDF_PATH, mode='rb') as file_object:
+                results.append(
+                    self.mime_type_backend.get_mime_type(
+                        file_object=file_object, mime_type_only=True
+                    )[0]
+                )
+
+        threads = [
+            threading.Thread(target=thread_function) for index in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [TEST_MIME_TYPE_PDF] * 4)
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from mayan.apps.documents.tests.literals import (
+    TEST_DOCUMENT_SMALL_MIMETYPE, TEST_FILE_SMALL_PATH
+)
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import MIMETypeBackend
+
+from .literals import TEST_MIME_TYPE_CACHE_KEY
+from .mixins import MIMETypeBackendMixin
+
+
+class MIMETypeBackendCacheTestCase(MIMETypeBackendMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        MIMETypeBackend.mime_type_cache_clear()
+
+    def tearDown(self):
+        MIMETypeBackend.mime_type_cache_clear()
+        super().tearDown()
+
+    def test_get_mime_type_with_cache_key(self):
+        with open(file=TEST_FILE_SMALL_PATH, mode='rb') as file_object:
+            with mock.patch.object(target=self.mime_type_backend, attribute='_get_mime_type', wraps=self.mime_type_backend._get_mime_type) as mocked_get_mime_type:
+                result_first = self.mime_type_backend.get_mime_type(
+                    cache_key=TEST_MIME_TYPE_CACHE_KEY,
+                    file_object=file_object
+                )
+                result_second = self.mime_type_backend.get_mime_type(
+                    cache_key=TEST_MIME_TYPE_CACHE_KEY,
+                    file_object=file_object
+                )
+
+        self.assertEqual(mocked_get_mime_type.call_count, 1)
+        self.assertEqual(result_first, result_second)
+        self.assertEqual(result_first[0], TEST_DOCUMENT_SMALL_MIMETYPE)
+
+    def test_get_mime_type_without_cache_key(self):
+        with open(file=TEST_FILE_SMALL_PATH, mode='rb') as file_object:
+            with mock.patch.object(target=self.mime_type_backend, attribute='_get_mime_type', wraps=self.mime_type_backend._get_mime_type) as mocked_get_mime_type:
+                self.mime_type_backend.get_mime_type(file_object=file_object)
+                self.mime_type_backend.get_mime_type(file_object=file_object)
+
+        self.assertEqual(mocked_get_mime_type.call_count, 2)
@@ -2,7 +2,6 @@ import logging
 
 from furl import furl
 
-from django.apps import apps
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.template import RequestContext, Variable, VariableDoesNotExist
 from django.template.defaulttags import URLNode
@@ -10,7 +9,6 @@ from django.urls import resolve, reverse
 from django.utils.encoding import force_str
 
 from mayan.apps.common.settings import setting_home_view
-from mayan.apps.permissions.classes import Permission
 
 from .class_mixins import TemplateObjectMixin
 
@@ -89,9 +87,8 @@ class Link(TemplateObjectMixin):
             """No object variable in the context"""
 
     def resolve(self, context=None, request=None, resolved_object=None):
-        AccessControlList = apps.get_model(
-            app_label='acls', model_name='AccessControlList'
-        )
+        # Hidden import.
+        from mayan.apps.acls.classes import AccessCheckCache
 
         if not context and not request:
             raise ImproperlyConfigured(
@@ -125,18 +122,21 @@ class Link(TemplateObjectMixin):
         permission = self.get_permission(context=context)
 
         if permission:
+            access_check_cache = AccessCheckCache.get_for_request(
+                request=request
+            )
+
             if permission_object:
                 try:
-                    AccessControlList.objects.check_access(
-                        obj=permission_object, permission=permission,
-                        user=request.user
+                    access_check_cache.check_access(
+                        obj=permission_object, permission=permission
                     )
                 except PermissionDenied:
                     return None
             else:
                 try:
-                    Permission.check_user_permission(
-                        permission=permission, user=request.user
+                    access_check_cache.check_user_permission(
+                        permission=permission
                     )
                 except PermissionDenied:
                     return None
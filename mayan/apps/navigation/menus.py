@@ -5,7 +5,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.template import RequestContext, Variable, VariableDoesNotExist
 
 from .class_mixins import TemplateObjectMixin
-from .links import ResolvedLink
+from .links import Link, ResolvedLink
 from .utils import get_current_view_name
 
 logger = logging.getLogger(name=__name__)
@@ -102,6 +102,49 @@ class Menu(TemplateObjectMixin):
     def get_icon(self, context):
         return self._icon
 
+    def do_access_check_prefetch(self, context, source_list):
+        """
+        Add the objects of a list to the access check cache of the request
+        for the permissions of the links bound to them. The access to all
+        the objects is then resolved with a single query per permission
+        and model when the links of the first object are resolved.
+        """
+        # Hidden import.
+        from mayan.apps.acls.classes import AccessCheckCache
+
+        if self.cache_class_associations:
+            function_get_links_for_class = self.get_links_for_class_cached
+        else:
+            function_get_links_for_class = self.get_links_for_class_non_cached
+
+        try:
+            request = self.get_request(context=context)
+        except VariableDoesNotExist:
+            return
+
+        access_check_cache = AccessCheckCache.get_for_request(
+            request=request
+        )
+
+        for source in source_list:
+            navigation_object_class = self.get_navigation_object_class(
+                resolved_navigation_object=source
+            )
+            matched_links = function_get_links_for_class(
+                resolved_navigation_object_class=navigation_object_class
+            )
+
+            for link in matched_links:
+                # Only links that check the permission against the
+                # object being resolved can be prefetched.
+                if isinstance(link, Link) and link.__class__.get_permission is Link.get_permission and link.__class__.get_permission_object is Link.get_permission_object:
+                    permission = link.get_permission(context=context)
+
+                    if permission:
+                        access_check_cache.add(
+                            obj=source, permission=permission
+                        )
+
     def do_matched_links_update(
         self, matched_links, bound_object, unbound_object, excluded_object
     ):
@@ -62,6 +62,17 @@ def navigation_link_get_icon(context, link):
     return link.get_icon(context=context)
 
 
+@register.simple_tag(takes_context=True)
+def navigation_menus_access_check_prefetch(context, names, source_list):
+    for name in names.split(','):
+        menu = Menu.get(name)
+        menu.do_access_check_prefetch(
+            context=context, source_list=source_list
+        )
+
+    return ''
+
+
 @register.simple_tag(takes_context=True)
 def navigation_resolve_menu(context, name, source=None, sort_results=None):
     return _navigation_resolve_menu(
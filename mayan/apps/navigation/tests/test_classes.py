@@ -406,6 +406,48 @@ class MenuClassTestCase(GenericViewTestCase):
             resolved_menu[0]['object'], test_model_proxy_object
         )
 
+    def test_access_check_prefetch(self):
+        self._create_test_object()
+
+        ModelPermission.register(
+            model=self._test_model_dict['_TestModel_0'],
+            permissions=(self._test_permission,)
+        )
+
+        link = Link(
+            permission=self._test_permission, text=TEST_LINK_TEXT,
+            view=self._test_view_name
+        )
+        self.menu.bind_links(
+            links=(link,), sources=(self._test_model_dict['_TestModel_0'],)
+        )
+
+        self.grant_access(
+            obj=self._test_object_list[0], permission=self._test_permission
+        )
+
+        response = self.get(viewname=self._test_view_name)
+        context = Context(
+            {'request': response.wsgi_request}
+        )
+
+        self.menu.do_access_check_prefetch(
+            context=context, source_list=self._test_object_list
+        )
+
+        self.assertTrue(
+            self.menu.resolve(
+                context=context, source=self._test_object_list[0]
+            )
+        )
+
+        with self.assertNumQueries(num=0):
+            self.assertEqual(
+                self.menu.resolve(
+                    context=context, source=self._test_object_list[1]
+                ), []
+            )
+
 
 class SourceColumnClassTestCase(GenericViewTestCase):
     def setUp(self):
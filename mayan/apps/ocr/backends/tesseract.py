@@ -14,6 +14,10 @@ logger = logging.getLogger(name=__name__)
 
 
 class Tesseract(OCRBackendBase):
+    # Version and language probe results, per binary path. Shared by all
+    # instances of the process.
+    _probe_cache = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.read_settings()
@@ -21,7 +25,7 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
-    def _execute(self, image_file_object):
+    def _execute(self, image_file_object, language=None):
         """
         Execute the command line binary of tesseract.
         """
@@ -33,8 +37,8 @@ class Tesseract(OCRBackendBase):
                 '_timeout': self.command_timeout
             }
 
-            if self.language:
-                keyword_arguments['l'] = self.language
+            if language:
+                keyword_arguments['l'] = language
 
             environment = os.environ.copy()
             environment.update(self.command_environment)
@@ -55,15 +59,15 @@ class Tesseract(OCRBackendBase):
                 error_message_list = []
                 error_message_list.append(
                     'Exception calling Tesseract with language option: {}; {}'.format(
-                        self.language, exception
+                        language, exception
                     )
                 )
 
-                if self.language not in self.languages:
+                if language not in self.languages:
                     error_message_list.append(
                         'The requested OCR language "{}" is not '
                         'available and needs to be installed.'.format(
-                            self.language
+                            language
                         )
                     )
 
@@ -89,27 +93,48 @@ class Tesseract(OCRBackendBase):
                 _(message='Tesseract OCR not found.')
             )
         else:
-            # Get version.
-            output = self.command_tesseract(v=True)
-            logger.debug('Tesseract version: %s', output)
-
-            # Get languages.
-            output = self.command_tesseract(list_langs=True)
-            # Sample output format.
-            # List of available languages (3):
-            # deu
-            # eng
-            # osd
-            # <- empty line
-
-            # Extraction: strip last line, split by newline, discard the
-            # first line.
-            self.languages = output.strip().split('\n')[1:]
+            try:
+                self.version, self.languages = Tesseract._probe_cache[
+                    self.tesseract_binary_path
+                ]
+            except KeyError:
+                self.version, self.languages = self.probe()
+                Tesseract._probe_cache[
+                    self.tesseract_binary_path
+                ] = (self.version, self.languages)
 
             logger.debug(
                 'Available languages: %s', ', '.join(self.languages)
             )
 
+    def probe(self):
+        """
+        Execute the binary to obtain the version and the list of installed
+        languages.
+        """
+        # Get version.
+        version = str(
+            self.command_tesseract(v=True)
+        )
+        logger.debug('Tesseract version: %s', version)
+
+        # Get languages.
+        output = self.command_tesseract(list_langs=True)
+        # Sample output format.
+        # List of available languages (3):
+        # deu
+        # eng
+        # osd
+        # <- empty line
+
+        # Extraction: strip last line, split by newline, discard the
+        # first line.
+        languages = tuple(
+            output.strip().split('\n')[1:]
+        )
+
+        return version, languages
+
     def read_settings(self):
         self.command_timeout = self.kwargs.get(
             'timeout', DEFAULT_TESSERACT_TIMEOUT
@@ -0,0 +1,107 @@
+import logging
+import threading
+
+from PIL import Image
+
+from django.utils.translation import gettext_lazy as _
+
+from ..classes import OCRBackendBase
+from ..exceptions import OCRError
+
+from .literals import DEFAULT_TESSERACT_LANGUAGE
+
+logger = logging.getLogger(name=__name__)
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+class TesserOCR(OCRBackendBase):
+    """
+    OCR backend using the Tesseract C API via the optional `tesserocr`
+    package. The engines are loaded once per language and thread and kept
+    warm for the lifetime of the worker process, removing the process
+    startup and model loading cost from each page.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+        self.read_settings()
+
+        if kwargs.get('auto_initialize', True):
+            self.initialize()
+
+    def _execute(self, image_file_object, language=None):
+        engine = self.get_engine(language=language)
+
+        try:
+            with Image.open(fp=image_file_object) as image:
+                engine.SetImage(image)
+                return engine.GetUTF8Text()
+        except Exception as exception:
+            error_message = 'Exception calling tesserocr with language option: {}; {}'.format(
+                language, exception
+            )
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+        finally:
+            engine.Clear()
+
+    def get_engine(self, language=None):
+        """
+        Return the warm engine of the current thread for the language,
+        creating it on first use.
+        """
+        language = language or DEFAULT_TESSERACT_LANGUAGE
+
+        try:
+            engines = self._local.engines
+        except AttributeError:
+            engines = self._local.engines = {}
+
+        try:
+            return engines[language]
+        except KeyError:
+            if language not in self.languages:
+                raise OCRError(
+                    'The requested OCR language "{}" is not available and '
+                    'needs to be installed.'.format(language)
+                )
+
+            keyword_arguments = {'lang': language}
+            if self.tessdata_path:
+                keyword_arguments['path'] = self.tessdata_path
+
+            engine = tesserocr.PyTessBaseAPI(**keyword_arguments)
+
+            for name, value in self.variables.items():
+                engine.SetVariable(name, str(value))
+
+            engines[language] = engine
+            return engine
+
+    def initialize(self):
+        if not tesserocr:
+            raise OCRError(
+                _(message='tesserocr not installed or not found.')
+            )
+
+        self.version = tesserocr.tesseract_version()
+        logger.debug('Tesseract version: %s', self.version)
+
+        if self.tessdata_path:
+            path, languages = tesserocr.get_languages(self.tessdata_path)
+        else:
+            path, languages = tesserocr.get_languages()
+
+        self.languages = tuple(languages)
+
+        logger.debug(
+            'Available languages: %s', ', '.join(self.languages)
+        )
+
+    def read_settings(self):
+        self.tessdata_path = self.kwargs.get('tessdata_path', None)
+        self.variables = self.kwargs.get('variables', {})
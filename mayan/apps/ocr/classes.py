@@ -1,4 +1,6 @@
+import os
 import shutil
+import threading
 
 from django.utils.encoding import force_str
 from django.utils.module_loading import import_string
@@ -10,35 +12,70 @@ from .settings import setting_ocr_backend, setting_ocr_backend_arguments
 
 
 class OCRBackendBase:
+    _instance_cache = {}
+    _instance_cache_lock = threading.Lock()
+    _instance_cache_process_id = None
+
     @staticmethod
     def get_instance():
-        return import_string(
-            dotted_path=setting_ocr_backend.value
-        )(**setting_ocr_backend_arguments.value)
+        """
+        Return the OCR backend instance of the current process. The
+        instance is created on first use and reused afterwards to run the
+        backend initialization once per worker process instead of once per
+        page. Instances are never shared with forked child processes.
+        """
+        backend_arguments = setting_ocr_backend_arguments.value
+        key = (
+            setting_ocr_backend.value, repr(backend_arguments)
+        )
+        process_id = os.getpid()
+
+        with OCRBackendBase._instance_cache_lock:
+            if OCRBackendBase._instance_cache_process_id != process_id:
+                OCRBackendBase._instance_cache = {}
+                OCRBackendBase._instance_cache_process_id = process_id
+
+            try:
+                return OCRBackendBase._instance_cache[key]
+            except KeyError:
+                instance = import_string(
+                    dotted_path=setting_ocr_backend.value
+                )(**backend_arguments)
+                OCRBackendBase._instance_cache[key] = instance
+                return instance
+
+    @staticmethod
+    def instance_cache_clear():
+        with OCRBackendBase._instance_cache_lock:
+            OCRBackendBase._instance_cache = {}
 
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
 
-    def execute(self, file_object, language=None, transformations=None):
-        self.language = language
-
-        if not transformations:
-            transformations = []
-
-        self.converter = ConverterBase.get_converter_class()(
-            file_object=file_object
+    def execute(
+        self, file_object, language=None, mime_type=None,
+        mime_type_cache_key=None, transformations=None
+    ):
+        # The instance is shared by all the tasks of the process, keep the
+        # execution state in local variables.
+        converter = ConverterBase.get_converter_class()(
+            file_object=file_object, mime_type=mime_type,
+            mime_type_cache_key=mime_type_cache_key
         )
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+        for transformation in transformations or ():
+            converter.transform(transformation=transformation)
 
-        image = self.converter.get_page()
+        image = converter.get_page()
 
         with TemporaryFile() as temporary_image_file:
             shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
             temporary_image_file.seek(0)
 
             return force_str(
-                s=self._execute(image_file_object=temporary_image_file)
+                s=self._execute(
+                    image_file_object=temporary_image_file,
+                    language=language
+                )
             )
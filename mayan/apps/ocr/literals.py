@@ -3,6 +3,7 @@ DEFAULT_OCR_BACKEND = 'mayan.apps.ocr.backends.tesseract.Tesseract'
 DEFAULT_OCR_BACKEND_ARGUMENTS = {
     'environment': {'OMP_THREAD_LIMIT': '1'}
 }
+DEFAULT_OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE = 0
 
 ERROR_LOG_DOMAIN_NAME = 'ocr'
 
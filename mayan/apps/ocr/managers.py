@@ -1,9 +1,15 @@
+from itertools import islice
 import logging
 
 from django.apps import apps
-from django.db import models
+from django.db import models, transaction
 
+from mayan.apps.converter.classes import ConverterBase
 from mayan.apps.converter.settings import setting_image_generation_timeout
+from mayan.apps.dynamic_search.search_models import SearchModel
+from mayan.apps.dynamic_search.tasks import (
+    task_index_instance, task_index_instances
+)
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from .classes import OCRBackendBase
@@ -18,33 +24,15 @@ logger = logging.getLogger(name=__name__)
 
 
 class DocumentVersionPageOCRContentManager(models.Manager):
-    def delete_content_for(self, document_version, user=None):
-        self.filter(document_version_page__document_version=document_version).delete()
-
-        event_ocr_document_version_content_deleted.commit(
-            actor=user, action_object=document_version.document,
-            target=document_version
-        )
-
-    def do_ocr_finished(self, document_version, user):
-        event_ocr_document_version_finished.commit(
-            action_object=document_version.document, actor=user,
-            target=document_version
-        )
-
-    def process_document_version_page(
+    def _execute_document_version_page(
         self, document_version_page, user=None
     ):
-        logger.info(
-            'Processing page: %d of document version: %s',
-            document_version_page.page_number,
-            document_version_page.document_version
-        )
-
-        DocumentVersionPageOCRContent = apps.get_model(
-            app_label='ocr', model_name='DocumentVersionPageOCRContent'
-        )
-
+        """
+        Generate the image of a document version page under the page lock
+        and execute the OCR backend on it. Returns the OCR content or None
+        if the backend failed, in which case the error is logged to the
+        page error log.
+        """
         lock_name = document_version_page.get_lock_name(user=user)
 
         try:
@@ -64,11 +52,17 @@ class DocumentVersionPageOCRContentManager(models.Manager):
                     _acquire_lock=False, user=user
                 )
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
+                cache_file = document_version_page.cache_partition.get_file(
+                    filename=cache_filename
+                )
+
+                with cache_file.open() as file_object:
                     try:
                         ocr_content = OCRBackendBase.get_instance().execute(
                             file_object=file_object,
-                            language=document_version_page.document_version.document.language
+                            language=document_version_page.document_version.document.language,
+                            mime_type=ConverterBase.get_output_content_type(),
+                            mime_type_cache_key=cache_file.get_mime_type_cache_key()
                         )
                     except OCRError as exception:
                         document_version_page.error_log.create(
@@ -76,31 +70,210 @@ class DocumentVersionPageOCRContentManager(models.Manager):
                             text=str(exception)
                         )
                     else:
-                        DocumentVersionPageOCRContent.objects.update_or_create(
-                            document_version_page=document_version_page,
-                            defaults={
-                                'content': ocr_content
-                            }
-                        )
                         queryset_error_logs = document_version_page.error_log.filter(
                             domain_name=ERROR_LOG_DOMAIN_NAME
                         )
                         queryset_error_logs.delete()
+
+                        return ocr_content
             except Exception as exception:
                 logger.error(
                     'OCR error for document version page: %d; %s',
                     document_version_page.pk, exception, exc_info=True
                 )
                 raise
-            else:
-                logger.info(
-                    'Finished processing page: %d of document version: %s',
-                    document_version_page.page_number,
-                    document_version_page.document_version
-                )
             finally:
                 document_version_page_lock.release()
 
+    def delete_content_for(self, document_version, user=None):
+        self.filter(document_version_page__document_version=document_version).delete()
+
+        event_ocr_document_version_content_deleted.commit(
+            actor=user, action_object=document_version.document,
+            target=document_version
+        )
+
+    def do_ocr_finished(self, document_version, user):
+        event_ocr_document_version_finished.commit(
+            action_object=document_version.document, actor=user,
+            target=document_version
+        )
+
+    def process_document_version_page(
+        self, document_version_page, user=None
+    ):
+        logger.info(
+            'Processing page: %d of document version: %s',
+            document_version_page.page_number,
+            document_version_page.document_version
+        )
+
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+
+        ocr_content = self._execute_document_version_page(
+            document_version_page=document_version_page, user=user
+        )
+
+        if ocr_content is not None:
+            DocumentVersionPageOCRContent.objects.update_or_create(
+                document_version_page=document_version_page,
+                defaults={
+                    'content': ocr_content
+                }
+            )
+
+        logger.info(
+            'Finished processing page: %d of document version: %s',
+            document_version_page.page_number,
+            document_version_page.document_version
+        )
+
+    def process_document_version_batch(
+        self, batch_size, document_version, page_number_first=None,
+        user=None
+    ):
+        """
+        Generator that processes the pages of a document version in chunks
+        of `batch_size` pages. Yields a tuple with the number of pages
+        processed so far, the total number of pages, and the page number
+        from which to resume after each chunk. `page_number_first` skips
+        the pages of the chunks already processed.
+        """
+        queryset_pages = document_version.pages.all()
+        page_count = queryset_pages.count()
+
+        if page_number_first is None:
+            page_processed_count = 0
+        else:
+            page_processed_count = queryset_pages.filter(
+                page_number__lt=page_number_first
+            ).count()
+            queryset_pages = queryset_pages.filter(
+                page_number__gte=page_number_first
+            )
+
+        iterator_pages = queryset_pages.iterator(chunk_size=batch_size)
+
+        while True:
+            batch = list(
+                islice(iterator_pages, batch_size)
+            )
+
+            if not batch:
+                break
+
+            try:
+                # Rasterize the pages of the chunk in batches before the
+                # OCR of each page requests its image.
+                document_version.pages_image_cache_generate(
+                    document_version_page_list=batch
+                )
+            except Exception as exception:
+                # Not fatal, the page images will be generated individually.
+                logger.warning(
+                    'Unable to generate the page images of document '
+                    'version: %s; %s', document_version, exception,
+                    exc_info=True
+                )
+
+            self.process_document_version_page_list(
+                document_version_page_list=batch, user=user
+            )
+
+            page_processed_count += len(batch)
+
+            yield page_processed_count, page_count, batch[-1].page_number + 1
+
+        # The OCR content was stored with bulk queries which don't trigger
+        # the search indexing signal handlers.
+        for instance in (document_version, document_version.document):
+            task_index_instance.apply_async(
+                kwargs={
+                    'app_label': instance._meta.app_label,
+                    'model_name': instance._meta.model_name,
+                    'object_id': instance.pk
+                }
+            )
+
+    def process_document_version_page_list(
+        self, document_version_page_list, user=None
+    ):
+        """
+        Process a chunk of document version pages with a single backend
+        instance and store the results using bulk queries. Bulk queries do
+        not emit model signals, the search indexing of the pages is
+        requested explicitly as a single batch.
+        Returns the number of pages with OCR content stored.
+        """
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+        DocumentVersionPageSearchResult = apps.get_model(
+            app_label='documents',
+            model_name='DocumentVersionPageSearchResult'
+        )
+
+        page_content_dictionary = {}
+
+        for document_version_page in document_version_page_list:
+            ocr_content = self._execute_document_version_page(
+                document_version_page=document_version_page, user=user
+            )
+
+            if ocr_content is not None:
+                page_content_dictionary[
+                    document_version_page.pk
+                ] = ocr_content
+
+        if not page_content_dictionary:
+            return 0
+
+        queryset_ocr_content_existing = self.filter(
+            document_version_page_id__in=page_content_dictionary.keys()
+        )
+
+        ocr_content_update_list = []
+
+        for ocr_content in queryset_ocr_content_existing:
+            ocr_content.content = page_content_dictionary.pop(
+                ocr_content.document_version_page_id
+            )
+            ocr_content_update_list.append(ocr_content)
+
+        ocr_content_create_list = [
+            DocumentVersionPageOCRContent(
+                content=content, document_version_page_id=page_id
+            ) for page_id, content in page_content_dictionary.items()
+        ]
+
+        with transaction.atomic():
+            self.bulk_update(
+                fields=('content',), objs=ocr_content_update_list
+            )
+            self.bulk_create(objs=ocr_content_create_list)
+
+        id_list = [
+            ocr_content.document_version_page_id for ocr_content in ocr_content_update_list
+        ]
+        id_list.extend(
+            ocr_content.document_version_page_id for ocr_content in ocr_content_create_list
+        )
+
+        search_model = SearchModel.get_for_model(
+            instance=DocumentVersionPageSearchResult
+        )
+
+        task_index_instances.apply_async(
+            kwargs={
+                'id_list': id_list,
+                'search_model_full_name': search_model.full_name
+            }
+        )
+
+        return len(id_list)
+
 
 class DocumentTypeSettingsManager(models.Manager):
     def get_by_natural_key(self, document_type_natural_key):
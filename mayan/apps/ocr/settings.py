@@ -3,7 +3,8 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -18,6 +19,14 @@ setting_auto_ocr = setting_namespace.do_setting_add(
         message='Set new document types to perform OCR automatically by default.'
     )
 )
+setting_document_version_page_batch_size = setting_namespace.do_setting_add(
+    default=DEFAULT_OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE,
+    global_name='OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE', help_text=_(
+        message='Number of pages processed per chunk when a document '
+        'version is processed by a single OCR task. A value of 0 disables '
+        'the batch mode and a separate task is executed for each page.'
+    )
+)
 setting_ocr_backend = setting_namespace.do_setting_add(
     default=DEFAULT_OCR_BACKEND, global_name='OCR_BACKEND', help_text=_(
         message='Full path to the backend to be used to do OCR.'
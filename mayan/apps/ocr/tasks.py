@@ -1,6 +1,7 @@
 import logging
 
 from celery import chord
+from celery.backends.base import DisabledBackend
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
@@ -9,12 +10,14 @@ from django.db import OperationalError
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .settings import setting_document_version_page_batch_size
+
 logger = logging.getLogger(name=__name__)
 
 
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_document_version_ocr_process(
-    self, document_version_id, user_id=None
+    self, document_version_id, page_number_first=None, user_id=None
 ):
     logger.info(
         'Starting OCR for document version page ID: %s', document_version_id
@@ -27,6 +30,65 @@ def task_document_version_ocr_process(
         pk=document_version_id
     )
 
+    batch_size = setting_document_version_page_batch_size.value
+
+    if batch_size:
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+
+        User = get_user_model()
+
+        if user_id:
+            user = User.objects.get(pk=user_id)
+        else:
+            user = None
+
+        iterator_progress = DocumentVersionPageOCRContent.objects.process_document_version_batch(
+            batch_size=batch_size, document_version=document_version,
+            page_number_first=page_number_first, user=user
+        )
+
+        # Retries resume from the first page of the chunk that failed.
+        retry_kwargs = {
+            'document_version_id': document_version_id,
+            'page_number_first': page_number_first, 'user_id': user_id
+        }
+
+        try:
+            for page_processed_count, page_count, page_number_next in iterator_progress:
+                retry_kwargs['page_number_first'] = page_number_next
+
+                logger.info(
+                    'OCR processed %d of %d pages of document version '
+                    'ID: %s', page_processed_count, page_count,
+                    document_version_id
+                )
+
+                if not isinstance(self.backend, DisabledBackend):
+                    self.update_state(
+                        meta={
+                            'current': page_processed_count,
+                            'total': page_count
+                        }, state='PROGRESS'
+                    )
+        except CachePartitionFile.DoesNotExist as exception:
+            logger.info(
+                'Document version page image not found. Possible cause '
+                'overloaded system or cache size too small. Retrying task.',
+            )
+            raise self.retry(exc=exception, kwargs=retry_kwargs)
+        except (LockError, OperationalError) as exception:
+            raise self.retry(exc=exception, kwargs=retry_kwargs)
+
+        DocumentVersionPageOCRContent.objects.do_ocr_finished(
+            document_version=document_version, user=user
+        )
+        return
+
     document_version_page_tasks = []
     for document_version_page in document_version.pages.all():
         document_version_page_tasks.append(
@@ -9,4 +9,7 @@ TEST_DOCUMENT_VERSION_OCR_INDEX_NODE_TEMPLATE = '{{ document.ocr_content|join:"
 TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT = 'test content'
 TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED = 'updated content'
 
+TEST_OCR_BACKEND_LANGUAGES = ('eng', 'osd')
+TEST_OCR_BACKEND_VERSION = 'tesseract 5.3.0'
+
 TEST_UPDATE_DOCUMENT_PAGE_OCR_ACTION_DOTTED_PATH = 'mayan.apps.ocr.workflow_actions.UpdateDocumentPageOCRAction'
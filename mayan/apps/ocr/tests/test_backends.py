@@ -0,0 +1,41 @@
+from unittest import mock
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..backends.tesseract import Tesseract
+from ..classes import OCRBackendBase
+
+from .literals import TEST_OCR_BACKEND_LANGUAGES, TEST_OCR_BACKEND_VERSION
+
+
+@mock.patch('mayan.apps.ocr.backends.tesseract.sh.Command')
+@mock.patch(
+    'mayan.apps.ocr.backends.tesseract.Tesseract.probe',
+    return_value=(TEST_OCR_BACKEND_VERSION, TEST_OCR_BACKEND_LANGUAGES)
+)
+class TesseractBackendTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        OCRBackendBase.instance_cache_clear()
+        Tesseract._probe_cache.clear()
+
+    def tearDown(self):
+        OCRBackendBase.instance_cache_clear()
+        Tesseract._probe_cache.clear()
+        super().tearDown()
+
+    def test_get_instance_reuse(self, mocked_probe, mocked_command):
+        instance_1 = OCRBackendBase.get_instance()
+        instance_2 = OCRBackendBase.get_instance()
+
+        self.assertEqual(instance_1, instance_2)
+        self.assertEqual(mocked_probe.call_count, 1)
+
+    def test_probe_cache(self, mocked_probe, mocked_command):
+        instance_1 = Tesseract()
+        instance_2 = Tesseract()
+
+        self.assertNotEqual(instance_1, instance_2)
+        self.assertEqual(instance_2.languages, TEST_OCR_BACKEND_LANGUAGES)
+        self.assertEqual(instance_2.version, TEST_OCR_BACKEND_VERSION)
+        self.assertEqual(mocked_probe.call_count, 1)
@@ -1,12 +1,19 @@
+from unittest import mock
+
 from django.test import override_settings
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_FILE_GERMAN_PATH
 
+from ..classes import OCRBackendBase
+from ..models import DocumentVersionPageOCRContent
+
 from .literals import (
     TEST_DOCUMENT_VERSION_OCR_CONTENT,
     TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
-    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2
+    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2,
+    TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT,
+    TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED
 )
 
 
@@ -31,3 +38,71 @@ class GermanOCRSupportTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2 in content
         )
+
+
+@mock.patch(
+    'mayan.apps.ocr.backends.tesseract.Tesseract._execute',
+    return_value=TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+)
+@mock.patch('mayan.apps.ocr.backends.tesseract.Tesseract.initialize')
+class DocumentVersionPageOCRContentManagerTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super().setUp()
+        OCRBackendBase.instance_cache_clear()
+
+    def tearDown(self):
+        OCRBackendBase.instance_cache_clear()
+        super().tearDown()
+
+    def test_method_process_document_version_batch(
+        self, mocked_initialize, mocked_execute
+    ):
+        DocumentVersionPageOCRContent.objects.all().delete()
+
+        iterator_progress = DocumentVersionPageOCRContent.objects.process_document_version_batch(
+            batch_size=1, document_version=self._test_document_version
+        )
+
+        self.assertEqual(
+            list(iterator_progress), [(1, 1, 2)]
+        )
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.get(
+                document_version_page=self._test_document_version_page
+            ).content, TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+        )
+
+    def test_method_process_document_version_batch_resume(
+        self, mocked_initialize, mocked_execute
+    ):
+        DocumentVersionPageOCRContent.objects.all().delete()
+
+        iterator_progress = DocumentVersionPageOCRContent.objects.process_document_version_batch(
+            batch_size=1, document_version=self._test_document_version,
+            page_number_first=2
+        )
+
+        self.assertEqual(
+            list(iterator_progress), []
+        )
+        self.assertEqual(mocked_execute.call_count, 0)
+        self.assertEqual(DocumentVersionPageOCRContent.objects.count(), 0)
+
+    def test_method_process_document_version_page_list_update(
+        self, mocked_initialize, mocked_execute
+    ):
+        DocumentVersionPageOCRContent.objects.update_or_create(
+            document_version_page=self._test_document_version_page,
+            defaults={'content': TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED}
+        )
+
+        processed_count = DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+            document_version_page_list=(self._test_document_version_page,)
+        )
+
+        self.assertEqual(processed_count, 1)
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.get(
+                document_version_page=self._test_document_version_page
+            ).content, TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+        )
@@ -1,10 +1,21 @@
+import math
+import unittest
 from unittest import mock
 
+from mayan.apps.converter.backends.python import command_pdftoppm
+from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.documents.literals import (
+    DOCUMENT_FILE_PAGE_IMAGE_GENERATE_WINDOW_SIZE
+)
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.documents.tests.literals import (
+    TEST_FILE_MULTI_PAGE_TIFF_FILENAME, TEST_FILE_PDF_FILENAME
+)
 
 from ..events import event_ocr_document_version_finished
 from ..exceptions import OCRError
 
+from .literals import TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
 from .mixins import DocumentVersionOCRTaskTestMixin
 
 
@@ -73,3 +84,63 @@ class OCRTaskTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+
+class OCRTaskPageImageTestCase(
+    DocumentVersionOCRTaskTestMixin, GenericDocumentTestCase
+):
+    _test_converter_method_name = 'get_page_many'
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    @mock.patch(
+        'mayan.apps.ocr.backends.tesseract.Tesseract._execute',
+        return_value=TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+    )
+    @mock.patch('mayan.apps.ocr.backends.tesseract.Tesseract.initialize')
+    def test_task_document_version_ocr_process_page_image_window(
+        self, mocked_initialize, mocked_execute
+    ):
+        for page in self._test_document_file.file_pages.all():
+            for cache_partition_file in page.cache_partition.files.all():
+                cache_partition_file.delete()
+
+        for page in self._test_document_version.pages.all():
+            for cache_partition_file in page.cache_partition.files.all():
+                cache_partition_file.delete()
+
+        converter_class = ConverterBase.get_converter_class()
+
+        self._clear_events()
+
+        with mock.patch.object(
+            attribute=self._test_converter_method_name, autospec=True,
+            side_effect=getattr(
+                converter_class, self._test_converter_method_name
+            ), target=converter_class
+        ) as mocked_method:
+            self._execute_task_document_version_ocr_process()
+
+        # The pages are rendered with a single pass of the converter per
+        # window of pages.
+        self.assertEqual(
+            mocked_method.call_count, math.ceil(
+                self._test_document_version.pages.count() / DOCUMENT_FILE_PAGE_IMAGE_GENERATE_WINDOW_SIZE
+            )
+        )
+
+        for page in self._test_document_version.pages.all():
+            self.assertEqual(
+                page.ocr_content.content,
+                TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+
+
+@unittest.skipIf(
+    condition=not command_pdftoppm, reason='pdftoppm is not installed.'
+)
+class OCRTaskPDFPageImageTestCase(OCRTaskPageImageTestCase):
+    _test_converter_method_name = 'convert_many'
+    _test_document_filename = TEST_FILE_PDF_FILENAME
@@ -1,5 +1,6 @@
 from django.apps import apps
-from django.db.models.signals import post_migrate
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_migrate
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -22,7 +23,10 @@ from mayan.apps.user_management.links import link_group_list
 from .classes import Permission
 from .dashboard_widgets import DashboardWidgetRoleTotal
 from .events import event_role_created, event_role_edited
-from .handlers import handler_permission_initialize, handler_purge_permissions
+from .handlers import (
+    handler_permission_initialize, handler_permission_user_cache_invalidate,
+    handler_purge_permissions
+)
 from .links import (
     link_group_role_list, link_role_create, link_role_delete_single,
     link_role_delete_multiple, link_role_edit, link_role_group_list,
@@ -48,6 +52,7 @@ class PermissionsApp(MayanAppConfig):
         Role = self.get_model(model_name='Role')
         StoredPermission = self.get_model(model_name='StoredPermission')
         Group = apps.get_model(app_label='auth', model_name='Group')
+        User = get_user_model()
 
         DynamicSerializerField.add_serializer(
             klass=Role,
@@ -176,3 +181,36 @@ class PermissionsApp(MayanAppConfig):
             dispatch_uid='permissions_handler_purge_permissions',
             receiver=handler_purge_permissions
         )
+
+        # User permission cache invalidation
+
+        m2m_changed.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_role_groups',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=Role.groups.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_role_permissions',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=Role.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_user_groups',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=User.groups.through
+        )
+        post_delete.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_group',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=Group
+        )
+        post_delete.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_role',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=Role
+        )
+        post_delete.connect(
+            dispatch_uid='permissions_handler_permission_user_cache_invalidate_stored_permission',
+            receiver=handler_permission_user_cache_invalidate,
+            sender=StoredPermission
+        )
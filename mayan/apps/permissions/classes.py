@@ -1,8 +1,12 @@
 import itertools
 import logging
+import threading
+import uuid
 
 from django.apps import apps
+from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.db.utils import OperationalError, ProgrammingError
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -10,6 +14,14 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 from mayan.apps.common.collections import ClassCollection
 
+from .literals import (
+    USER_PERMISSION_CACHE_BACKENDS_PROCESS_LOCAL,
+    USER_PERMISSION_CACHE_KEY_TEMPLATE, USER_PERMISSION_CACHE_KEY_VERSION
+)
+from .settings import (
+    setting_user_permission_cache_name, setting_user_permission_cache_timeout
+)
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -151,3 +163,188 @@ class Permission(AppsModuleLoaderMixin):
 
 class PermissionCollection(ClassCollection):
     klass = Permission
+
+
+class UserPermissionCache:
+    """
+    Set of the stored permissions granted to a user by their groups and
+    roles. The set is loaded once per user instance, which the
+    authentication middleware creates for each request, turning the
+    permission checks into set lookups. When enabled, the sets are also
+    shared across requests using a cache backend shared between
+    processes. Changes to roles, groups or their permissions replace the
+    version of the sets with a new unique value after the changes are
+    committed.
+    """
+    _cache_name_process_local_set = set()
+    _local = threading.local()
+    _statistics_lock = threading.Lock()
+    _version = 0
+    hit_count = 0
+    miss_count = 0
+
+    @classmethod
+    def _do_statistics_update(cls, hit):
+        with cls._statistics_lock:
+            if hit:
+                cls.hit_count += 1
+            else:
+                cls.miss_count += 1
+
+    @classmethod
+    def _do_version_update(cls):
+        cls._local.is_commit_pending = False
+        cls._version += 1
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            shared_cache.set(
+                key=USER_PERMISSION_CACHE_KEY_VERSION, timeout=None,
+                value=uuid.uuid4().hex
+            )
+
+    @classmethod
+    def get_for_user(cls, user):
+        try:
+            return user._user_permission_cache
+        except AttributeError:
+            instance = cls(user=user)
+            user._user_permission_cache = instance
+            return instance
+
+    @classmethod
+    def get_shared_cache(cls):
+        """
+        Return the cache backend used to share the sets across requests
+        or None if sharing is disabled or the cache backend is process
+        local, which would keep serving the sets after they are
+        invalidated by another process.
+        """
+        name = setting_user_permission_cache_name.value
+
+        if name and setting_user_permission_cache_timeout.value:
+            shared_cache = caches[name]
+            backend_path = '{}.{}'.format(
+                shared_cache.__class__.__module__,
+                shared_cache.__class__.__name__
+            )
+
+            if backend_path in USER_PERMISSION_CACHE_BACKENDS_PROCESS_LOCAL:
+                if name not in cls._cache_name_process_local_set:
+                    cls._cache_name_process_local_set.add(name)
+                    logger.warning(
+                        'Cache backend "%s" is process local and cannot be '
+                        'used to share the user permissions across '
+                        'requests.', name
+                    )
+            else:
+                return shared_cache
+
+    @classmethod
+    def get_shared_version(cls, shared_cache):
+        version = shared_cache.get(key=USER_PERMISSION_CACHE_KEY_VERSION)
+
+        if version is None:
+            # The version was evicted. Start a new one instead of reusing
+            # a previous value.
+            shared_cache.add(
+                key=USER_PERMISSION_CACHE_KEY_VERSION, timeout=None,
+                value=uuid.uuid4().hex
+            )
+            version = shared_cache.get(key=USER_PERMISSION_CACHE_KEY_VERSION)
+
+        return version
+
+    @classmethod
+    def get_statistics(cls):
+        return {'hit_count': cls.hit_count, 'miss_count': cls.miss_count}
+
+    @classmethod
+    def invalidate(cls):
+        # Invalidate the sets of this process right away for the checks
+        # made in the same transaction and again after the commit, so that
+        # sets loaded by other processes before the commit are not kept.
+        # Until the commit, this thread loads the sets without the shared
+        # cache to avoid sharing uncommitted changes.
+        cls._local.is_commit_pending = True
+        cls._version += 1
+        transaction.on_commit(func=cls._do_version_update)
+
+    @classmethod
+    def is_commit_pending(cls):
+        is_commit_pending = getattr(cls._local, 'is_commit_pending', False)
+
+        if is_commit_pending and not transaction.get_connection().in_atomic_block:
+            # The transaction of the changes was rolled back.
+            cls._local.is_commit_pending = False
+            return False
+        else:
+            return is_commit_pending
+
+    @classmethod
+    def reset_statistics(cls):
+        with cls._statistics_lock:
+            cls.hit_count = 0
+            cls.miss_count = 0
+
+    def __init__(self, user):
+        self.stored_permission_id_set = None
+        self.user = user
+        self.version = None
+
+    def _get_stored_permission_id_set(self):
+        StoredPermission = apps.get_model(
+            app_label='permissions', model_name='StoredPermission'
+        )
+
+        return set(
+            StoredPermission.objects.filter(
+                roles__groups__user=self.user
+            ).values_list('pk', flat=True)
+        )
+
+    def check(self, stored_permission):
+        """
+        Return True if the user has been granted the stored permission by
+        one of their roles.
+        """
+        if self.version == UserPermissionCache._version:
+            UserPermissionCache._do_statistics_update(hit=True)
+        else:
+            self.do_load()
+
+        return stored_permission.pk in self.stored_permission_id_set
+
+    def do_load(self):
+        self.version = UserPermissionCache._version
+
+        if UserPermissionCache.is_commit_pending():
+            shared_cache = None
+        else:
+            shared_cache = UserPermissionCache.get_shared_cache()
+
+        if shared_cache:
+            key = USER_PERMISSION_CACHE_KEY_TEMPLATE.format(
+                user_id=self.user.pk,
+                version=UserPermissionCache.get_shared_version(
+                    shared_cache=shared_cache
+                )
+            )
+
+            stored_permission_id_set = shared_cache.get(key=key)
+
+            if stored_permission_id_set is None:
+                UserPermissionCache._do_statistics_update(hit=False)
+                stored_permission_id_set = self._get_stored_permission_id_set()
+                shared_cache.set(
+                    key=key,
+                    timeout=setting_user_permission_cache_timeout.value,
+                    value=stored_permission_id_set
+                )
+            else:
+                UserPermissionCache._do_statistics_update(hit=True)
+        else:
+            UserPermissionCache._do_statistics_update(hit=False)
+            stored_permission_id_set = self._get_stored_permission_id_set()
+
+        self.stored_permission_id_set = stored_permission_id_set
@@ -1,12 +1,19 @@
 from django.apps import apps
 
-from .classes import Permission
+from .classes import Permission, UserPermissionCache
 
 
 def handler_permission_initialize(**kwargs):
     Permission.load_modules()
 
 
+def handler_permission_user_cache_invalidate(sender, **kwargs):
+    if kwargs.get('action', 'post_delete') in (
+        'post_add', 'post_clear', 'post_delete', 'post_remove'
+    ):
+        UserPermissionCache.invalidate()
+
+
 def handler_purge_permissions(**kwargs):
     StoredPermission = apps.get_model(
         app_label='permissions', model_name='StoredPermission'
@@ -0,0 +1,9 @@
+DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_NAME = None
+DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT = 0
+
+USER_PERMISSION_CACHE_BACKENDS_PROCESS_LOCAL = (
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.locmem.LocMemCache'
+)
+USER_PERMISSION_CACHE_KEY_TEMPLATE = 'permissions_user_{user_id}_{version}'
+USER_PERMISSION_CACHE_KEY_VERSION = 'permissions_user_permission_cache_version'
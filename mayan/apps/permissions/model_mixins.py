@@ -6,7 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.user_management.permissions import permission_group_view
 
-from .classes import Permission, PermissionNamespace
+from .classes import Permission, PermissionNamespace, UserPermissionCache
 from .events import event_role_edited
 
 logger = logging.getLogger(name=__name__)
@@ -107,12 +107,11 @@ class StoredPermissionBusinessLogicMixin:
     def user_has_this(self, user):
         """
         Helper method to check if a user has been granted this permission.
-        The check is done sequentially over all of the user's groups and
-        roles. The check is interrupted at the first positive result.
+        The check is done against the set of permissions granted to the
+        user by all of their groups and roles, loaded once per user
+        instance.
         The check always returns True for super users or staff users.
         """
-        Role = apps.get_model(app_label='permissions', model_name='Role')
-
         if user.is_superuser or user.is_staff:
             logger.debug(
                 'Permission "%s" granted to user "%s" as super user or '
@@ -123,7 +122,7 @@ class StoredPermissionBusinessLogicMixin:
         if not user.is_authenticated:
             return False
 
-        if Role.objects.filter(groups__user=user, permissions=self).exists():
+        if UserPermissionCache.get_for_user(user=user).check(stored_permission=self):
             return True
         else:
             logger.debug(
@@ -0,0 +1,32 @@
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.smart_settings.settings import setting_cluster
+
+from .literals import (
+    DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_NAME,
+    DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT
+)
+
+setting_namespace = setting_cluster.do_namespace_add(
+    label=_(message='Permissions'), name='permissions'
+)
+
+setting_user_permission_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_NAME,
+    global_name='PERMISSIONS_USER_PERMISSION_CACHE_NAME', help_text=_(
+        message='Name of a Django cache backend from the CACHES setting '
+        'shared between processes, like a Redis or Memcached cache '
+        'backend, used to cache the permissions granted to each user '
+        'across requests. Process local cache backends are not used. '
+        'Leave empty to load the permissions once per request.'
+    )
+)
+setting_user_permission_cache_timeout = setting_namespace.do_setting_add(
+    default=DEFAULT_PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT,
+    global_name='PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT', help_text=_(
+        message='Time in seconds to cache the permissions granted to each '
+        'user by their roles across requests. The cache is invalidated '
+        'when roles, groups or their permissions change. Use 0 to load '
+        'the permissions once per request.'
+    )
+)
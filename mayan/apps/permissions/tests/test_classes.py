@@ -0,0 +1,149 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from mayan.apps.smart_settings.tests.mixins import SettingOverrideTestMixin
+from mayan.apps.testing.tests.base import BaseTestCase
+from mayan.apps.user_management.tests.mixins.group_mixins import (
+    GroupTestMixin
+)
+
+from ..classes import Permission, UserPermissionCache
+from ..literals import USER_PERMISSION_CACHE_KEY_VERSION
+
+from .mixins import RoleTestMixin
+
+
+class UserPermissionCacheTestCase(
+    GroupTestMixin, RoleTestMixin, SettingOverrideTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self._create_test_user()
+        self._create_test_group()
+        self._create_test_role()
+        self._create_test_permission()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_group.user_set.add(self._test_user)
+            self._test_role.groups.add(self._test_group)
+
+        UserPermissionCache.reset_statistics()
+
+    def _check_test_permission(self, user=None):
+        return self._test_permission.stored_permission.user_has_this(
+            user=user or self._test_user
+        )
+
+    def test_hit_and_miss_counters(self):
+        self._check_test_permission()
+        self._check_test_permission()
+
+        self.assertEqual(
+            UserPermissionCache.get_statistics(), {
+                'hit_count': 1, 'miss_count': 1
+            }
+        )
+
+    def test_permission_check_queries(self):
+        self._check_test_permission()
+
+        with self.assertNumQueries(num=0):
+            self._check_test_permission()
+
+    def test_role_grant_invalidation(self):
+        self.assertFalse(self._check_test_permission())
+
+        self._test_role.grant(permission=self._test_permission)
+
+        self.assertTrue(self._check_test_permission())
+
+    def test_user_group_remove_invalidation(self):
+        self._test_role.grant(permission=self._test_permission)
+        self.assertTrue(self._check_test_permission())
+
+        self._test_group.user_set.remove(self._test_user)
+
+        self.assertFalse(self._check_test_permission())
+
+
+@mock.patch(
+    target='mayan.apps.permissions.classes.USER_PERMISSION_CACHE_BACKENDS_PROCESS_LOCAL',
+    new=()
+)
+@override_settings(
+    PERMISSIONS_USER_PERMISSION_CACHE_NAME='default',
+    PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT=60
+)
+class UserPermissionSharedCacheTestCase(UserPermissionCacheTestCase):
+    def test_shared_cache(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_role.grant(permission=self._test_permission)
+
+        self._check_test_permission()
+
+        test_user = self._test_user._meta.model.objects.get(
+            pk=self._test_user.pk
+        )
+
+        with self.assertNumQueries(num=0):
+            Permission.check_user_permission(
+                permission=self._test_permission, user=test_user
+            )
+
+        self.assertEqual(
+            UserPermissionCache.get_statistics(), {
+                'hit_count': 1, 'miss_count': 1
+            }
+        )
+
+    def test_shared_cache_invalidation(self):
+        self._check_test_permission()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._test_role.grant(permission=self._test_permission)
+
+        test_user = self._test_user._meta.model.objects.get(
+            pk=self._test_user.pk
+        )
+
+        self.assertTrue(
+            self._check_test_permission(user=test_user)
+        )
+
+    def test_shared_cache_version_eviction(self):
+        self._check_test_permission()
+
+        version = cache.get(key=USER_PERMISSION_CACHE_KEY_VERSION)
+        cache.delete(key=USER_PERMISSION_CACHE_KEY_VERSION)
+
+        test_user = self._test_user._meta.model.objects.get(
+            pk=self._test_user.pk
+        )
+        self._check_test_permission(user=test_user)
+
+        self.assertNotEqual(
+            cache.get(key=USER_PERMISSION_CACHE_KEY_VERSION), version
+        )
+
+
+@override_settings(
+    PERMISSIONS_USER_PERMISSION_CACHE_NAME='default',
+    PERMISSIONS_USER_PERMISSION_CACHE_TIMEOUT=60
+)
+class UserPermissionProcessLocalCacheTestCase(UserPermissionCacheTestCase):
+    def test_process_local_cache(self):
+        self._check_test_permission()
+
+        test_user = self._test_user._meta.model.objects.get(
+            pk=self._test_user.pk
+        )
+        self._check_test_permission(user=test_user)
+
+        self.assertEqual(
+            UserPermissionCache.get_statistics(), {
+                'hit_count': 0, 'miss_count': 2
+            }
+        )
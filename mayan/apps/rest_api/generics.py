@@ -56,6 +56,7 @@ class ListAPIView(
     filter_backends = (
         MayanObjectPermissionsFilter, MayanSortingFilter, RESTAPISearchFilter
     )
+    pagination_cursor_ordering = None
     # `permission_classes` is required for the `EventListAPIView`
     # when `Actions` objects support ACLs then this can be removed
     # as was intended.
@@ -76,6 +77,7 @@ class ListCreateAPIView(
     filter_backends = (
         MayanObjectPermissionsFilter, MayanSortingFilter, RESTAPISearchFilter
     )
+    pagination_cursor_ordering = None
     permission_classes = (MayanPermission,)
 
 
@@ -4,6 +4,10 @@ DEFAULT_PAGE_SIZE_QUERY_PARAMETER = 'page_size'
 DEFAULT_REST_API_DISABLE_LINKS = False
 DEFAULT_REST_API_MAXIMUM_PAGE_SIZE = 100
 DEFAULT_REST_API_PAGE_SIZE = 10
+DEFAULT_REST_API_PAGINATION_APPROXIMATE_COUNT_LIMIT = 1000
+
+PAGINATION_MODE_CURSOR = 'cursor'
 
 QUERY_FIELD_EXCLUDE_PARAMETER = '_fields_exclude'
 QUERY_FIELD_ONLY_PARAMETER = '_fields_only'
+QUERY_PAGINATION_MODE_PARAMETER = '_pagination'
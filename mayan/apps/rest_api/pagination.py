@@ -1,10 +1,103 @@
 from rest_framework import pagination
+from rest_framework.response import Response
 
-from .literals import DEFAULT_PAGE_SIZE_QUERY_PARAMETER
-from .settings import setting_maximum_page_size, setting_page_size
+from .filters import MayanSortingFilter
+from .literals import (
+    DEFAULT_PAGE_SIZE_QUERY_PARAMETER, PAGINATION_MODE_CURSOR,
+    QUERY_PAGINATION_MODE_PARAMETER
+)
+from .settings import (
+    setting_maximum_page_size, setting_page_size,
+    setting_pagination_approximate_count_limit
+)
+
+
+class MayanCursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination over the `pagination_cursor_ordering` field of the
+    view. Pages are retrieved with an indexed range lookup instead of an
+    offset and the total count is replaced by a count bounded by the
+    approximate count limit setting.
+    """
+    max_page_size = setting_maximum_page_size.value
+    page_size = setting_page_size.value
+    page_size_query_param = DEFAULT_PAGE_SIZE_QUERY_PARAMETER
+
+    def get_count(self, queryset):
+        count_limit = setting_pagination_approximate_count_limit.value
+
+        if count_limit:
+            count = queryset.order_by()[:count_limit + 1].count()
+
+            if count > count_limit:
+                return count_limit, True
+            else:
+                return count, False
+        else:
+            return None, False
+
+    def get_ordering(self, request, queryset, view):
+        return (view.pagination_cursor_ordering,)
+
+    def get_paginated_response(self, data):
+        return Response(
+            data={
+                'count': self.count,
+                'count_is_approximate': self.count_is_approximate,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data
+            }
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count, self.count_is_approximate = self.get_count(
+            queryset=queryset
+        )
+        return super().paginate_queryset(
+            queryset=queryset, request=request, view=view
+        )
 
 
 class MayanPageNumberPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination. Views defining `pagination_cursor_ordering`
+    switch to cursor pagination when requested using the pagination mode
+    query parameter. Sorted requests keep the page number pagination,
+    since the cursor requires its own ordering.
+    """
     max_page_size = setting_maximum_page_size.value
     page_size = setting_page_size.value
     page_size_query_param = DEFAULT_PAGE_SIZE_QUERY_PARAMETER
+    paginator_cursor = None
+
+    def get_paginated_response(self, data):
+        if self.paginator_cursor:
+            return self.paginator_cursor.get_paginated_response(data=data)
+        else:
+            return super().get_paginated_response(data=data)
+
+    def get_paginator_cursor(self, request, view):
+        pagination_mode = request.query_params.get(
+            QUERY_PAGINATION_MODE_PARAMETER
+        )
+
+        if request.query_params.get(MayanSortingFilter.ordering_param):
+            return
+
+        if pagination_mode == PAGINATION_MODE_CURSOR and getattr(view, 'pagination_cursor_ordering', None):
+            return MayanCursorPagination()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator_cursor = self.get_paginator_cursor(
+            request=request, view=view
+        )
+
+        if self.paginator_cursor:
+            return self.paginator_cursor.paginate_queryset(
+                queryset=queryset, request=request, view=view
+            )
+        else:
+            return super().paginate_queryset(
+                queryset=queryset, request=request, view=view
+            )
@@ -4,7 +4,8 @@ from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
     DEFAULT_REST_API_DISABLE_LINKS, DEFAULT_REST_API_MAXIMUM_PAGE_SIZE,
-    DEFAULT_REST_API_PAGE_SIZE
+    DEFAULT_REST_API_PAGE_SIZE,
+    DEFAULT_REST_API_PAGINATION_APPROXIMATE_COUNT_LIMIT
 )
 
 setting_namespace = setting_cluster.do_namespace_add(
@@ -29,3 +30,11 @@ setting_page_size = setting_namespace.do_setting_add(
         message='The default page size if none is specified.'
     )
 )
+setting_pagination_approximate_count_limit = setting_namespace.do_setting_add(
+    default=DEFAULT_REST_API_PAGINATION_APPROXIMATE_COUNT_LIMIT,
+    global_name='REST_API_PAGINATION_APPROXIMATE_COUNT_LIMIT', help_text=_(
+        message='Maximum number of objects counted when using cursor '
+        'pagination. Larger lists report this number as an approximate '
+        'count. Use 0 to disable the count.'
+    )
+)
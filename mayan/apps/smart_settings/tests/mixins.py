@@ -49,6 +49,21 @@ class SettingClusterTestMixin(EnvironmentTestCaseMixin):
         super().tearDown()
 
 
+class SettingOverrideTestMixin:
+    """
+    Reload the settings before the test setup and after the test so that
+    the values of `override_settings` apply to the whole test case,
+    including the objects created by the setup.
+    """
+    def setUp(self):
+        setting_cluster.do_cache_invalidate()
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        setting_cluster.do_cache_invalidate()
+
+
 class SettingClusterViewTestMixin(SettingClusterTestMixin):
     def _request_cluster_configuration_save_view(self):
         return self.post(
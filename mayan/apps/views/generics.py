@@ -27,9 +27,10 @@ from .icons import (
 )
 from .settings import setting_paginate_by
 from .view_mixins import (
-    ExtraDataDeleteViewMixin, DynamicFieldSetFormViewMixin,
-    ExternalObjectViewMixin, ExtraContextViewMixin, FormExtraKwargsViewMixin,
-    ListModeViewMixin, ModelFormFieldsetsViewMixin, MultipleObjectViewMixin,
+    CursorPaginationViewMixin, ExtraDataDeleteViewMixin,
+    DynamicFieldSetFormViewMixin, ExternalObjectViewMixin,
+    ExtraContextViewMixin, FormExtraKwargsViewMixin, ListModeViewMixin,
+    ModelFormFieldsetsViewMixin, MultipleObjectViewMixin,
     ObjectActionViewMixin, ObjectNameViewMixin, RedirectionViewMixin,
     RestrictedQuerysetViewMixin, SortingViewMixin, ViewIconMixin,
     ViewMixinConfirmRemember, ViewMixinDeleteObject,
@@ -859,9 +860,10 @@ class SingleObjectDynamicFormEditView(
 
 
 class SingleObjectListView(
-    SortingViewMixin, ListModeViewMixin, ViewPermissionCheckViewMixin,
-    SearchFilterEnabledListViewMixin, RestrictedQuerysetViewMixin,
-    ExtraContextViewMixin, RedirectionViewMixin, ViewIconMixin, ListView
+    CursorPaginationViewMixin, SortingViewMixin, ListModeViewMixin,
+    ViewPermissionCheckViewMixin, SearchFilterEnabledListViewMixin,
+    RestrictedQuerysetViewMixin, ExtraContextViewMixin, RedirectionViewMixin,
+    ViewIconMixin, ListView
 ):
     """
     A view that will generate a list of instances from a queryset.
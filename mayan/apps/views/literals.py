@@ -1,6 +1,7 @@
 from django.utils.translation import gettext_lazy as _
 
 DEFAULT_VIEWS_PAGINATE_BY = 30
+DEFAULT_VIEWS_PAGINATION_CURSOR_ENABLE = False
 DEFAULT_VIEWS_PAGING_ARGUMENT = 'page'
 
 LIST_MODE_CHOICE_LIST = 'list'
@@ -19,6 +20,9 @@ TEST_SERVER_SCHEME = 'http'
 TEST_VIEW_NAME = 'test_view_name'
 TEST_VIEW_URL = 'test-view-url'
 
+TEXT_CURSOR_PARAMETER = '_cursor'
+TEXT_CURSOR_VARIABLE_NAME = 'pagination_cursor_next'
+
 TEXT_LIST_AS_ITEMS_PARAMETER = '_list_mode'
 TEXT_LIST_AS_ITEMS_VARIABLE_NAME = 'list_as_items'
 
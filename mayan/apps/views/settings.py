@@ -3,7 +3,8 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
-    DEFAULT_VIEWS_PAGINATE_BY, DEFAULT_VIEWS_PAGING_ARGUMENT
+    DEFAULT_VIEWS_PAGINATE_BY, DEFAULT_VIEWS_PAGINATION_CURSOR_ENABLE,
+    DEFAULT_VIEWS_PAGING_ARGUMENT
 )
 
 setting_namespace = setting_cluster.do_namespace_add(
@@ -16,6 +17,14 @@ setting_paginate_by = setting_namespace.do_setting_add(
         message='The number objects that will be displayed per page.'
     )
 )
+setting_pagination_cursor_enable = setting_namespace.do_setting_add(
+    default=DEFAULT_VIEWS_PAGINATION_CURSOR_ENABLE,
+    global_name='VIEWS_PAGINATION_CURSOR_ENABLE', help_text=_(
+        message='Display the large lists that support it in batches using a '
+        '"load more" button instead of numbered pages. This avoids '
+        'counting the objects of the list and scanning the previous pages.'
+    )
+)
 setting_paging_argument = setting_namespace.do_setting_add(
     default=DEFAULT_VIEWS_PAGING_ARGUMENT,
     global_name='VIEWS_PAGING_ARGUMENT', help_text=_(
@@ -8,7 +8,7 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.appearance.settings import setting_max_title_length
 
 from ..icons import icon_list_mode_items, icon_list_mode_list
-from ..literals import TEXT_LIST_AS_ITEMS_PARAMETER
+from ..literals import TEXT_CURSOR_PARAMETER, TEXT_LIST_AS_ITEMS_PARAMETER
 from ..settings import setting_paging_argument
 
 logger = logging.getLogger(name=__name__)
@@ -53,6 +53,14 @@ def views_calculate_title(context):
     return {'title': title, 'title_full': title_full}
 
 
+@register.simple_tag(takes_context=True)
+def views_get_cursor_query_string(context, cursor):
+    kwargs = {
+        TEXT_CURSOR_PARAMETER: cursor
+    }
+    return views_update_query_string(context=context, **kwargs)
+
+
 @register.simple_tag(takes_context=True)
 def views_get_list_mode_icon(context):
     if context.get('list_as_items', False):
@@ -1,6 +1,6 @@
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db.models.query import QuerySet
 from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
@@ -19,11 +19,12 @@ from mayan.apps.permissions.classes import Permission
 from .exceptions import ActionError
 from .literals import (
     PK_LIST_KEY, PK_LIST_SEPARATOR, LIST_MODE_CHOICE_ITEM,
-    LIST_MODE_CHOICE_LIST, TEXT_LIST_AS_ITEMS_PARAMETER,
-    TEXT_LIST_AS_ITEMS_VARIABLE_NAME, TEXT_SORT_FIELD_PARAMETER,
-    TEXT_SORT_FIELD_VARIABLE_NAME
+    LIST_MODE_CHOICE_LIST, TEXT_CURSOR_PARAMETER, TEXT_CURSOR_VARIABLE_NAME,
+    TEXT_LIST_AS_ITEMS_PARAMETER, TEXT_LIST_AS_ITEMS_VARIABLE_NAME,
+    TEXT_SORT_FIELD_PARAMETER, TEXT_SORT_FIELD_VARIABLE_NAME
 )
 from .models import UserConfirmView, UserViewMode
+from .settings import setting_pagination_cursor_enable
 from .utils import is_url_query_positive
 
 
@@ -49,6 +50,80 @@ class ContentTypeViewMixin:
         )
 
 
+class CursorPaginationViewMixin:
+    """
+    Paginate the list by ranges of the `pagination_cursor_ordering` field
+    when enabled. Each page is retrieved from the position of the last
+    object of the previous page, without counting the objects or scanning
+    the previous pages. The next position is provided to the template to
+    load the next page.
+    """
+    pagination_cursor = None
+    pagination_cursor_next = None
+    pagination_cursor_ordering = None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        if self.get_pagination_cursor_enabled():
+            context.update(
+                {
+                    TEXT_CURSOR_VARIABLE_NAME: self.pagination_cursor_next,
+                    'pagination_cursor': self.pagination_cursor,
+                    'pagination_cursor_enabled': True
+                }
+            )
+
+        return context
+
+    def get_pagination_cursor_enabled(self):
+        if isinstance(self, SortingViewMixin) and self.get_sort_fields():
+            return False
+
+        return bool(
+            self.pagination_cursor_ordering and setting_pagination_cursor_enable.value
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.get_pagination_cursor_enabled():
+            return super().paginate_queryset(
+                queryset=queryset, page_size=page_size
+            )
+
+        field_name = self.pagination_cursor_ordering.lstrip('-')
+
+        if self.pagination_cursor_ordering.startswith('-'):
+            lookup = '{}__lt'.format(field_name)
+        else:
+            lookup = '{}__gt'.format(field_name)
+
+        queryset = queryset.order_by(self.pagination_cursor_ordering)
+
+        self.pagination_cursor = self.request.GET.get(TEXT_CURSOR_PARAMETER)
+
+        try:
+            if self.pagination_cursor:
+                queryset = queryset.filter(
+                    **{lookup: self.pagination_cursor}
+                )
+
+            object_list = list(queryset[:page_size + 1])
+        except (ValidationError, ValueError):
+            raise Http404(
+                _(message='Invalid cursor "%s".') % self.pagination_cursor
+            )
+
+        is_paginated = len(object_list) > page_size
+
+        if is_paginated:
+            object_list = object_list[:page_size]
+            self.pagination_cursor_next = getattr(
+                object_list[-1], field_name
+            )
+
+        return (None, None, object_list, is_paginated)
+
+
 class ExtraDataDeleteViewMixin:
     """
     Mixin to populate the extra data needed for delete views.
@@ -19,8 +19,12 @@ CELERY_TASK_EAGER_PROPAGATES = True
 
 COMMON_HOME_VIEW_DASHBOARD_NAME = None
 
+DOCUMENT_INDEXING_EVENT_TRIGGER_QUEUE_ENABLE = False
+
 DOCUMENT_PARSING_AUTO_PARSING = False
 
+EVENTS_COMMIT_BUFFER_ENABLE = False
+
 FILE_METADATA_AUTO_PROCESS = False
 
 INSTALLED_APPS = [
@@ -61,6 +65,7 @@ PASSWORD_HASHERS = (
 )
 
 SEARCH_BACKEND = 'mayan.apps.dynamic_search.tests.backends.TestSearchBackendProxy'
+SEARCH_INDEXING_QUEUE_ENABLE = False
 
 STORAGES['staticfiles'] = {
     'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'